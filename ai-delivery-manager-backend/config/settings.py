@@ -59,6 +59,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.security.SecurityMiddleware',
+    'core.instrumentation.QueryInstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -90,10 +91,33 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+# SQLite tuning, applied to every new connection through init_command. WAL
+# lets readers run alongside a writer; IMMEDIATE transactions take the write
+# lock up front, so concurrent writers queue on busy_timeout instead of
+# failing with "database is locked" when a read lock is upgraded.
+SQLITE_TUNING = os.environ.get('SQLITE_TUNING', 'True') == 'True'
+SQLITE_PRAGMAS = {
+    'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+    'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '5000')),
+    'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', '-20000')),  # negative = KiB
+    'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', str(128 * 1024 * 1024))),
+    'temp_store': os.environ.get('SQLITE_TEMP_STORE', 'MEMORY'),
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+        # keep connections open between requests (seconds; 0 = per request).
+        # config.asgi defaults this to 0: Django advises against persistent
+        # connections under ASGI, where sync_to_async threads would each keep one
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ';'.join(f'PRAGMA {k}={v}' for k, v in SQLITE_PRAGMAS.items()),
+            'transaction_mode': 'IMMEDIATE',
+        } if SQLITE_TUNING else {},
     }
 }
 
@@ -137,3 +161,82 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 # CORS — allow all origins (this is a demo app; lock this down if going to production)
 CORS_ALLOW_ALL_ORIGINS = True
+
+# Report result cache (reports/cache.py). Entries are keyed on the workboard
+# data generation, so writes invalidate them immediately; TTL bounds memory.
+REPORT_CACHE = {
+    'ENABLED': os.environ.get('REPORT_CACHE_ENABLED', 'True') == 'True',
+    'MAX_ENTRIES': int(os.environ.get('REPORT_CACHE_MAX_ENTRIES', '128')),
+    'TTL': int(os.environ.get('REPORT_CACHE_TTL', '300')),
+}
+
+# Precomputed reports (reports/precompute.py): served while built from the
+# current data generation and younger than MAX_STALENESS seconds (the bound
+# on file-export staleness); refreshed every INTERVAL seconds by the
+# precompute_reports command (--loop) or, with IN_PROCESS, a worker thread
+REPORT_PRECOMPUTE = {
+    'SERVE': os.environ.get('REPORT_PRECOMPUTE_SERVE', 'True') == 'True',
+    'MAX_STALENESS': int(os.environ.get('REPORT_PRECOMPUTE_MAX_STALENESS', '120')),
+    'INTERVAL': int(os.environ.get('REPORT_PRECOMPUTE_INTERVAL', '60')),
+    'IN_PROCESS': os.environ.get('REPORT_PRECOMPUTE_IN_PROCESS', 'False') == 'True',
+}
+
+# Keyset pagination for workboard list endpoints (?limit=/&cursor=)
+WORKBOARD_PAGE_SIZE = int(os.environ.get('WORKBOARD_PAGE_SIZE', '100'))
+WORKBOARD_MAX_PAGE_SIZE = int(os.environ.get('WORKBOARD_MAX_PAGE_SIZE', '1000'))
+
+# Serve the tickets/prs/members/aggregate reads from values() projections
+# and orjson (same bytes as the serializers); ?fast=1 / ?fast=0 per request
+WORKBOARD_FAST_LISTS = os.environ.get('WORKBOARD_FAST_LISTS', 'False') == 'True'
+
+# Change log behind the /api/workboard/events/ server-sent events stream
+WORKBOARD_EVENTS = {
+    'ENABLED': os.environ.get('WORKBOARD_EVENTS_ENABLED', 'True') == 'True',
+    'MAX_EVENTS': int(os.environ.get('WORKBOARD_EVENTS_MAX', '10000')),
+    'POLL_INTERVAL': float(os.environ.get('WORKBOARD_EVENTS_POLL_INTERVAL', '1.0')),
+    'HEARTBEAT': int(os.environ.get('WORKBOARD_EVENTS_HEARTBEAT', '15')),
+    # events buffered per open stream; a client further behind gets a resync
+    'QUEUE_SIZE': int(os.environ.get('WORKBOARD_EVENTS_QUEUE_SIZE', '1000')),
+}
+
+# /api/workboard/search/ ranks at most this many of the newest matches of a
+# query and lists older ones after them (0 = rank every match; slow for very
+# common words)
+WORKBOARD_SEARCH_RANK_WINDOW = int(os.environ.get('WORKBOARD_SEARCH_RANK_WINDOW', '5000'))
+
+# Threads used by /api/reports/all/ to build its reports. The builders are
+# CPU-bound Python, so more than 1 only pays off without the GIL.
+REPORTS_ALL_WORKERS = int(os.environ.get('REPORTS_ALL_WORKERS', '1'))
+
+# Ticket keys (workboard/keys.py): <PREFIX>-<n> from a per-project sequence.
+# Each process reserves BLOCK_SIZE numbers at a time; 1 keeps keys in
+# creation order across workers at the cost of a sequence update per ticket
+TICKET_KEYS = {
+    'PREFIX': os.environ.get('TICKET_KEY_PREFIX', 'PROJ'),
+    'BLOCK_SIZE': max(1, int(os.environ.get('TICKET_KEY_BLOCK_SIZE', '20'))),
+}
+
+# Upper bound on operations per /api/workboard/tickets/bulk/ call
+TICKETS_BULK_MAX_ITEMS = int(os.environ.get('TICKETS_BULK_MAX_ITEMS', '1000'))
+
+# Upper bound on items per /api/reports/rewrite/batch/ call
+REWRITE_BATCH_MAX_ITEMS = int(os.environ.get('REWRITE_BATCH_MAX_ITEMS', '1000'))
+
+# Jira/Git/Slack exports used by the report fallbacks and data_sources loaders
+DATA_SOURCES_DIR = os.environ.get('DATA_SOURCES_DIR', str(BASE_DIR / 'data_sources' / 'mock_data'))
+# Exports up to this size (bytes on disk) are parsed once and indexed in
+# memory; larger ones are streamed through scan() folds
+DATA_SOURCES_INDEX_MAX_BYTES = int(os.environ.get('DATA_SOURCES_INDEX_MAX_BYTES', str(64 << 20)))
+
+# Per-request SQL instrumentation (core/instrumentation.py): Server-Timing
+# headers on a sample of API requests plus /api/debug/slow-requests/.
+# DEBUG defaults to on, so the sample rate does not follow it; set
+# SQL_INSTRUMENTATION_SAMPLE_RATE=1 locally to time every request.
+SQL_INSTRUMENTATION = {
+    'ENABLED': os.environ.get('SQL_INSTRUMENTATION_ENABLED', 'True') == 'True',
+    'SAMPLE_RATE': float(os.environ.get('SQL_INSTRUMENTATION_SAMPLE_RATE', '0.01')),
+    'BUFFER_SIZE': int(os.environ.get('SQL_INSTRUMENTATION_BUFFER_SIZE', '100')),
+    'WINDOW_SECONDS': int(os.environ.get('SQL_INSTRUMENTATION_WINDOW_SECONDS', '3600')),
+    'SLOW_MS': float(os.environ.get('SQL_INSTRUMENTATION_SLOW_MS', '0')),
+    'DEBUG_ENDPOINT': os.environ.get('SQL_INSTRUMENTATION_DEBUG_ENDPOINT', str(DEBUG)) == 'True',
+}
@@ -0,0 +1,209 @@
+"""Per-request SQL instrumentation.
+
+``QueryInstrumentationMiddleware`` counts the SQL statements a sampled API
+request runs, their total time and repeated statement shapes (the usual
+sign of an N+1 loop). The figures go out in a ``Server-Timing`` header, so
+they show up in the browser's network panel, and the slowest requests of
+the last ``WINDOW_SECONDS`` are kept in a small in-process min-heap that
+``/api/debug/slow-requests/`` reports, slowest first. Unsampled requests pay
+one ``random()`` call.
+"""
+from collections import Counter
+from contextlib import ExitStack
+import heapq
+import itertools
+import random
+import re
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+
+DEFAULTS = {
+    "ENABLED": True,
+    "SAMPLE_RATE": 0.01,
+    "PATH_PREFIXES": ("/api/reports/", "/api/workboard/"),
+    "BUFFER_SIZE": 100,
+    "WINDOW_SECONDS": 3600,
+    "SLOW_MS": 0,
+    "DEBUG_ENDPOINT": False,
+}
+
+_IN_LIST = re.compile(r"\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, "SQL_INSTRUMENTATION", {})}
+
+
+def fingerprint(sql):
+    """Statement shape with literals and IN-list lengths removed."""
+    sql = _IN_LIST.sub("(...)", sql)
+    sql = _LITERALS.sub("?", sql)
+    return _SPACES.sub(" ", sql).strip()
+
+
+class QueryRecorder:
+    """``execute_wrapper`` hook that tallies statements and their time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.shapes[fingerprint(sql)] += 1
+
+    def duplicates(self, top=5):
+        return [(shape, n) for shape, n in self.shapes.most_common(top) if n > 1]
+
+
+class RequestLog:
+    """The ``size`` slowest sampled requests of the last ``window`` seconds.
+
+    A min-heap on ``duration_ms``: a new request only displaces the fastest
+    one kept, so a burst of quick requests cannot push slow ones out.
+    Requests older than the window are dropped so the log keeps moving.
+    """
+
+    def __init__(self, size=100, window=3600):
+        self._lock = threading.Lock()
+        self._size = size
+        self._window = window
+        self._heap = []  # (duration_ms, seq, monotonic time, entry)
+        self._seq = itertools.count()
+
+    def _expire(self, now):
+        if self._window and self._heap:
+            cutoff = now - self._window
+            kept = [item for item in self._heap if item[2] >= cutoff]
+            if len(kept) != len(self._heap):
+                heapq.heapify(kept)
+                self._heap = kept
+
+    def add(self, entry, now=None):
+        now = time.monotonic() if now is None else now
+        item = (entry["duration_ms"], next(self._seq), now, entry)
+        with self._lock:
+            if len(self._heap) < self._size:
+                heapq.heappush(self._heap, item)
+                return
+            self._expire(now)
+            if len(self._heap) < self._size:
+                heapq.heappush(self._heap, item)
+            elif item[0] > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+
+    def slowest(self, limit=None, now=None):
+        with self._lock:
+            self._expire(time.monotonic() if now is None else now)
+            items = sorted(self._heap, reverse=True)
+        entries = [item[3] for item in items]
+        return entries[:limit] if limit else entries
+
+    def clear(self):
+        with self._lock:
+            self._heap.clear()
+
+    def __len__(self):
+        return len(self._heap)
+
+
+request_log = RequestLog(config()["BUFFER_SIZE"], config()["WINDOW_SECONDS"])
+
+
+def server_timing(recorder, total):
+    dup = sum(n - 1 for _, n in recorder.duplicates(top=None))
+    return (
+        f'db;dur={recorder.duration * 1000:.2f};desc="{recorder.count} queries", '
+        f'dbdup;desc="{dup} repeated", '
+        f"total;dur={total * 1000:.2f}"
+    )
+
+
+class QueryInstrumentationMiddleware:
+    """Sync and async: under ASGI async requests (the SSE stream) skip the adapter."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        conf = config()
+        self.enabled = conf["ENABLED"]
+        self.sample_rate = conf["SAMPLE_RATE"]
+        self.prefixes = tuple(conf["PATH_PREFIXES"])
+        self.slow_ms = conf["SLOW_MS"]
+
+    def _sampled(self, request):
+        return (
+            self.enabled
+            and request.path.startswith(self.prefixes)
+            and random.random() < self.sample_rate
+        )
+
+    @staticmethod
+    def _attach(stack, recorder):
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(recorder))
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self._sampled(request):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            self._attach(stack, recorder)
+            response = self.get_response(request)
+        return self._finish(request, response, recorder, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        if not self._sampled(request):
+            return await self.get_response(request)
+
+        # connections are per thread: hook the ones the request's
+        # thread-sensitive sync_to_async calls (views, async ORM) run on
+        recorder = QueryRecorder()
+        stack = ExitStack()
+        await sync_to_async(self._attach)(stack, recorder)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self._finish(request, response, recorder, time.perf_counter() - started)
+
+    def _finish(self, request, response, recorder, total):
+        # streaming responses are timed up to the first byte only
+        response["Server-Timing"] = server_timing(recorder, total)
+        response["Timing-Allow-Origin"] = "*"
+        if total * 1000 >= self.slow_ms:
+            request_log.add({
+                "method": request.method,
+                "path": request.get_full_path(),
+                "status": response.status_code,
+                "at": timezone.now().isoformat(),
+                "duration_ms": round(total * 1000, 2),
+                "db_ms": round(recorder.duration * 1000, 2),
+                "queries": recorder.count,
+                "duplicates": [{"sql": shape[:300], "count": n} for shape, n in recorder.duplicates()],
+            })
+        return response
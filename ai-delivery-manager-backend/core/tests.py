@@ -1,3 +1,78 @@
-from django.test import TestCase
+import tempfile
+from pathlib import Path
 
-# Create your tests here.
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import AsyncClient, Client, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from workboard.models import Team
+
+from .instrumentation import RequestLog, request_log
+
+
+class RequestLogTests(SimpleTestCase):
+    def durations(self, log, now=0):
+        return [e["duration_ms"] for e in log.slowest(now=now)]
+
+    def test_fast_requests_do_not_evict_slow_ones(self):
+        log = RequestLog(size=3, window=60)
+        for ms in (500, 5, 900, 300):
+            log.add({"duration_ms": ms}, now=0)
+        for _ in range(100):
+            log.add({"duration_ms": 1}, now=1)
+        self.assertEqual(self.durations(log, now=1), [900, 500, 300])
+
+    def test_requests_older_than_the_window_expire(self):
+        log = RequestLog(size=2, window=60)
+        log.add({"duration_ms": 900}, now=0)
+        log.add({"duration_ms": 800}, now=0)
+        log.add({"duration_ms": 10}, now=61)
+        self.assertEqual(self.durations(log, now=61), [10])
+        self.assertEqual(self.durations(log, now=200), [])
+
+
+@override_settings(SQL_INSTRUMENTATION={"SAMPLE_RATE": 1.0})
+class QueryInstrumentationTests(TestCase):
+    def setUp(self):
+        request_log.clear()
+
+    def assertTimed(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="[1-9]\d* queries", ')
+        self.assertEqual(request_log.slowest(1)[0]["path"], "/api/workboard/tickets/")
+
+    def test_sync_request(self):
+        self.assertTimed(Client().get("/api/workboard/tickets/"))
+
+    async def test_async_request_counts_queries_of_the_sync_view(self):
+        self.assertTimed(await AsyncClient().get("/api/workboard/tickets/"))
+
+    def test_other_paths_are_not_sampled(self):
+        self.assertNotIn("Server-Timing", Client().get("/api/health/"))
+
+
+class SQLiteTuningTests(TransactionTestCase):
+    def test_file_databases_open_in_wal_mode_with_the_pragmas(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp, "db.sqlite3"))
+            wrapper = DatabaseWrapper({**connection.settings_dict, "NAME": path}, alias="tuning")
+            try:
+                with wrapper.cursor() as cursor:
+                    pragmas = {}
+                    for name in ("journal_mode", "synchronous", "busy_timeout", "temp_store", "cache_size"):
+                        cursor.execute(f"PRAGMA {name}")
+                        pragmas[name] = cursor.fetchone()[0]
+            finally:
+                wrapper.close()
+        # synchronous NORMAL is 1, temp_store MEMORY is 2
+        self.assertEqual(pragmas, {
+            "journal_mode": "wal", "synchronous": 1, "busy_timeout": settings.SQLITE_PRAGMAS["busy_timeout"],
+            "temp_store": 2, "cache_size": settings.SQLITE_PRAGMAS["cache_size"],
+        })
+
+    def test_transactions_take_the_write_lock_up_front(self):
+        with CaptureQueriesContext(connection) as ctx, transaction.atomic():
+            Team.objects.count()
+        self.assertEqual(ctx.captured_queries[0]["sql"], "BEGIN IMMEDIATE")
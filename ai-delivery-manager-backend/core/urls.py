@@ -1,6 +1,7 @@
 from django.urls import path
-from .views import health_check
+from .views import health_check, slow_requests
 
 urlpatterns = [
     path("health/", health_check),
+    path("debug/slow-requests/", slow_requests),
 ]
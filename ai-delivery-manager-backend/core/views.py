@@ -1,6 +1,8 @@
 from django.shortcuts import render
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from rest_framework import status
+from .instrumentation import config, request_log
 
 
 @api_view(["GET"])
@@ -9,3 +11,22 @@ def health_check(request):
         "status": "ok",
         "service": "AI Delivery Manager Backend"
     })
+
+
+@api_view(["GET", "DELETE"])
+def slow_requests(request):
+    """Slowest recently sampled API requests with their SQL figures (``?limit=``)."""
+    if not config()["DEBUG_ENDPOINT"]:
+        return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+    if request.method == "DELETE":
+        request_log.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    try:
+        limit = int(request.query_params.get("limit", 20))
+    except ValueError:
+        return Response({"detail": "limit must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({
+        "sample_rate": config()["SAMPLE_RATE"],
+        "buffered": len(request_log),
+        "requests": request_log.slowest(max(1, limit)),
+    })
@@ -1,13 +1,307 @@
+import bisect
+import gzip
 import json
+import os
+import threading
+from datetime import datetime
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent
 
+# Records carry their owner and date under different keys per export
+_ASSIGNEE_KEYS = ("assignee", "author", "user")
+_DATE_KEYS = ("due_date", "date")
+# exports larger than this are streamed rather than indexed
+_INDEX_MAX_BYTES = 64 << 20
+
+
+def data_dir():
+    """Directory holding the Jira/Git/Slack exports (``DATA_SOURCES_DIR`` setting)."""
+    try:
+        from django.conf import settings
+        configured = getattr(settings, "DATA_SOURCES_DIR", None)
+    except Exception:
+        configured = None
+    return Path(configured) if configured else BASE_DIR / "mock_data"
+
+
+def resolve_path(filename):
+    """Find an export on disk, accepting JSONL/NDJSON and gzip variants.
+
+    For ``jira_tickets.json`` this tries ``jira_tickets.json``,
+    ``jira_tickets.json.gz``, ``jira_tickets.jsonl[.gz]`` and
+    ``jira_tickets.ndjson[.gz]`` in that order. Returns None if none exist.
+    """
+    base = data_dir()
+    stem = filename[:-len(".json")] if filename.endswith(".json") else filename
+    candidates = [filename, filename + ".gz"]
+    for ext in (".jsonl", ".ndjson"):
+        candidates += [stem + ext, stem + ext + ".gz"]
+    for name in candidates:
+        path = base / name
+        if path.exists():
+            return path
+    return None
+
+
+def _open_text(path):
+    if path.name.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _iter_json_lines(fh):
+    for line in fh:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _iter_json_array(fh, chunk_size=1 << 16):
+    """Yield the elements of a top-level JSON array without loading it whole.
+
+    Memory is bounded by the read chunk plus the largest single element.
+    A document that is not an array is yielded as one record.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        more = fh.read(chunk_size)
+        eof = not more
+        buf = buf[pos:] + more
+        pos = 0
+
+    def skip(chars):
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    skip(" \t\r\n")
+    if pos >= len(buf):
+        return
+    if buf[pos] != "[":
+        yield json.loads(buf[pos:] + fh.read())
+        return
+    pos += 1
+    while True:
+        skip(" \t\r\n,")
+        if pos >= len(buf):
+            raise ValueError("unterminated JSON array")
+        if buf[pos] == "]":
+            return
+        try:
+            obj, end = decoder.raw_decode(buf, pos)
+            # a scalar cut at the buffer edge ("12" of "123", "4.5" of
+            # "4.5e3") parses early; wait until a delimiter follows it
+            truncated = not eof and (end == len(buf) or buf[end] not in " \t\r\n,]")
+        except ValueError:
+            if eof:
+                raise
+            truncated = True
+        if truncated:
+            fill()
+            continue
+        yield obj
+        pos = end
+
+
+def iter_records(filename, missing_ok=False):
+    """Stream the records of an export one at a time.
+
+    Handles JSON arrays, newline-delimited JSON (``.jsonl`` / ``.ndjson``) and
+    gzip-compressed variants of both, without materialising the whole file.
+    """
+    path = resolve_path(filename)
+    if path is None:
+        if missing_ok:
+            return
+        raise FileNotFoundError(data_dir() / filename)
+    with _open_text(path) as fh:
+        name = path.name[:-3] if path.name.endswith(".gz") else path.name
+        if name.endswith((".jsonl", ".ndjson")):
+            yield from _iter_json_lines(fh)
+        else:
+            yield from _iter_json_array(fh)
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _parse_date(value):
+    try:
+        return datetime.fromisoformat(value).date()
+    except (TypeError, ValueError):
+        return None
+
+
+class SourceData:
+    """Parsed records of one export plus lookup indexes built at load time.
+
+    Indexes hold record positions, so every lookup returns records in file
+    order, exactly like a linear scan would.
+    """
+
+    def __init__(self, records):
+        self.records = records
+        self.by_status = {}    # lower-cased status -> [pos]
+        self.by_assignee = {}  # assignee/author/user -> [pos]
+        self._dates = []       # sorted [(date, pos)]
+        self._memo = {}
+        self._lock = threading.Lock()
+        for pos, rec in enumerate(records):
+            if not isinstance(rec, dict):
+                continue
+            status = rec.get("status")
+            if isinstance(status, str):
+                self.by_status.setdefault(status.lower(), []).append(pos)
+            for key in _ASSIGNEE_KEYS:
+                if rec.get(key):
+                    self.by_assignee.setdefault(rec[key], []).append(pos)
+                    break
+            for key in _DATE_KEYS:
+                d = _parse_date(rec.get(key))
+                if d is not None:
+                    self._dates.append((d, pos))
+                    break
+        self._dates.sort()
+
+    def __len__(self):
+        return len(self.records)
+
+    def _at(self, positions):
+        return [self.records[p] for p in sorted(positions)]
+
+    def with_status(self, *statuses):
+        """Records whose status (case-insensitive) is one of ``statuses``."""
+        positions = []
+        for s in statuses:
+            positions.extend(self.by_status.get(s.lower(), ()))
+        return self._at(positions)
+
+    def count_status(self, *statuses):
+        return sum(len(self.by_status.get(s.lower(), ())) for s in statuses)
+
+    def for_assignee(self, name):
+        return self._at(self.by_assignee.get(name, ()))
+
+    def dated_before(self, day, exclude_statuses=()):
+        """Records dated strictly before ``day``, skipping ``exclude_statuses``."""
+        end = bisect.bisect_left(self._dates, (day,))
+        excluded = {s.lower() for s in exclude_statuses}
+        positions = [
+            pos for _, pos in self._dates[:end]
+            if str(self.records[pos].get("status", "")).lower() not in excluded
+        ]
+        return self._at(positions)
+
+    def memo(self, name, build):
+        """Cache a value derived from the records for as long as this load lives."""
+        with self._lock:
+            if name not in self._memo:
+                self._memo[name] = build(self.records)
+            return self._memo[name]
+
+
+_EMPTY = SourceData([])
+_cache = {}  # path -> ((mtime_ns, size), SourceData)
+_scan_cache = {}  # (path, fold name) -> ((mtime_ns, size), result)
+_cache_lock = threading.Lock()
+
+
+def load_source(filename, missing_ok=False):
+    """Return the indexed ``SourceData`` for an export, re-parsing only on change.
+
+    Parsed data is cached per path and keyed on the file's mtime and size, so
+    repeated calls reuse it until the export is replaced. This keeps every
+    record in memory; use ``iter_records`` / ``scan`` for very large exports.
+    """
+    path = resolve_path(filename)
+    if path is None:
+        if missing_ok:
+            return _EMPTY
+        raise FileNotFoundError(data_dir() / filename)
+    stamp = _stamp(path)
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+    data = SourceData(list(iter_records(filename)))
+    with _cache_lock:
+        _cache[path] = (stamp, data)
+    return data
+
+
+def index_max_bytes():
+    """Largest export ``indexed_source`` keeps in memory (``DATA_SOURCES_INDEX_MAX_BYTES``)."""
+    try:
+        from django.conf import settings
+        return getattr(settings, "DATA_SOURCES_INDEX_MAX_BYTES", _INDEX_MAX_BYTES)
+    except Exception:
+        return _INDEX_MAX_BYTES
+
+
+def indexed_source(filename):
+    """``load_source`` for exports that fit in memory, None for larger ones.
+
+    Callers stream a None export with ``scan`` instead. The limit applies to
+    the file on disk, so a gzip export counts at its compressed size. A
+    missing export loads as empty.
+    """
+    path = resolve_path(filename)
+    if path is not None and _stamp(path)[1] > index_max_bytes():
+        return None
+    return load_source(filename, missing_ok=True)
+
+
+def scan(filename, name, fold):
+    """Run ``fold(records)`` over a streamed export and cache its result.
+
+    ``fold`` consumes the record generator and should return a small summary;
+    the full record list is never built. Results are cached per export and
+    ``name`` (include anything else the fold depends on, such as today's
+    date) and recomputed when the file's mtime or size changes. A missing
+    export is scanned as empty.
+    """
+    path = resolve_path(filename)
+    if path is None:
+        return fold(iter(()))
+    stamp = _stamp(path)
+    key = (path, name)
+    with _cache_lock:
+        cached = _scan_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+    result = fold(iter_records(filename))
+    with _cache_lock:
+        # keep only the latest result per export and fold name prefix
+        for old in [k for k in _scan_cache if k[0] == path and _fold_kind(k[1]) == _fold_kind(name)]:
+            del _scan_cache[old]
+        _scan_cache[key] = (stamp, result)
+    return result
+
+
+def _fold_kind(name):
+    return name[0] if isinstance(name, tuple) else name
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+        _scan_cache.clear()
+
 
 def load_json(filename):
-    file_path = BASE_DIR / "mock_data" / filename
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return load_source(filename).records
 
 
 def load_project_data():
@@ -15,4 +309,4 @@ def load_project_data():
         "jira": load_json("jira_tickets.json"),
         "git": load_json("git_activity.json"),
         "slack": load_json("slack_messages.json"),
-    }
\ No newline at end of file
+    }
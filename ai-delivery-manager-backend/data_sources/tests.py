@@ -1,3 +1,116 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from . import loaders
+from .loaders import SourceData, indexed_source, load_source
+
+
+TICKETS = [
+    {"key": "A-1", "status": "Done", "assignee": "Ali", "due_date": "2026-01-05"},
+    {"key": "A-2", "status": "In Progress", "assignee": "Sara", "due_date": "2026-01-01"},
+    {"key": "A-3", "status": "done", "assignee": "Ali", "due_date": "2026-03-01"},
+    {"key": "A-4", "status": "To Do", "assignee": "Ali"},
+]
+
+
+class ExportDirTestCase(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        settings = override_settings(DATA_SOURCES_DIR=tmp.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        loaders.clear_cache()
+        self.addCleanup(loaders.clear_cache)
+
+    def write(self, name, records, mtime=None):
+        path = self.dir / name
+        path.write_text(json.dumps(records), encoding="utf-8")
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+
+class SourceDataTests(SimpleTestCase):
+    def test_indexes_return_records_in_file_order(self):
+        data = SourceData(TICKETS)
+        self.assertEqual([t["key"] for t in data.with_status("DONE")], ["A-1", "A-3"])
+        self.assertEqual(data.count_status("done", "in progress"), 3)
+        self.assertEqual([t["key"] for t in data.for_assignee("Ali")], ["A-1", "A-3", "A-4"])
+
+    def test_dated_before_skips_excluded_statuses(self):
+        data = SourceData(TICKETS)
+        self.assertEqual([t["key"] for t in data.dated_before(date(2026, 2, 1))], ["A-1", "A-2"])
+        self.assertEqual([t["key"] for t in data.dated_before(date(2026, 2, 1), exclude_statuses=("done",))], ["A-2"])
+
+    def test_memo_builds_once(self):
+        data = SourceData(TICKETS)
+        calls = []
+        build = lambda records: calls.append(1) or len(records)
+        self.assertEqual(data.memo("n", build), 4)
+        self.assertEqual(data.memo("n", build), 4)
+        self.assertEqual(len(calls), 1)
+
+
+class IterRecordsTests(ExportDirTestCase):
+    def test_reads_every_export_format_alike(self):
+        lines = "\n".join(json.dumps(t) for t in TICKETS) + "\n\n"
+        self.write("a.json", TICKETS)
+        with gzip.open(self.dir / "b.json.gz", "wt", encoding="utf-8") as fh:
+            json.dump(TICKETS, fh)
+        (self.dir / "c.jsonl").write_text(lines, encoding="utf-8")
+        with gzip.open(self.dir / "d.ndjson.gz", "wt", encoding="utf-8") as fh:
+            fh.write(lines)
+        for name in ("a.json", "b.json", "c.json", "d.json"):
+            self.assertEqual(list(loaders.iter_records(name)), TICKETS, name)
+
+    def test_array_elements_split_across_read_chunks(self):
+        records = [{"n": 123456789, "x": 4.5e3, "s": "a , ] b" * 20}, 12345, "tail"]
+        text = " [ " + " , ".join(json.dumps(r) for r in records) + " ] "
+        for chunk_size in (1, 2, 7, 64):
+            self.assertEqual(list(loaders._iter_json_array(io.StringIO(text), chunk_size)), records)
+        with self.assertRaises(ValueError):
+            list(loaders._iter_json_array(io.StringIO('[{"a": 1}, '), 4))
+
+    def test_scan_folds_without_loading_and_caches_per_file(self):
+        self.write("jira_tickets.json", TICKETS, mtime=1_000_000)
+        calls = []
+
+        def count_done(records):
+            calls.append(1)
+            return sum(1 for r in records if r["status"].lower() == "done")
+
+        self.assertEqual(loaders.scan("jira_tickets.json", "done", count_done), 2)
+        self.assertEqual(loaders.scan("jira_tickets.json", "done", count_done), 2)
+        self.write("jira_tickets.json", TICKETS[:1], mtime=2_000_000)
+        self.assertEqual(loaders.scan("jira_tickets.json", "done", count_done), 1)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(list(loaders.iter_records("nope.json", missing_ok=True)), [])
+
+
+class LoadSourceTests(ExportDirTestCase):
+    def test_reparses_only_when_the_file_changes(self):
+        self.write("jira_tickets.json", TICKETS, mtime=1_000_000)
+        first = load_source("jira_tickets.json")
+        self.assertIs(load_source("jira_tickets.json"), first)
+        self.write("jira_tickets.json", TICKETS[:1], mtime=2_000_000)
+        self.assertEqual(len(load_source("jira_tickets.json")), 1)
+
+    def test_missing_export(self):
+        with self.assertRaises(FileNotFoundError):
+            load_source("nope.json")
+        self.assertEqual(len(load_source("nope.json", missing_ok=True)), 0)
+
+    def test_indexed_source_leaves_large_exports_to_scan(self):
+        path = self.write("jira_tickets.json", TICKETS)
+        self.assertEqual(len(indexed_source("jira_tickets.json")), 4)
+        with override_settings(DATA_SOURCES_INDEX_MAX_BYTES=path.stat().st_size - 1):
+            self.assertIsNone(indexed_source("jira_tickets.json"))
@@ -1,3 +1,8 @@
 from django.contrib import admin
+from .models import ReportSnapshot
 
-# Register your models here.
+
+@admin.register(ReportSnapshot)
+class ReportSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('name', 'team', 'generation', 'built_at', 'checked_at', 'build_ms')
+    list_filter = ('name',)
@@ -2,4 +2,12 @@ from django.apps import AppConfig
 
 
 class ReportsConfig(AppConfig):
+    default_auto_field = 'django.db.models.AutoField'
     name = 'reports'
+
+    def ready(self):
+        from . import precompute
+        if precompute.config()["IN_PROCESS"]:
+            # start with the first request, so only serving processes run it
+            from django.core.signals import request_started
+            request_started.connect(precompute.start_worker, dispatch_uid="reports.precompute.start_worker")
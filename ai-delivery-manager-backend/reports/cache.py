@@ -0,0 +1,88 @@
+"""Process-local cache of built reports, keyed on the workboard generation.
+
+Every workboard write bumps ``workboard.generation`` in the same transaction,
+so a cached entry is only ever reused while the data it was built from is
+unchanged. Entries are also keyed on the current date because overdue
+figures move with the calendar. Eviction is LRU with a TTL on top.
+"""
+from collections import OrderedDict
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+
+class ReportCache:
+    def __init__(self, max_entries=128, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+_config = getattr(settings, "REPORT_CACHE", {})
+report_cache = ReportCache(
+    max_entries=_config.get("MAX_ENTRIES", 128),
+    ttl=_config.get("TTL", 300),
+)
+
+
+def cached_report(name, builder, *args):
+    """Return ``builder(*args)``, reusing a result built from the same data."""
+    if not getattr(settings, "REPORT_CACHE", {}).get("ENABLED", True):
+        return builder(*args)
+    from workboard.generation import current_generation
+
+    key = (name, args, current_generation(), timezone.now().date())
+    found, value = report_cache.get(key)
+    if found:
+        return value
+    value = builder(*args)
+    report_cache.set(key, value)
+    return value
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from reports.precompute import config, precompute
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        'Precompute the standup, weekly, risk and dashboard reports (dashboard also per team) into '
+        'ReportSnapshot rows. Only reports whose data changed are rebuilt. With --loop it keeps '
+        'refreshing every --interval seconds, e.g. as a separate process next to the web workers.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep running, refreshing every --interval seconds')
+        parser.add_argument('--interval', type=int, default=None, help='Seconds between runs (default: REPORT_PRECOMPUTE INTERVAL)')
+        parser.add_argument('--force', action='store_true', help='Rebuild every report even if its data is unchanged')
+
+    def handle(self, *args, **options):
+        interval = options['interval'] or config()['INTERVAL']
+        while True:
+            started = time.monotonic()
+            result = precompute(force=options['force'])
+            self.stdout.write(
+                f"Generation {result['generation']}: built {result['built']}, "
+                f"unchanged {result['unchanged']} ({time.monotonic() - started:.2f}s)"
+            )
+            if not options['loop']:
+                break
+            close_old_connections()
+            time.sleep(interval)
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-18 14:02
+
+import django.db.models.deletion
+import rest_framework.utils.encoders
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('workboard', '0005_ticket_pr_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+                ('data', models.JSONField(encoder=rest_framework.utils.encoders.JSONEncoder)),
+                ('generation', models.BigIntegerField(default=0)),
+                ('built_for', models.DateField()),
+                ('built_at', models.DateTimeField()),
+                ('checked_at', models.DateTimeField()),
+                ('build_ms', models.FloatField(default=0)),
+                ('team', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='report_snapshots', to='workboard.team')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('name', 'team'), name='report_snapshot_team_uniq'), models.UniqueConstraint(condition=models.Q(('team__isnull', True)), fields=('name',), name='report_snapshot_board_uniq')],
+            },
+        ),
+    ]
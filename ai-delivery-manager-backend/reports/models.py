@@ -1,3 +1,29 @@
 from django.db import models
+from rest_framework.utils.encoders import JSONEncoder
 
-# Create your models here.
+
+class ReportSnapshot(models.Model):
+    """A precomputed report, refreshed by ``reports.precompute``.
+
+    ``team`` is NULL for board-wide reports. ``generation`` is the workboard
+    data generation the report was built from; ``checked_at`` is the last
+    time it was confirmed current, and its age is measured from there.
+    """
+    name = models.CharField(max_length=50)
+    team = models.ForeignKey('workboard.Team', on_delete=models.CASCADE, null=True, blank=True, related_name='report_snapshots')
+    data = models.JSONField(encoder=JSONEncoder)
+    generation = models.BigIntegerField(default=0)
+    built_for = models.DateField()
+    built_at = models.DateTimeField()
+    checked_at = models.DateTimeField()
+    build_ms = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'team'], name='report_snapshot_team_uniq'),
+            # NULLs are distinct in unique indexes, so board-wide rows need their own
+            models.UniqueConstraint(fields=['name'], condition=models.Q(team__isnull=True), name='report_snapshot_board_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.team or 'all teams'}) as of {self.checked_at:%Y-%m-%d %H:%M}"
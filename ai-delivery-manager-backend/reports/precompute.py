@@ -0,0 +1,177 @@
+"""Background precomputation of the heavy reports.
+
+``precompute()`` rebuilds every report whose stored ``ReportSnapshot`` was
+built from an older workboard generation or an earlier day, and only marks
+the others as checked. Board-wide reports share one board snapshot; the
+dashboard is also stored per team. It runs from the ``precompute_reports``
+command or from ``PrecomputeWorker``, a daemon thread inside the web
+process, so no broker is needed.
+
+``get_report()`` serves the stored copy only while it was built from the
+current generation, so a board write is visible on the next read; the copy
+must also be younger than ``REPORT_PRECOMPUTE["MAX_STALENESS"]`` seconds,
+which bounds how stale the file exports it folds in can get. Otherwise it
+builds live. ``report_source()`` also names the version it would serve, for
+ETags.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.utils import timezone
+
+from . import summary_builder
+from .cache import cached_report
+from .models import ReportSnapshot
+from .snapshot import load_snapshot
+
+logger = logging.getLogger(__name__)
+
+BOARD_REPORTS = {
+    "daily_standup": summary_builder.build_daily_standup,
+    "weekly_client": summary_builder.build_weekly_client,
+    "risk_analysis": summary_builder.analyze_risks,
+    "dashboard": summary_builder.get_dashboard_stats,
+}
+TEAM_REPORTS = {
+    "dashboard": lambda team_id: summary_builder.get_dashboard_stats(team_id=team_id),
+}
+
+
+def config():
+    return {
+        "SERVE": True, "MAX_STALENESS": 120, "INTERVAL": 60, "IN_PROCESS": False,
+        **getattr(settings, "REPORT_PRECOMPUTE", {}),
+    }
+
+
+def precompute(force=False):
+    """Refresh stored reports that are out of date; returns build counts."""
+    from workboard.generation import current_generation
+    from workboard.models import Team
+
+    # read the generation first: a write during the build leaves the stored
+    # generation behind, so the next run rebuilds
+    generation = current_generation()
+    today = timezone.now().date()
+    stored = {
+        (row.name, row.team_id): row
+        for row in ReportSnapshot.objects.defer("data")
+    }
+
+    def outdated(key):
+        row = stored.get(key)
+        return force or row is None or row.generation != generation or row.built_for != today
+
+    jobs = [(name, None, build) for name, build in BOARD_REPORTS.items() if outdated((name, None))]
+    for team_id in Team.objects.values_list("id", flat=True):
+        jobs += [(name, team_id, build) for name, build in TEAM_REPORTS.items() if outdated((name, team_id))]
+
+    snap = load_snapshot() if any(team_id is None for _, team_id, _ in jobs) else None
+    for name, team_id, build in jobs:
+        started = time.perf_counter()
+        data = build(snap) if team_id is None else build(team_id)
+        now = timezone.now()
+        ReportSnapshot.objects.update_or_create(
+            name=name, team_id=team_id,
+            defaults={
+                "data": data, "generation": generation, "built_for": today,
+                "built_at": now, "checked_at": now,
+                "build_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
+        )
+
+    built = {(name, team_id) for name, team_id, _ in jobs}
+    current = [row.pk for key, row in stored.items() if key not in built]
+    if current:
+        ReportSnapshot.objects.filter(pk__in=current).update(checked_at=timezone.now())
+    return {"built": len(jobs), "unchanged": len(current), "generation": generation}
+
+
+def latest(name, team_id=None, max_age=None):
+    """``(data, age_seconds, version)`` of a current stored report, else None.
+
+    Current means built today from the current data generation and checked
+    within the staleness bound.
+    """
+    from workboard.generation import current_generation
+
+    max_age = config()["MAX_STALENESS"] if max_age is None else max_age
+    row = (
+        ReportSnapshot.objects.filter(name=name, team_id=team_id, generation=current_generation())
+        .values("data", "checked_at", "built_for", "generation", "built_at").first()
+    )
+    if row is None or row["built_for"] != timezone.now().date():
+        return None
+    age = (timezone.now() - row["checked_at"]).total_seconds()
+    if age > max_age:
+        return None
+    return row["data"], age, f"stored:{row['generation']}:{row['built_at'].isoformat()}"
+
+
+def get_report(name, builder, *args, team_id=None):
+    """``(data, age)``: the precomputed report if current, else a live build (age None)."""
+    if config()["SERVE"]:
+        found = latest(name, team_id)
+        if found is not None:
+            return found[:2]
+    return cached_report(name, builder, *args), None
+
+
+def report_source(name, builder, *args, team_id=None):
+    """``(version, load)`` for conditional GETs.
+
+    ``version`` names the body ``get_report`` would serve without building
+    it; ``load()`` returns that ``(data, age)``. A live build is versioned
+    by the data generation and the date, read before it runs.
+    """
+    if config()["SERVE"]:
+        found = latest(name, team_id)
+        if found is not None:
+            data, age, version = found
+            return version, lambda: (data, age)
+    from workboard.generation import current_generation
+
+    version = f"live:{current_generation()}:{timezone.now().date()}"
+    return version, lambda: (cached_report(name, builder, *args), None)
+
+
+class PrecomputeWorker(threading.Thread):
+    """Daemon thread that calls ``precompute()`` every ``interval`` seconds."""
+
+    def __init__(self, interval):
+        super().__init__(name="report-precompute", daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                close_old_connections()
+                precompute()
+            except Exception:
+                logger.exception("Report precompute failed")
+            finally:
+                connections.close_all()
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def start_worker(**kwargs):
+    """Start the in-process worker once per process (a ``request_started`` receiver)."""
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = PrecomputeWorker(config()["INTERVAL"])
+            _worker.start()
+    return _worker
@@ -0,0 +1,118 @@
+"""In-memory snapshot of the workboard used by the report builders.
+
+Loading the board once with a fixed number of queries lets every builder
+work from plain Python structures instead of issuing per-ticket lookups
+(``t.assignee``, ``t.dependencies.all()``, ``d.depends_on``).
+"""
+from collections import namedtuple
+from datetime import timedelta
+
+from django.db.models import Count
+
+
+TicketRow = namedtuple(
+    "TicketRow",
+    ["id", "key", "title", "status", "priority", "due_date",
+     "assignee_id", "assignee_name", "created_at", "updated_at"],
+)
+
+TICKET_FIELDS = (
+    "id", "key", "title", "status", "priority", "due_date",
+    "assignee_id", "assignee__name", "created_at", "updated_at",
+)
+
+
+class BoardSnapshot:
+    """Tickets, dependency edges, PR and member totals loaded in one pass."""
+
+    RECENT_PRS = 5
+
+    def __init__(self, tickets, edges, pr_status_counts, recent_prs, total_members, today, completed_this_week=0):
+        self.tickets = tickets
+        self.by_id = {t.id: t for t in tickets}
+        # ticket id -> [depends_on ticket id, ...] in Dependency id order
+        self.depends_on = {}
+        for ticket_id, depends_on_id in edges:
+            self.depends_on.setdefault(ticket_id, []).append(depends_on_id)
+        self.pr_status_counts = pr_status_counts
+        self.total_prs = sum(pr_status_counts.values())
+        self.recent_prs = recent_prs
+        self.total_members = total_members
+        self.today = today
+        # tickets moved to DONE in the seven days up to ``today``
+        self.completed_this_week = completed_this_week
+        self._graph = None
+
+    @property
+    def graph(self):
+        """``DependencyGraph`` over this snapshot's edges (built on first use)."""
+        if self._graph is None:
+            from workboard.graph import DependencyGraph
+            self._graph = DependencyGraph(
+                (ticket_id, dep_id) for ticket_id, deps in self.depends_on.items() for dep_id in deps
+            )
+        return self._graph
+
+    def is_done(self, ticket_id):
+        t = self.by_id.get(ticket_id)
+        return t is None or t.status == "DONE"
+
+    def transitive_blockers(self, t):
+        """Unfinished tickets ``t`` waits on through at least one other unfinished ticket."""
+        reach = self.graph.upstream(t.id, skip=self.is_done)
+        return [self.by_id[i] for i, depth in sorted(reach.items(), key=lambda kv: (kv[1], kv[0])) if depth > 1]
+
+    def open_tickets(self):
+        return [t for t in self.tickets if t.status != "DONE"]
+
+    def with_status(self, status):
+        return [t for t in self.tickets if t.status == status]
+
+    def count_status(self, status):
+        return sum(1 for t in self.tickets if t.status == status)
+
+    def is_overdue(self, t):
+        return t.status != "DONE" and t.due_date is not None and t.due_date < self.today
+
+    def has_dependencies(self, t):
+        return t.id in self.depends_on
+
+    def waiting_on(self, t):
+        """Tickets ``t`` directly depends on that are not DONE yet."""
+        out = []
+        for dep_id in self.depends_on.get(t.id, ()):
+            dep = self.by_id.get(dep_id)
+            if dep is not None and dep.status != "DONE":
+                out.append(dep)
+        return out
+
+
+def load_snapshot():
+    """Load the workboard in a bounded number of queries (six, regardless of size)."""
+    from django.utils import timezone as djtz
+    from workboard import history
+    from workboard.models import Ticket, PullRequest, Member, Dependency
+
+    today = djtz.now().date()
+    tickets = [
+        TicketRow(*row)
+        for row in Ticket.objects.order_by("id").values_list(*TICKET_FIELDS).iterator(chunk_size=2000)
+    ]
+    edges = list(Dependency.objects.order_by("id").values_list("ticket_id", "depends_on_id"))
+    pr_status_counts = {
+        row["status"]: row["n"]
+        for row in PullRequest.objects.order_by().values("status").annotate(n=Count("id"))
+    }
+    recent_prs = list(PullRequest.objects.select_related("author").order_by("-created_at")[:BoardSnapshot.RECENT_PRS])
+    total_members = Member.objects.count()
+
+    return BoardSnapshot(
+        tickets=tickets,
+        edges=edges,
+        pr_status_counts=pr_status_counts,
+        recent_prs=recent_prs,
+        total_members=total_members,
+        today=today,
+        # from the daily status rollups, not a rescan
+        completed_this_week=history.entered_between(today - timedelta(days=6), today),
+    )
@@ -1,19 +1,90 @@
-from pathlib import Path
-import json
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from django.db import models
+from django.db import connections, models
 
+from data_sources.loaders import indexed_source, scan
+from . import tone_engine
+from .snapshot import BoardSnapshot, TicketRow, TICKET_FIELDS, load_snapshot
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-MOCK_DIR = BASE_DIR / "data_sources" / "mock_data"
 
+_IN_PROGRESS = ("in progress", "in_progress", "inprogress")
 
-def _load_json(name):
-    path = MOCK_DIR / name
-    if not path.exists():
-        return []
-    with open(path, "r", encoding="utf-8") as fh:
-        return json.load(fh)
+
+def _mentions_blocker(msg):
+    msg = msg.lower()
+    return "block" in msg or "waiting for" in msg
+
+
+def _blocker_messages(records):
+    return [m.get("message") for m in records if _mentions_blocker(m.get("message", ""))]
+
+
+def _slack_blockers():
+    """Blocker messages from the Slack export (indexed, or streamed when huge)."""
+    slack = indexed_source("slack_messages.json")
+    if slack is not None:
+        return slack.memo("blockers", _blocker_messages)
+    return scan("slack_messages.json", "blockers", _blocker_messages)
+
+
+def _last_commit():
+    commits = indexed_source("git_activity.json")
+    if commits is not None:
+        return commits.records[-1].get("commit") if commits.records else None
+
+    def fold(records):
+        last = deque(records, maxlen=1)
+        return last[0].get("commit") if last else None
+    return scan("git_activity.json", "last_commit", fold)
+
+
+def _jira_digest():
+    """What the fallbacks need from the Jira export, in one pass.
+
+    A regular export is answered from the loader's status and date indexes;
+    a huge one is streamed and only titles of DONE and overdue tickets are
+    kept, never the records.
+    """
+    today = datetime.utcnow().date()
+    tickets = indexed_source("jira_tickets.json")
+    if tickets is not None:
+        return tickets.memo(("digest", today), lambda records: _indexed_digest(tickets, today))
+
+    def fold(records):
+        digest = {"total": 0, "first_title": None, "first_in_progress": None, "done_titles": [], "overdue": []}
+        for t in records:
+            status = t.get("status", "").lower()
+            if digest["total"] == 0:
+                digest["first_title"] = t.get("title")
+            digest["total"] += 1
+            if digest["first_in_progress"] is None and status in _IN_PROGRESS:
+                digest["first_in_progress"] = t.get("title")
+            if status == "done":
+                digest["done_titles"].append(t.get("title"))
+            if status not in ("done", "completed") and t.get("due_date"):
+                try:
+                    if datetime.fromisoformat(t["due_date"]).date() < today:
+                        digest["overdue"].append({"key": t.get("key", ""), "title": t.get("title")})
+                except Exception:
+                    pass
+        return digest
+
+    return scan("jira_tickets.json", ("digest", today), fold)
+
+
+def _indexed_digest(tickets, today):
+    in_progress = tickets.with_status(*_IN_PROGRESS)
+    return {
+        "total": len(tickets),
+        "first_title": tickets.records[0].get("title") if tickets.records else None,
+        "first_in_progress": in_progress[0].get("title") if in_progress else None,
+        "done_titles": [t.get("title") for t in tickets.with_status("done")],
+        "overdue": [
+            {"key": t.get("key", ""), "title": t.get("title")}
+            for t in tickets.dated_before(today, exclude_statuses=("done", "completed"))
+        ],
+    }
 
 
 def _try_import_workboard():
@@ -24,49 +95,48 @@ def _try_import_workboard():
         return None, None, None
 
 
-def build_daily_standup():
+def build_daily_standup(snapshot=None):
     Ticket, PullRequest, Member = _try_import_workboard()
     # use DB if available
     if Ticket:
+        snap = snapshot or load_snapshot()
+
         # Yesterday: most recent PR title as proxy for commits
-        yesterday = None
-        pr = PullRequest.objects.order_by('-created_at').first()
-        if pr:
-            yesterday = pr.title
+        yesterday = snap.recent_prs[0].title if snap.recent_prs else None
 
         # Today: pick an in-progress ticket title
-        in_prog_qs = Ticket.objects.filter(status__in=['IN_PROGRESS']).order_by('-updated_at')
+        in_prog = sorted(snap.with_status('IN_PROGRESS'), key=lambda t: t.updated_at, reverse=True)
         today_items = []
-        for t in in_prog_qs[:5]:
+        for t in in_prog[:5]:
             today_items.append({
                 'key': t.key,
                 'title': t.title,
-                'assignee': t.assignee.name if t.assignee else None,
+                'assignee': t.assignee_name,
             })
         if today_items:
             today = f"Continue work on {today_items[0]['title']}"
         else:
-            t0 = Ticket.objects.order_by('-created_at').first()
+            t0 = max(snap.tickets, key=lambda t: t.created_at, default=None)
             today = f"Work on {t0.title}" if t0 else "No planned tasks detected"
 
         # Blockers: consider only tickets that are not DONE and either BLOCKED
         # or have unresolved dependencies (depends_on not DONE). Include assignee.
         blockers = []
-        for t in Ticket.objects.exclude(status='DONE'):
+        for t in snap.open_tickets():
             if t.status == 'BLOCKED':
                 blockers.append({
                     'key': t.key,
                     'title': t.title,
-                    'assignee': t.assignee.name if t.assignee else None,
+                    'assignee': t.assignee_name,
                     'waiting_on': [],
                 })
                 continue
-            waiting_on = [d.depends_on for d in t.dependencies.all() if d.depends_on.status != 'DONE']
+            waiting_on = snap.waiting_on(t)
             if waiting_on:
                 blockers.append({
                     'key': t.key,
                     'title': t.title,
-                    'assignee': t.assignee.name if t.assignee else None,
+                    'assignee': t.assignee_name,
                     'waiting_on': [w.key for w in waiting_on],
                 })
 
@@ -84,31 +154,21 @@ def build_daily_standup():
             "details": {"today_items": today_items, "blockers": blockers},
         }
 
-    # fallback to JSON mocks
-    tickets = _load_json("jira_tickets.json")
-    commits = _load_json("git_activity.json")
-    slack = _load_json("slack_messages.json")
+    # fallback to JSON mocks, streamed from the exports
+    tickets = _jira_digest()
 
     # Yesterday: most recent commit message
-    yesterday = None
-    if commits:
-        yesterday = commits[-1].get("commit")
+    yesterday = _last_commit()
 
     # Today: pick an in-progress ticket title
     today = None
-    for t in tickets:
-        if t.get("status", "").lower() in ("in progress", "in_progress", "inprogress"):
-            today = f"Continue work on {t.get('title')}"
-            break
-    if not today and tickets:
-        today = f"Work on {tickets[0].get('title')}"
+    if tickets["first_in_progress"] is not None:
+        today = f"Continue work on {tickets['first_in_progress']}"
+    if not today and tickets["total"]:
+        today = f"Work on {tickets['first_title']}"
 
     # Blockers: look for slack messages mentioning 'blocked' or 'blocked waiting'
-    blockers = []
-    for m in slack:
-        msg = m.get("message", "").lower()
-        if "block" in msg or "blocked" in msg or "waiting for" in msg:
-            blockers.append(m.get("message"))
+    blockers = _slack_blockers()
     blockers_text = ", ".join(blockers) if blockers else "None"
 
     return {
@@ -120,63 +180,47 @@ def build_daily_standup():
     }
 
 
-def build_weekly_client():
+def build_weekly_client(snapshot=None):
     Ticket, PullRequest, Member = _try_import_workboard()
     if Ticket:
-        tickets = Ticket.objects.all()
-        total = tickets.count()
-        done = tickets.filter(status='DONE').count()
+        snap = snapshot or load_snapshot()
+        total = len(snap.tickets)
+        done_tickets = snap.with_status('DONE')
+        done = len(done_tickets)
         progress = f"{int((done / total) * 100) if total>0 else 0}%"
 
-        milestones = list(tickets.filter(status='DONE').values_list('title', flat=True))
+        milestones = [t.title for t in done_tickets]
 
         risks = []
-        from django.utils import timezone as djtz
-        for t in tickets.exclude(status='DONE'):
-            if t.due_date:
-                try:
-                    if t.due_date < djtz.now().date():
-                        risks.append(f"{t.title} overdue")
-                except Exception:
-                    pass
+        open_tickets = snap.open_tickets()
+        for t in open_tickets:
+            if snap.is_overdue(t):
+                risks.append(f"{t.title} overdue")
 
         # include blockers from dependencies where the depended-on ticket isn't DONE
-        for t in tickets.exclude(status='DONE').filter(dependencies__isnull=False).distinct():
-            waiting = [d.depends_on.key for d in t.dependencies.all() if d.depends_on.status != 'DONE']
+        for t in open_tickets:
+            waiting = [d.key for d in snap.waiting_on(t)]
             if waiting:
                 risks.append(f"{t.key} blocked by {waiting}")
 
         overview = "The project is progressing; see milestones and risks."
-        return {"overview": overview, "progress": progress, "milestones": milestones, "risks": risks}
+        return {
+            "overview": overview, "progress": progress, "milestones": milestones, "risks": risks,
+            "completed_this_week": snap.completed_this_week,
+        }
 
-    # fallback to JSON behavior
-    tickets = _load_json("jira_tickets.json")
-    commits = _load_json("git_activity.json")
-    slack = _load_json("slack_messages.json")
+    # fallback to JSON behavior, streamed from the exports
+    tickets = _jira_digest()
 
-    total = len(tickets)
-    done = sum(1 for t in tickets if t.get("status", "").lower() == "done")
+    total = tickets["total"]
+    done = len(tickets["done_titles"])
     progress = f"{int((done / total) * 100) if total>0 else 0}%"
 
-    milestones = [t.get("title") for t in tickets if t.get("status", "").lower() == "done"]
+    milestones = list(tickets["done_titles"])
 
-    risks = []
-    for t in tickets:
-        if t.get("status", "").lower() not in ("done", "completed"):
-            # due date check
-            due = t.get("due_date")
-            if due:
-                try:
-                    d = datetime.fromisoformat(due)
-                    if d.date() < datetime.utcnow().date():
-                        risks.append(f"{t.get('title')} overdue")
-                except Exception:
-                    pass
+    risks = [f"{t['title']} overdue" for t in tickets["overdue"]]
     # Slack blockers
-    for m in slack:
-        msg = m.get("message", "")
-        if "block" in msg.lower() or "waiting for" in msg.lower():
-            risks.append(msg)
+    risks.extend(_slack_blockers())
 
     overview = "The project is progressing; see milestones and risks."
 
@@ -206,35 +250,8 @@ _TONE_TEMPLATES = {
     },
 }
 
-_CLIENT_REPLACEMENTS = [
-    ("IN_PROGRESS", "actively in development"),
-    ("BLOCKED", "pending resolution"),
-    ("DONE", "successfully completed"),
-    ("PR", "pull request"),
-    ("API", "integration layer"),
-    ("backend", "server infrastructure"),
-    ("frontend", "user interface"),
-    ("bug", "issue"),
-    ("error", "anomaly"),
-    ("crash", "unexpected behaviour"),
-]
-
-
 def _transform_text_for_tone(tone: str, text: str) -> str:
-    result = text
-    if tone == "client":
-        for tech, friendly in _CLIENT_REPLACEMENTS:
-            result = result.replace(tech, friendly)
-        result = result.replace("fix", "resolve").replace("Fix", "Resolve")
-    elif tone == "technical":
-        result = result.replace("issue", "bug").replace("resolve", "fix").replace("Resolve", "Fix")
-    elif tone == "executive":
-        # Keep it short — truncate to first 2 sentences
-        sentences = result.replace("  ", " ").split(". ")
-        result = ". ".join(sentences[:3]).strip()
-        if not result.endswith("."):
-            result += "."
-    return result
+    return tone_engine.transform(tone, text)
 
 
 def rewrite_summary(tone: str, text: str = None):
@@ -256,16 +273,34 @@ def rewrite_summary(tone: str, text: str = None):
     return {"tone": tone, "style": tmpl["style"], "rewritten_summary": rewritten}
 
 
-def analyze_risks():
+def rewrite_batch(items, wrap=True):
+    """Rewrite many ``{"text", "tone"}`` items in one call.
+
+    With ``wrap=False`` only the transformed text is returned, without the
+    tone's prefix and suffix (e.g. for rewriting ticket descriptions).
+    """
+    results = []
+    for i, item in enumerate(items):
+        tone = item.get("tone", "client")
+        tone = tone if tone in _TONE_TEMPLATES else "client"
+        tmpl = _TONE_TEMPLATES[tone]
+        transformed = _transform_text_for_tone(tone, item.get("text") or "")
+        rewritten = f"{tmpl['prefix']} {transformed} {tmpl['suffix']}" if wrap else transformed
+        results.append({"index": i, "tone": tone, "style": tmpl["style"], "rewritten_summary": rewritten})
+    return {"results": results}
+
+
+def analyze_risks(snapshot=None):
     Ticket, PullRequest, Member = _try_import_workboard()
     risks = []
 
     if Ticket:
-        from django.utils import timezone as djtz
-        today = djtz.now().date()
+        snap = snapshot or load_snapshot()
+        today = snap.today
+        open_tickets = snap.open_tickets()
 
         # Overdue tickets
-        for t in Ticket.objects.exclude(status="DONE"):
+        for t in open_tickets:
             if t.due_date and t.due_date < today:
                 days_overdue = (today - t.due_date).days
                 severity = "critical" if days_overdue > 7 else "high" if days_overdue > 3 else "medium"
@@ -274,22 +309,22 @@ def analyze_risks():
                     "severity": severity,
                     "ticket": t.key,
                     "description": f"{t.key} '{t.title}' is {days_overdue} day(s) overdue",
-                    "assignee": t.assignee.name if t.assignee else "Unassigned",
+                    "assignee": t.assignee_name or "Unassigned",
                 })
 
         # Blocked tickets
-        for t in Ticket.objects.filter(status="BLOCKED"):
+        for t in snap.with_status("BLOCKED"):
             risks.append({
                 "type": "blocked",
                 "severity": "high",
                 "ticket": t.key,
                 "description": f"{t.key} '{t.title}' is blocked",
-                "assignee": t.assignee.name if t.assignee else "Unassigned",
+                "assignee": t.assignee_name or "Unassigned",
             })
 
         # Dependency blockers
-        for t in Ticket.objects.exclude(status="DONE").filter(dependencies__isnull=False).distinct():
-            blocking_deps = [d.depends_on for d in t.dependencies.all() if d.depends_on.status != "DONE"]
+        for t in open_tickets:
+            blocking_deps = snap.waiting_on(t)
             if blocking_deps:
                 keys = [d.key for d in blocking_deps]
                 risks.append({
@@ -297,37 +332,42 @@ def analyze_risks():
                     "severity": "medium",
                     "ticket": t.key,
                     "description": f"{t.key} '{t.title}' is waiting on {keys}",
-                    "assignee": t.assignee.name if t.assignee else "Unassigned",
+                    "assignee": t.assignee_name or "Unassigned",
+                })
+
+        # Transitive dependency blockers (waiting on a ticket that is itself waiting)
+        for t in open_tickets:
+            if not snap.has_dependencies(t):
+                continue
+            upstream = snap.transitive_blockers(t)
+            if upstream:
+                keys = [d.key for d in upstream]
+                risks.append({
+                    "type": "transitive_dependency",
+                    "severity": "medium",
+                    "ticket": t.key,
+                    "description": f"{t.key} '{t.title}' is blocked transitively by {keys}",
+                    "assignee": t.assignee_name or "Unassigned",
                 })
 
         # High priority in-progress tickets
-        for t in Ticket.objects.filter(status="IN_PROGRESS", priority="HIGH"):
+        for t in snap.with_status("IN_PROGRESS"):
+            if t.priority != "HIGH":
+                continue
             risks.append({
                 "type": "high_priority",
                 "severity": "low",
                 "ticket": t.key,
                 "description": f"{t.key} '{t.title}' is high-priority and still in progress",
-                "assignee": t.assignee.name if t.assignee else "Unassigned",
+                "assignee": t.assignee_name or "Unassigned",
             })
 
     else:
-        # JSON fallback
-        tickets = _load_json("jira_tickets.json")
-        slack = _load_json("slack_messages.json")
-        for t in tickets:
-            if t.get("status", "").lower() not in ("done", "completed"):
-                due = t.get("due_date")
-                if due:
-                    try:
-                        d = datetime.fromisoformat(due)
-                        if d.date() < datetime.utcnow().date():
-                            risks.append({"type": "overdue", "severity": "high", "ticket": t.get("key", ""), "description": f"{t.get('title')} overdue"})
-                    except Exception:
-                        pass
-        for m in slack:
-            msg = m.get("message", "")
-            if "block" in msg.lower() or "waiting for" in msg.lower():
-                risks.append({"type": "blocked", "severity": "medium", "ticket": "", "description": msg})
+        # JSON fallback, streamed from the exports
+        for t in _jira_digest()["overdue"]:
+            risks.append({"type": "overdue", "severity": "high", "ticket": t["key"], "description": f"{t['title']} overdue"})
+        for msg in _slack_blockers():
+            risks.append({"type": "blocked", "severity": "medium", "ticket": "", "description": msg})
 
     if not risks:
         risks = [{"type": "none", "severity": "low", "ticket": "", "description": "No immediate risks detected", "assignee": "N/A"}]
@@ -336,12 +376,59 @@ def analyze_risks():
     order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
     risks.sort(key=lambda r: order.get(r.get("severity", "low"), 3))
 
-    return {"risks": risks, "summary": {"total": len(risks), "by_type": {r["type"]: sum(1 for x in risks if x["type"] == r["type"]) for r in risks}}}
+    return {"risks": risks, "summary": {"total": len(risks), "by_type": dict(Counter(r["type"] for r in risks))}}
+
+
+def _dashboard_inputs_from_snapshot(snap):
+    overdue_tickets = [t for t in snap.tickets if snap.is_overdue(t)]
+    counts = {
+        "total_tickets": len(snap.tickets),
+        "done": snap.count_status("DONE"),
+        "in_progress": snap.count_status("IN_PROGRESS"),
+        "blocked": snap.count_status("BLOCKED"),
+        "todo": snap.count_status("TODO"),
+        "overdue": len(overdue_tickets),
+        "total_prs": snap.total_prs,
+        "open_prs": snap.pr_status_counts.get("OPEN", 0),
+        "merged_prs": snap.pr_status_counts.get("MERGED", 0),
+        "total_members": snap.total_members,
+    }
+    overdue_top = sorted(overdue_tickets, key=lambda t: t.due_date)[:3]
+    blocked_top = snap.with_status("BLOCKED")[:3]
+    return counts, snap.recent_prs, overdue_top, blocked_top, snap.today
+
+
+def _dashboard_inputs_from_counters(team_id=None):
+    """Totals from the materialized counters row plus three LIMIT-ed lookups."""
+    from workboard.counters import get_counters, COUNTER_FIELDS
+    from workboard.models import Ticket, PullRequest
 
+    row = get_counters(team_id)
+    if row is None:
+        return None
+    counts = {f: getattr(row, f) for f in COUNTER_FIELDS}
+    today = row.overdue_as_of
 
-def get_dashboard_stats():
+    tickets = Ticket.objects.all()
+    prs = PullRequest.objects.select_related("author")
+    if team_id is not None:
+        tickets = tickets.filter(assignee__team_id=team_id)
+        prs = prs.filter(author__team_id=team_id)
+    recent_prs = list(prs.order_by("-created_at")[:BoardSnapshot.RECENT_PRS])
+    overdue_qs = tickets.exclude(status="DONE").filter(due_date__lt=today).order_by("due_date", "id")
+    overdue_top = [TicketRow(*row) for row in overdue_qs.values_list(*TICKET_FIELDS)[:3]]
+    blocked_qs = tickets.filter(status="BLOCKED").order_by("id")
+    blocked_top = [TicketRow(*row) for row in blocked_qs.values_list(*TICKET_FIELDS)[:3]]
+    return counts, recent_prs, overdue_top, blocked_top, today
+
+
+def get_dashboard_stats(snapshot=None, team_id=None):
+    """Dashboard totals, recent activity and top risks.
+
+    Totals come from the materialized ``DashboardCounters`` row unless a
+    pre-loaded board snapshot is passed in. Returns None for an unknown team.
+    """
     Ticket, PullRequest, Member = _try_import_workboard()
-    from django.utils import timezone as djtz
 
     if not Ticket:
         return {
@@ -352,21 +439,26 @@ def get_dashboard_stats():
             "recent_activity": [], "top_risks": [],
         }
 
-    today = djtz.now().date()
-    tickets = Ticket.objects.all()
-    total = tickets.count()
-    done = tickets.filter(status="DONE").count()
-    in_progress = tickets.filter(status="IN_PROGRESS").count()
-    blocked = tickets.filter(status="BLOCKED").count()
-    todo = tickets.filter(status="TODO").count()
-    overdue = tickets.exclude(status="DONE").filter(due_date__lt=today).count()
+    if snapshot is not None and team_id is None:
+        counts, recent_prs, overdue_top, blocked_top, today = _dashboard_inputs_from_snapshot(snapshot)
+    else:
+        inputs = _dashboard_inputs_from_counters(team_id)
+        if inputs is None:
+            return None
+        counts, recent_prs, overdue_top, blocked_top, today = inputs
+
+    total = counts["total_tickets"]
+    done = counts["done"]
+    in_progress = counts["in_progress"]
+    blocked = counts["blocked"]
+    todo = counts["todo"]
+    overdue = counts["overdue"]
 
-    prs = PullRequest.objects.all()
-    total_prs = prs.count()
-    open_prs = prs.filter(status="OPEN").count()
-    merged_prs = prs.filter(status="MERGED").count()
+    total_prs = counts["total_prs"]
+    open_prs = counts["open_prs"]
+    merged_prs = counts["merged_prs"]
 
-    total_members = Member.objects.count()
+    total_members = counts["total_members"]
 
     progress_percent = int((done / total) * 100) if total > 0 else 0
 
@@ -380,7 +472,7 @@ def get_dashboard_stats():
 
     # Recent activity: last 5 merged PRs or recent tickets
     recent_activity = []
-    for pr in PullRequest.objects.order_by("-created_at")[:5]:
+    for pr in recent_prs:
         recent_activity.append({
             "type": "pr",
             "title": pr.title,
@@ -391,7 +483,7 @@ def get_dashboard_stats():
 
     # Top risks (overdue + blocked)
     top_risks = []
-    for t in tickets.exclude(status="DONE").filter(due_date__lt=today).order_by("due_date")[:3]:
+    for t in overdue_top:
         days = (today - t.due_date).days
         top_risks.append({
             "key": t.key,
@@ -399,16 +491,16 @@ def get_dashboard_stats():
             "type": "overdue",
             "severity": "critical" if days > 7 else "high",
             "detail": f"{days}d overdue",
-            "assignee": t.assignee.name if t.assignee else "Unassigned",
+            "assignee": t.assignee_name or "Unassigned",
         })
-    for t in tickets.filter(status="BLOCKED")[:3]:
+    for t in blocked_top:
         top_risks.append({
             "key": t.key,
             "title": t.title,
             "type": "blocked",
             "severity": "high",
             "detail": "Blocked",
-            "assignee": t.assignee.name if t.assignee else "Unassigned",
+            "assignee": t.assignee_name or "Unassigned",
         })
 
     return {
@@ -427,3 +519,34 @@ def get_dashboard_stats():
         "recent_activity": recent_activity,
         "top_risks": top_risks,
     }
+
+
+ALL_REPORTS = {
+    "daily_standup": build_daily_standup,
+    "weekly_client": build_weekly_client,
+    "risk_analysis": analyze_risks,
+    "dashboard": get_dashboard_stats,
+}
+
+
+def _build_in_thread(build, snap):
+    try:
+        return build(snap)
+    finally:
+        # pool threads must not keep database connections open
+        connections.close_all()
+
+
+def build_all_reports(workers=1):
+    """Standup, weekly, risk and dashboard reports from one board snapshot.
+
+    The snapshot is loaded once (six queries) and shared; builders only read
+    it, so with ``workers > 1`` they run on a thread pool.
+    """
+    Ticket, PullRequest, Member = _try_import_workboard()
+    snap = load_snapshot() if Ticket else None
+    if workers <= 1:
+        return {name: build(snap) for name, build in ALL_REPORTS.items()}
+    with ThreadPoolExecutor(max_workers=min(workers, len(ALL_REPORTS))) as pool:
+        futures = {name: pool.submit(_build_in_thread, build, snap) for name, build in ALL_REPORTS.items()}
+        return {name: future.result() for name, future in futures.items()}
@@ -1,3 +1,140 @@
-from django.test import TestCase
+import io
+from datetime import timedelta
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from data_sources.loaders import clear_cache
+from workboard import events
+from workboard.models import Dependency, Member, PullRequest, Team, Ticket
+
+from . import precompute, summary_builder
+from .models import ReportSnapshot
+from .snapshot import load_snapshot
+
+
+def add_board(n, prefix='B'):
+    """``n`` tickets across two teams, with overdue and blocked ones, PRs and a dependency chain."""
+    today = timezone.now().date()
+    teams = [Team.objects.create(name=f'{prefix} Team {i}') for i in range(2)]
+    members = [Member.objects.create(name=f'{prefix} Member {i}', team=teams[i % 2]) for i in range(4)]
+    statuses = ['TODO', 'IN_PROGRESS', 'IN_REVIEW', 'DONE', 'BLOCKED']
+    tickets = [
+        Ticket.objects.create(
+            key=f'{prefix}-{i}', title=f'{prefix} ticket {i}', status=statuses[i % 5],
+            assignee=members[i % 4], due_date=today + timedelta(days=i % 7 - 3),
+        )
+        for i in range(n)
+    ]
+    for a, b in zip(tickets, tickets[1:]):
+        Dependency.objects.create(ticket=a, depends_on=b)
+    for i, member in enumerate(members):
+        PullRequest.objects.create(repo='backend', title=f'{prefix} PR {i}', author=member, status='Merged')
+    return tickets
+
+
+class SnapshotReportTests(TestCase):
+    def test_report_queries_do_not_grow_with_the_board(self):
+        add_board(5, 'S')
+        with CaptureQueriesContext(connection) as small:
+            summary_builder.build_all_reports()
+        add_board(30, 'L')
+        with CaptureQueriesContext(connection) as large:
+            summary_builder.build_all_reports()
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_shared_snapshot_builds_the_same_reports(self):
+        add_board(12)
+        snap = load_snapshot()
+        for build in summary_builder.ALL_REPORTS.values():
+            self.assertEqual(build(snap), build())
+        self.assertTrue(summary_builder.analyze_risks(snap)['risks'])
+
+
+class RewriteValidationTests(TestCase):
+    def post(self, path, body):
+        return self.client.post(f'/api/reports/{path}', body, content_type='application/json')
+
+    def test_batch_rejects_non_string_fields_with_their_index(self):
+        response = self.post('rewrite/batch/', {'items': [{'text': 'ok'}, {'text': 123}]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['index'], 1)
+        response = self.post('rewrite/batch/', {'texts': ['a'], 'tones': ['client', ['x']]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['index'], 1)
+        self.assertEqual(self.post('rewrite/batch/', {'items': ['text']}).status_code, 400)
+        self.assertEqual(self.post('rewrite/batch/', ['text']).status_code, 400)
+
+    def test_batch_accepts_strings(self):
+        response = self.post('rewrite/batch/', {'items': [{'text': 'Fixed it', 'tone': 'technical'}, {}]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r['tone'] for r in response.json()['results']], ['technical', 'client'])
+
+    def test_single_rewrite_rejects_non_string_tone(self):
+        self.assertEqual(self.post('rewrite/', {'tone': ['x']}).status_code, 400)
+        self.assertEqual(self.post('rewrite/', {'text': {'a': 1}}).status_code, 400)
+        self.assertEqual(self.post('rewrite/', {'tone': 'executive', 'text': 'Done'}).status_code, 200)
+
+
+class JsonFallbackTests(TestCase):
+    def test_indexed_and_streamed_exports_agree(self):
+        indexed = (summary_builder._jira_digest(), summary_builder._slack_blockers(), summary_builder._last_commit())
+        clear_cache()
+        with override_settings(DATA_SOURCES_INDEX_MAX_BYTES=0):
+            streamed = (summary_builder._jira_digest(), summary_builder._slack_blockers(), summary_builder._last_commit())
+        clear_cache()
+        self.assertEqual(indexed, streamed)
+        self.assertTrue(indexed[0]["total"] and indexed[1] and indexed[2])
+
+
+class LiveDashboardTests(TestCase):
+    def test_live_read_is_tagged_with_the_last_change_event(self):
+        Ticket.objects.create(key='L-1', title='Live', status='TODO')
+        data = self.client.get('/api/reports/dashboard/', {'live': 1}).json()
+        self.assertEqual(data['as_of_event'], events.latest_id())
+        self.assertGreater(data['as_of_event'], 0)
+        self.assertNotIn('as_of_event', self.client.get('/api/reports/dashboard/').json())
+
+
+class PrecomputedReportTests(TestCase):
+    def test_stored_copy_is_served_until_the_board_changes(self):
+        precompute.precompute()
+        data, age = precompute.get_report("dashboard", summary_builder.get_dashboard_stats)
+        self.assertIsNotNone(age)
+        Ticket.objects.create(key='P-1', title='After the build', status='TODO')
+        data, age = precompute.get_report("dashboard", summary_builder.get_dashboard_stats)
+        self.assertIsNone(age)
+        self.assertEqual(data["total_tickets"], Ticket.objects.count())
+
+    def test_endpoint_serves_the_stored_copy_until_it_expires(self):
+        add_board(4)
+        call_command("precompute_reports", stdout=io.StringIO())
+        response = self.client.post("/api/reports/risk-analysis/")
+        self.assertEqual(response["X-Report-Source"], "precomputed")
+        self.assertEqual(response.json(), summary_builder.analyze_risks())
+        stale = timezone.now() - timedelta(seconds=precompute.config()["MAX_STALENESS"] + 1)
+        ReportSnapshot.objects.update(checked_at=stale)
+        self.assertEqual(self.client.post("/api/reports/risk-analysis/")["X-Report-Source"], "live")
+        # a run with no board change only marks the copies as checked again
+        out = io.StringIO()
+        call_command("precompute_reports", stdout=out)
+        self.assertIn("built 0,", out.getvalue())
+        self.assertEqual(self.client.post("/api/reports/risk-analysis/")["X-Report-Source"], "precomputed")
+
+    def test_serving_can_be_switched_off(self):
+        precompute.precompute()
+        with override_settings(REPORT_PRECOMPUTE={"SERVE": False}):
+            self.assertIsNone(precompute.get_report("dashboard", summary_builder.get_dashboard_stats)[1])
+
+
+class WeeklyReportTests(TestCase):
+    def test_completed_count_comes_from_the_snapshot(self):
+        ticket = Ticket.objects.create(key='W-1', title='Ship it', status='TODO')
+        snap = load_snapshot()
+        ticket.status = 'DONE'
+        ticket.save()
+        self.assertEqual(summary_builder.build_weekly_client(snap)["completed_this_week"], 0)
+        self.assertEqual(summary_builder.build_weekly_client()["completed_this_week"], 1)
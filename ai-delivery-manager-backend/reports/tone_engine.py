@@ -0,0 +1,87 @@
+"""Word-aware, single-pass tone rewriting.
+
+Each tone's replacement table is compiled once into one regular expression
+(longest terms first) and applied with a single ``re.sub`` pass. Terms only
+match as whole words, so "PR" no longer rewrites "PROJ-101" and "error" no
+longer rewrites "terror", and a replacement is never rewritten again by a
+later rule.
+"""
+import re
+
+
+CLIENT_REPLACEMENTS = [
+    ("IN_PROGRESS", "actively in development"),
+    ("BLOCKED", "pending resolution"),
+    ("DONE", "successfully completed"),
+    ("PR", "pull request"),
+    ("PRs", "pull requests"),
+    ("API", "integration layer"),
+    ("APIs", "integration layers"),
+    ("backend", "server infrastructure"),
+    ("frontend", "user interface"),
+    ("bug", "issue"),
+    ("bugs", "issues"),
+    ("error", "anomaly"),
+    ("errors", "anomalies"),
+    ("crash", "unexpected behaviour"),
+    ("crashes", "unexpected behaviour"),
+    ("fix", "resolve"),
+    ("fixes", "resolves"),
+    ("fixed", "resolved"),
+    ("fixing", "resolving"),
+]
+
+TECHNICAL_REPLACEMENTS = [
+    ("issue", "bug"),
+    ("issues", "bugs"),
+    ("resolve", "fix"),
+    ("resolves", "fixes"),
+    ("resolved", "fixed"),
+    ("resolving", "fixing"),
+]
+
+
+def _with_capitalized(pairs):
+    """Add "Bug" -> "Issue" style variants for lower-case terms."""
+    table = dict(pairs)
+    for term, replacement in pairs:
+        if term[:1].islower():
+            table.setdefault(term[:1].upper() + term[1:], replacement[:1].upper() + replacement[1:])
+    return table
+
+
+class ToneRules:
+    """A replacement table compiled into one word-boundary-aware pattern."""
+
+    def __init__(self, replacements):
+        self.table = _with_capitalized(replacements)
+        alternation = "|".join(re.escape(term) for term in sorted(self.table, key=len, reverse=True))
+        self.pattern = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)")
+
+    def apply(self, text):
+        return self.pattern.sub(lambda m: self.table[m.group(0)], text)
+
+
+def _executive_summary(text):
+    # Keep it short — truncate to the first 3 sentences
+    sentences = text.replace("  ", " ").split(". ")
+    result = ". ".join(sentences[:3]).strip()
+    if not result.endswith("."):
+        result += "."
+    return result
+
+
+_RULES = {
+    "client": ToneRules(CLIENT_REPLACEMENTS),
+    "technical": ToneRules(TECHNICAL_REPLACEMENTS),
+}
+
+
+def transform(tone, text):
+    """Rewrite ``text`` for ``tone``; unknown tones return it unchanged."""
+    rules = _RULES.get(tone)
+    if rules is not None:
+        return rules.apply(text)
+    if tone == "executive":
+        return _executive_summary(text)
+    return text
@@ -5,6 +5,12 @@ urlpatterns = [
     path("daily-standup/", views.daily_standup),
     path("weekly-client/", views.weekly_client),
     path("rewrite/", views.rewrite_summary),
+    path("rewrite/batch/", views.rewrite_batch),
     path("risk-analysis/", views.risk_analysis),
     path("dashboard/", views.dashboard_stats),
+    path("burndown/", views.burndown),
+    path("cumulative-flow/", views.cumulative_flow),
+    path("velocity/", views.velocity),
+    path("all/", views.all_reports),
+    path("cache-stats/", views.cache_stats),
 ]
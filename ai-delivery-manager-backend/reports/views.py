@@ -1,42 +1,233 @@
+from django.conf import settings
+from django.utils import timezone
 from django.shortcuts import render
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from rest_framework import status
 from . import summary_builder
+from .cache import cached_report, report_cache
+from .precompute import get_report, report_source
+from workboard import events, history
+from workboard.conditional import etag_for, not_modified, tag
+from datetime import date, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _report_response(data, age):
+    """Response for a report; precomputed copies carry their age in seconds."""
+    response = Response(data)
+    if age is not None:
+        response["Age"] = str(int(age))
+        response["X-Report-Source"] = "precomputed"
+    else:
+        response["X-Report-Source"] = "live"
+    return response
+
+
 @api_view(["POST"])
 def daily_standup(request):
     logger.info("Generating daily standup report")
-    data = summary_builder.build_daily_standup()
-    return Response(data)
+    return _report_response(*get_report("daily_standup", summary_builder.build_daily_standup))
 
 
 @api_view(["POST"])
 def weekly_client(request):
     logger.info("Generating weekly client report")
-    data = summary_builder.build_weekly_client()
-    return Response(data)
+    return _report_response(*get_report("weekly_client", summary_builder.build_weekly_client))
+
+
+def _rewrite_error(item):
+    """Why a ``{"text", "tone"}`` rewrite request is malformed, or None."""
+    if not isinstance(item, dict):
+        return "must be an object"
+    for field in ("text", "tone"):
+        if item.get(field) is not None and not isinstance(item[field], str):
+            return f"{field} must be a string"
+    return None
 
 
 @api_view(["POST"])
 def rewrite_summary(request):
-    tone = request.data.get("tone", "client")
-    text = request.data.get("text", "")
+    error = _rewrite_error(request.data)
+    if error:
+        return Response({"detail": f"Request body {error}"}, status=status.HTTP_400_BAD_REQUEST)
+    tone = request.data.get("tone") or "client"
+    text = request.data.get("text") or ""
     data = summary_builder.rewrite_summary(tone, text)
     return Response(data)
 
 
 @api_view(["POST"])
-def risk_analysis(request):
-    data = summary_builder.analyze_risks()
+def rewrite_batch(request):
+    """Rewrite many texts in one call.
+
+    Accepts ``{"items": [{"text": ..., "tone": ...}, ...]}`` or
+    ``{"texts": [...], "tones": [...]}`` (every text in every tone), plus an
+    optional ``"wrap": false`` to skip the tone prefix/suffix.
+    """
+    if not isinstance(request.data, dict):
+        return Response({"detail": "Expected an object with items or texts"}, status=status.HTTP_400_BAD_REQUEST)
+    items = request.data.get("items")
+    if items is None:
+        texts = request.data.get("texts") or []
+        tones = request.data.get("tones") or ["client"]
+        if not isinstance(texts, list) or not isinstance(tones, list):
+            return Response({"detail": "texts and tones must be lists"}, status=status.HTTP_400_BAD_REQUEST)
+        items = [{"text": text, "tone": tone} for text in texts for tone in tones]
+    if not isinstance(items, list):
+        return Response({"detail": "items must be a list of objects"}, status=status.HTTP_400_BAD_REQUEST)
+    if len(items) > settings.REWRITE_BATCH_MAX_ITEMS:
+        return Response(
+            {"detail": f"At most {settings.REWRITE_BATCH_MAX_ITEMS} items per batch"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    for i, item in enumerate(items):
+        error = _rewrite_error(item)
+        if error:
+            return Response({"detail": f"Item {i} {error}", "index": i}, status=status.HTTP_400_BAD_REQUEST)
+    wrap = request.data.get("wrap", True) not in (False, "false", "0")
+    return Response(summary_builder.rewrite_batch(items, wrap=wrap))
+
+
+@api_view(["POST"])
+def all_reports(request):
+    """Standup, weekly, risk and dashboard reports in one call.
+
+    All four are built from one shared snapshot. An optional ``"tone"``
+    (plus ``"text"``) adds the same rewrite ``/rewrite/`` would return.
+    """
+    error = _rewrite_error(request.data)
+    if error:
+        return Response({"detail": f"Request body {error}"}, status=status.HTTP_400_BAD_REQUEST)
+    data = dict(cached_report("all_reports", summary_builder.build_all_reports, settings.REPORTS_ALL_WORKERS))
+    tone = request.data.get("tone")
+    if tone:
+        data["rewrite"] = summary_builder.rewrite_summary(tone, request.data.get("text", ""))
     return Response(data)
 
 
+@api_view(["POST"])
+def risk_analysis(request):
+    return _report_response(*get_report("risk_analysis", summary_builder.analyze_risks))
+
+
+def _dashboard_for_team(team_id):
+    return summary_builder.get_dashboard_stats(team_id=team_id)
+
+
+# tries at a live dashboard read no change event lands in the middle of
+LIVE_READ_ATTEMPTS = 5
+
+
+def _live_dashboard(team_id):
+    """Build the dashboard straight from the tables, tagged with ``as_of_event``.
+
+    That is the last change event the totals include, so a client applying
+    ``counters`` deltas knows which ones are already counted. The read is
+    bracketed by the event log's high-water mark and retried while writes
+    land inside it; if they keep landing ``as_of_event`` is None.
+    """
+    for _ in range(LIVE_READ_ATTEMPTS):
+        before = events.latest_id()
+        data = _dashboard_for_team(team_id)
+        if data is None or events.latest_id() == before:
+            break
+    else:
+        before = None
+    if data is not None:
+        data["as_of_event"] = before
+    return data
+
+
 @api_view(["GET"])
 def dashboard_stats(request):
-    """Aggregate stats for the dashboard home page."""
-    data = summary_builder.get_dashboard_stats()
-    return Response(data)
+    """Aggregate stats for the dashboard home page (``?team=<id>`` to scope to one team).
+
+    ``?live=1`` skips the precomputed and cached copies; see ``_live_dashboard``.
+    """
+    team_id = request.query_params.get("team")
+    if team_id:
+        try:
+            team_id = int(team_id)
+        except ValueError:
+            return Response({"detail": "team must be an integer id"}, status=status.HTTP_400_BAD_REQUEST)
+    team_id = team_id or None
+    if request.query_params.get("live"):
+        data = _live_dashboard(team_id)
+        if data is None:
+            return Response({"detail": "Team not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(data)
+    version, load = report_source("dashboard", _dashboard_for_team, team_id, team_id=team_id)
+    etag = etag_for(request, version)
+    response = not_modified(request, etag)
+    if response is not None:
+        return response
+    data, age = load()
+    if data is None:
+        return Response({"detail": "Team not found"}, status=status.HTTP_404_NOT_FOUND)
+    return tag(_report_response(data, age), etag)
+
+
+# longest window the burndown / cumulative flow endpoints accept, in days
+MAX_HISTORY_DAYS = 366
+
+
+def _team_param(request):
+    team_id = request.query_params.get("team")
+    return int(team_id) if team_id else None
+
+
+def _window(request):
+    """``(start, end)`` from ``?start=&end=`` (ISO dates); the last 30 days by default."""
+    end = request.query_params.get("end")
+    end = date.fromisoformat(end) if end else timezone.now().date()
+    start = request.query_params.get("start")
+    start = date.fromisoformat(start) if start else end - timedelta(days=29)
+    if start > end or (end - start).days >= MAX_HISTORY_DAYS:
+        raise ValueError("bad window")
+    return start, end
+
+
+def _history_report(request, build):
+    try:
+        team_id = _team_param(request)
+        start, end = _window(request)
+    except ValueError:
+        return Response(
+            {"detail": f"team must be an integer id; start/end ISO dates at most {MAX_HISTORY_DAYS} days apart"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return Response(build(start, end, team_id))
+
+
+@api_view(["GET"])
+def burndown(request):
+    """Open tickets per day (``?team=&start=&end=``), read from the daily status rollups."""
+    return _history_report(request, history.burndown)
+
+
+@api_view(["GET"])
+def cumulative_flow(request):
+    """Tickets per status per day (``?team=&start=&end=``), read from the daily status rollups."""
+    return _history_report(request, history.cumulative_flow)
+
+
+@api_view(["GET"])
+def velocity(request):
+    """Tickets completed per week over the last ``?weeks=`` (default 8, at most 52) weeks."""
+    try:
+        team_id = _team_param(request)
+        weeks = int(request.query_params.get("weeks", 8))
+    except ValueError:
+        return Response({"detail": "team and weeks must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+    if not 1 <= weeks <= 52:
+        return Response({"detail": "weeks must be between 1 and 52"}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(history.velocity(weeks, team_id))
+
+
+@api_view(["GET"])
+def cache_stats(request):
+    """Hit/miss counters of the in-process report cache."""
+    return Response(report_cache.stats())
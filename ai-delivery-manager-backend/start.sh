@@ -11,4 +11,5 @@ python manage.py seed_workboard
 python manage.py augment_workboard
 
 echo ">>> Starting server..."
-exec gunicorn config.wsgi:application --bind 0.0.0.0:${PORT:-8000} --workers 2
+# ASGI workers so /api/workboard/events/ streams do not each hold a worker
+exec gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:${PORT:-8000} --workers 2
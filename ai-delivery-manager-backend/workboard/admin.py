@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Team, Member, Ticket, PullRequest, Dependency
+from .models import Team, Member, Ticket, PullRequest, Dependency, DashboardCounters, Commit
 
 @admin.register(Team)
 class TeamAdmin(admin.ModelAdmin):
@@ -22,6 +22,16 @@ class PRAdmin(admin.ModelAdmin):
     list_display = ('title', 'status', 'repo')
 
 
+@admin.register(Commit)
+class CommitAdmin(admin.ModelAdmin):
+    list_display = ('sha', 'repo', 'author', 'date')
+
+
 @admin.register(Dependency)
 class DependencyAdmin(admin.ModelAdmin):
     list_display = ('ticket', 'depends_on')
+
+
+@admin.register(DashboardCounters)
+class DashboardCountersAdmin(admin.ModelAdmin):
+    list_display = ('team', 'total_tickets', 'done', 'blocked', 'overdue', 'total_prs', 'total_members', 'updated_at')
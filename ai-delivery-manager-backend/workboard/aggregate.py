@@ -0,0 +1,149 @@
+"""Chunked builders for ``/api/workboard/aggregate/``.
+
+Tickets, PRs and blockers are read in keyset-ordered chunks (``id > last``),
+each chunk with its assignees and PRs loaded eagerly, so the full response
+can be streamed with flat memory or served page by page. With ``fast=True``
+rows come from ``values()`` projections instead of the serializers (same
+output).
+"""
+import json
+
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import Dependency, PullRequest, Ticket
+from . import projections
+from .pagination import decode_cursor, encode_cursor
+from .renderers import dumps
+from .serializers import PullRequestSerializer, TicketSerializer
+
+
+SECTIONS = ('tickets', 'prs', 'blockers')
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _ticket_chunk(after, chunk_size, fast):
+    qs = Ticket.objects.filter(id__gt=after).order_by('id')
+    if fast:
+        values = projections.ticket_values(qs[:chunk_size])
+        return list(zip((v['id'] for v in values), projections.ticket_rows(values)))
+    chunk = list(qs.select_related('assignee').prefetch_related('prs')[:chunk_size])
+    return list(zip((t.id for t in chunk), TicketSerializer(chunk, many=True).data))
+
+
+def _pr_chunk(after, chunk_size, fast):
+    qs = PullRequest.objects.filter(id__gt=after).order_by('id')[:chunk_size]
+    if fast:
+        return [(row['id'], row) for row in projections.pr_rows(qs)]
+    chunk = list(qs)
+    return list(zip((pr.id for pr in chunk), PullRequestSerializer(chunk, many=True).data))
+
+
+def _chunks(read_chunk):
+    def chunks(after=0, chunk_size=DEFAULT_CHUNK_SIZE, fast=False):
+        while True:
+            chunk = read_chunk(after, chunk_size, fast)
+            if not chunk:
+                return
+            yield chunk
+            after = chunk[-1][0]
+    return chunks
+
+
+_ticket_chunks = _chunks(_ticket_chunk)
+_pr_chunks = _chunks(_pr_chunk)
+
+
+def _blocker_chunks(after=0, chunk_size=DEFAULT_CHUNK_SIZE, fast=False):
+    """Tickets with at least one dependency, with the depended-on keys as reason."""
+    while True:
+        tickets = list(
+            Ticket.objects.filter(id__gt=after, dependencies__isnull=False).distinct()
+            .order_by('id').values_list('id', 'key', 'title')[:chunk_size]
+        )
+        if not tickets:
+            return
+        reasons = {}
+        edges = Dependency.objects.filter(ticket_id__in=[t[0] for t in tickets]).order_by('id')
+        for ticket_id, dep_key in edges.values_list('ticket_id', 'depends_on__key'):
+            reasons.setdefault(ticket_id, []).append(dep_key)
+        yield [
+            (tid, {"key": key, "title": title, "reason": ", ".join(reasons.get(tid, []))})
+            for tid, key, title in tickets
+        ]
+        after = tickets[-1][0]
+
+
+_CHUNKERS = {
+    'tickets': _ticket_chunks,
+    'prs': _pr_chunks,
+    'blockers': _blocker_chunks,
+}
+
+
+def build_aggregate(chunk_size=DEFAULT_CHUNK_SIZE, fast=False):
+    """Whole aggregate as one dict (the original non-streaming response)."""
+    return {
+        section: [row for chunk in _CHUNKERS[section](chunk_size=chunk_size, fast=fast) for _, row in chunk]
+        for section in SECTIONS
+    }
+
+
+def _dumps(obj):
+    # same output as DRF's JSONRenderer (compact, unicode, JS line separators escaped)
+    ret = json.dumps(obj, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'))
+    return ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
+
+def stream_aggregate(chunk_size=DEFAULT_CHUNK_SIZE, fast=False):
+    """Yield the aggregate as UTF-8 JSON fragments, one chunk of rows at a time."""
+    yield b'{'
+    for i, section in enumerate(SECTIONS):
+        yield (',' if i else '').encode() + f'"{section}":['.encode()
+        first = True
+        for chunk in _CHUNKERS[section](chunk_size=chunk_size, fast=fast):
+            if fast:
+                body = b','.join(dumps(row) for _, row in chunk)
+            else:
+                body = ','.join(_dumps(row) for _, row in chunk).encode('utf-8')
+            yield (b',' if not first else b'') + body
+            first = False
+        yield b']'
+    yield b'}'
+
+
+def encode_aggregate_cursor(section, after):
+    return encode_cursor({'s': section, 'a': after})
+
+
+def decode_aggregate_cursor(cursor):
+    """Return ``(section, after_id)``; raises ValueError on a malformed cursor."""
+    position = decode_cursor(cursor)
+    try:
+        section, after = position['s'], int(position['a'])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError('invalid cursor') from exc
+    if section not in SECTIONS:
+        raise ValueError('invalid cursor')
+    return section, after
+
+
+def aggregate_page(cursor=None, limit=DEFAULT_CHUNK_SIZE, fast=False):
+    """One page of the aggregate holding up to ``limit`` rows across sections.
+
+    Sections are walked in order (tickets, then PRs, then blockers), so a
+    client that concatenates each section's rows across pages rebuilds the
+    full aggregate. ``next_cursor`` is None on the last page.
+    """
+    section, after = decode_aggregate_cursor(cursor) if cursor else (SECTIONS[0], 0)
+    page = {s: [] for s in SECTIONS}
+    remaining = limit
+    for s in SECTIONS[SECTIONS.index(section):]:
+        start = after if s == section else 0
+        chunk = next(_CHUNKERS[s](after=start, chunk_size=remaining, fast=fast), [])
+        page[s].extend(row for _, row in chunk)
+        remaining -= len(chunk)
+        if remaining == 0:
+            page['next_cursor'] = encode_aggregate_cursor(s, chunk[-1][0])
+            return page
+    page['next_cursor'] = None
+    return page
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WorkboardConfig(AppConfig):
     default_auto_field = 'django.db.models.AutoField'
     name = 'workboard'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,272 @@
+"""Set-based ticket mutations for ``/api/workboard/tickets/bulk/``.
+
+``apply_operations`` takes a list of ``create`` / ``update`` / ``delete``
+operations, validates all of them against one lookup each for the tickets,
+members and PRs they mention, and writes the valid ones in one transaction
+with ``bulk_create`` / ``bulk_update``. Per-row model signals are bypassed;
+dashboard counters, change events, the data generation and the dependency
+graph are brought up to date once for the whole batch.
+"""
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from . import counters, events, history, signals
+from .generation import bump_generation
+from .graph import graph_index
+from .models import Member, PullRequest, Ticket
+
+OPS = ('create', 'update', 'delete')
+EDITABLE = ('title', 'description', 'status', 'priority', 'due_date')
+Link = Ticket.prs.through
+
+
+def _int_list(value):
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    return [int(v) for v in value]
+
+
+def _clean_fields(op, errors):
+    values = {}
+    for name in EDITABLE:
+        if name not in op:
+            continue
+        try:
+            values[name] = Ticket._meta.get_field(name).clean(op[name], None)
+        except ValidationError as exc:
+            errors[name] = exc.messages[0]
+    return values
+
+
+class _Batch:
+    def __init__(self, operations):
+        self.operations = operations
+        self.results = [None] * len(operations)
+        self.parsed = [None] * len(operations)
+
+    def fail(self, index, errors):
+        self.results[index] = {'index': index, 'ok': False, 'errors': errors}
+
+    def failed(self):
+        return any(r is not None for r in self.results)
+
+    def rejected(self):
+        """Results of a batch that is not applied: valid operations are marked ok but unwritten."""
+        for index, item in enumerate(self.parsed):
+            if item is not None:
+                self.results[index] = {'index': index, 'ok': True, 'op': item['op']}
+        return self.results
+
+    def parse(self):
+        """Shape-check every operation and collect the ids they reference."""
+        ticket_ids, member_ids, pr_ids = set(), set(), set()
+        for index, op in enumerate(self.operations):
+            if not isinstance(op, dict) or op.get('op') not in OPS:
+                self.fail(index, {'op': f"Must be one of: {', '.join(OPS)}"})
+                continue
+            errors = {}
+            item = {'op': op['op'], 'fields': {}}
+            if op['op'] != 'create':
+                try:
+                    item['id'] = int(op.get('id'))
+                    ticket_ids.add(item['id'])
+                except (TypeError, ValueError):
+                    errors['id'] = 'A ticket id is required.'
+            if op['op'] != 'delete':
+                item['fields'] = _clean_fields(op, errors)
+                if op['op'] == 'create' and 'title' not in op:
+                    errors['title'] = 'This field is required.'
+                if 'assignee' in op:
+                    try:
+                        item['assignee'] = int(op['assignee']) if op['assignee'] not in (None, '') else None
+                        member_ids.add(item['assignee'])
+                    except (TypeError, ValueError):
+                        errors['assignee'] = 'Must be a member id or null.'
+                for key in ('pr_ids', 'unlink_pr_ids'):
+                    try:
+                        item[key] = _int_list(op.get(key))
+                    except (TypeError, ValueError):
+                        errors[key] = 'Must be a list of PR ids.'
+                        continue
+                    pr_ids.update(item[key])
+                if 'pr_id' in op and op['pr_id']:
+                    try:
+                        item['pr_ids'] = item.get('pr_ids', []) + [int(op['pr_id'])]
+                        pr_ids.add(int(op['pr_id']))
+                    except (TypeError, ValueError):
+                        errors['pr_id'] = 'Must be a PR id.'
+            if errors:
+                self.fail(index, errors)
+            else:
+                self.parsed[index] = item
+        member_ids.discard(None)
+        return ticket_ids, member_ids, pr_ids
+
+    def resolve(self, tickets, member_teams, known_prs):
+        """Check references against the looked-up rows, in operation order."""
+        deleted = set()
+        for index, item in enumerate(self.parsed):
+            if item is None:
+                continue
+            errors = {}
+            if 'id' in item:
+                if item['id'] not in tickets:
+                    errors['id'] = f"Ticket {item['id']} does not exist."
+                elif item['id'] in deleted:
+                    errors['id'] = f"Ticket {item['id']} is deleted earlier in this batch."
+            if item.get('assignee') is not None and item['assignee'] not in member_teams:
+                errors['assignee'] = f"Member {item['assignee']} does not exist."
+            missing = sorted(set(item.get('pr_ids', []) + item.get('unlink_pr_ids', [])) - known_prs)
+            if missing:
+                errors['pr_ids'] = f"Unknown PR ids: {', '.join(map(str, missing))}"
+            if errors:
+                self.parsed[index] = None
+                self.fail(index, errors)
+            elif item['op'] == 'delete':
+                deleted.add(item['id'])
+
+
+def apply_operations(operations, new_keys, atomic=True):
+    """Validate and apply ``operations``; returns ``(results, applied)``.
+
+    ``new_keys(n)`` returns ``n`` fresh ticket keys. With ``atomic`` a
+    single invalid operation means nothing is written; otherwise the valid
+    ones are applied and the invalid ones reported.
+    """
+    batch = _Batch(operations)
+    ticket_ids, member_ids, pr_ids = batch.parse()
+    # keys come from the caller's key block, taken outside the transaction
+    creates = sum(1 for item in batch.parsed if item and item['op'] == 'create')
+    created_keys = [] if atomic and batch.failed() else new_keys(creates)
+    with transaction.atomic():
+        # read the current rows inside the write transaction (and lock them
+        # where the backend supports it), so bulk_update and the counter
+        # deltas never work from a state another writer has since changed
+        tickets = (
+            Ticket.objects.select_for_update(of=('self',))
+            .annotate(old_team=F('assignee__team_id')).in_bulk(ticket_ids)
+        )
+        member_teams = dict(Member.objects.filter(id__in=member_ids).values_list('id', 'team_id'))
+        known_prs = set(PullRequest.objects.filter(id__in=pr_ids).values_list('id', flat=True))
+        batch.resolve(tickets, member_teams, known_prs)
+        if atomic and batch.failed():
+            return batch.rejected(), False
+        _write(batch, tickets, member_teams, iter(created_keys))
+    return batch.results, True
+
+
+def _write(batch, tickets, member_teams, keys):
+    now = timezone.now()
+    old_state = {
+        t.id: (t.old_team, t.status, t.due_date, t.assignee_id) for t in tickets.values()
+    }
+    created, updated, deleted = [], {}, {}
+    links_add, links_remove = {}, {}
+    update_fields = set()
+
+    for index, item in enumerate(batch.parsed):
+        if item is None:
+            continue
+        if item['op'] == 'delete':
+            deleted[item['id']] = tickets[item['id']]
+            updated.pop(item['id'], None)
+            continue
+        if item['op'] == 'create':
+            ticket = Ticket(key=next(keys), **item['fields'])
+            if 'assignee' in item:
+                ticket.assignee_id = item['assignee']
+            created.append((index, ticket, item))
+            continue
+        ticket = tickets[item['id']]
+        for name, value in item['fields'].items():
+            setattr(ticket, name, value)
+        update_fields.update(item['fields'])
+        if 'assignee' in item:
+            ticket.assignee_id = item['assignee']
+            update_fields.add('assignee')
+        ticket.updated_at = now
+        updated[ticket.id] = ticket
+        if item.get('pr_ids'):
+            links_add.setdefault(ticket.id, set()).update(item['pr_ids'])
+        if item.get('unlink_pr_ids'):
+            links_remove.setdefault(ticket.id, set()).update(item['unlink_pr_ids'])
+        batch.results[index] = {'index': index, 'ok': True, 'op': 'update', 'id': ticket.id}
+
+    if created:
+        Ticket.objects.bulk_create([t for _, t, _ in created])
+        for index, ticket, item in created:
+            if item.get('pr_ids'):
+                links_add.setdefault(ticket.id, set()).update(item['pr_ids'])
+            batch.results[index] = {'index': index, 'ok': True, 'op': 'create', 'id': ticket.id}
+    if updated:
+        Ticket.objects.bulk_update(list(updated.values()), sorted(update_fields | {'updated_at'}))
+    if deleted:
+        with signals.muted():
+            Ticket.objects.filter(id__in=list(deleted)).delete()
+        transaction.on_commit(graph_index.invalidate)
+        for index, item in enumerate(batch.parsed):
+            if item and item['op'] == 'delete':
+                batch.results[index] = {'index': index, 'ok': True, 'op': 'delete', 'id': item['id']}
+
+    for ticket_id in deleted:
+        links_add.pop(ticket_id, None)
+        links_remove.pop(ticket_id, None)
+    for ticket_id, pr_ids in links_remove.items():
+        pr_ids -= links_add.get(ticket_id, set())
+    links_remove = {t: p for t, p in links_remove.items() if p}
+    if links_add:
+        Link.objects.bulk_create(
+            [Link(ticket_id=t, pullrequest_id=p) for t, prs in links_add.items() for p in sorted(prs)],
+            ignore_conflicts=True,
+        )
+    if links_remove:
+        q = Q()
+        for ticket_id, pr_ids in links_remove.items():
+            q |= Q(ticket_id=ticket_id, pullrequest_id__in=pr_ids)
+        Link.objects.filter(q).delete()
+
+    for index, ticket, _ in created:
+        batch.results[index]['key'] = ticket.key
+    for result in batch.results:
+        if result and result.get('op') in ('update', 'delete'):
+            result['key'] = tickets[result['id']].key
+
+    _after_write(created, updated, deleted, old_state, member_teams, links_add, links_remove)
+
+
+def _after_write(created, updated, deleted, old_state, member_teams, links_add, links_remove):
+    """Counters, change events and the data generation for the whole batch."""
+    def team_of(member_id):
+        return member_teams.get(member_id) if member_id is not None else None
+
+    changes, ticket_events = [], []
+    for _, ticket, _ in created:
+        changes.append((ticket.id, None, (team_of(ticket.assignee_id), ticket.status, ticket.due_date)))
+        ticket_events.append(events.ticket_event(ticket, 'created'))
+    for ticket in updated.values():
+        old = old_state[ticket.id]
+        team = team_of(ticket.assignee_id) if ticket.assignee_id != old[3] else old[0]
+        changes.append((ticket.id, old[:3], (team, ticket.status, ticket.due_date)))
+        changed = [f for f, before in (('status', old[1]), ('assignee_id', old[3])) if getattr(ticket, f) != before]
+        if changed:
+            ticket_events.append(events.ticket_event(ticket, 'updated', changed))
+    for ticket in deleted.values():
+        changes.append((ticket.id, old_state[ticket.id][:3], None))
+        ticket_events.append(events.ticket_event(ticket, 'deleted'))
+
+    counters.tickets_changed([(old, new) for _, old, new in changes])
+    history.tickets_changed([
+        (ticket_id, old and old[:2], new and new[:2]) for ticket_id, old, new in changes
+    ])
+    events.publish_many('ticket', ticket_events)
+    events.publish_many('pr_link', [
+        {'action': action, 'ticket_ids': [ticket_id], 'pr_ids': sorted(pr_ids)}
+        for action, links in (('added', links_add), ('removed', links_remove))
+        for ticket_id, pr_ids in links.items()
+    ])
+    if created or updated or deleted or links_add or links_remove:
+        bump_generation()
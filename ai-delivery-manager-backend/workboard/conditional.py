@@ -0,0 +1,57 @@
+"""Conditional GET (ETag / 304) for workboard and report reads.
+
+Every workboard write bumps the data generation in the same transaction,
+so the generation, the URL and the requested representation together name a
+response body. ``conditional_on_generation`` reads the generation (one
+primary-key lookup) before anything else and answers a matching
+``If-None-Match`` with ``304 Not Modified`` without running the view.
+The generation is read before the body is built, so a tag is never newer
+than the body it is sent with.
+"""
+from functools import wraps
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from .generation import current_generation
+
+
+def etag_for(request, version):
+    """Strong ETag for ``version`` of the resource at this URL and ``Accept``."""
+    key = f"{request.get_full_path()}\n{request.META.get('HTTP_ACCEPT', '')}\n{version}"
+    return '"%s"' % hashlib.blake2b(key.encode(), digest_size=12).hexdigest()
+
+
+def not_modified(request, etag):
+    """A 304 (or 412 for a failed ``If-Match``) response, or None to build the body."""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        tag(response, etag)
+    return response
+
+
+def tag(response, etag):
+    """Attach ``etag`` and make clients revalidate before reusing the body."""
+    response["ETag"] = etag
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def conditional_on_generation(view):
+    """Decorate a function view so GETs revalidate against the data generation.
+
+    Goes below ``@api_view``; non-GET methods pass straight through.
+    """
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return view(request, *args, **kwargs)
+        etag = etag_for(request, current_generation())
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200:
+            tag(response, etag)
+        return response
+    return wrapped
@@ -0,0 +1,240 @@
+"""Incremental maintenance of the materialized ``DashboardCounters`` rows.
+
+Every ticket, PR and member write adjusts the board-wide row (``team`` NULL)
+and the row of the team the object belongs to with ``F()`` increments, so the
+dashboard can read its totals from a single row. Bulk writes that bypass model
+signals (``QuerySet.update``, ``bulk_create``) should be followed by
+``rebuild_counters()``, which is also what ``rebuild_dashboard_counters`` runs.
+"""
+from django.db import transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.utils import timezone
+
+from . import events
+from .models import DashboardCounters, Member, PullRequest, Team, Ticket
+
+
+# Ticket status -> counter column. Statuses outside this map only count
+# towards ``total_tickets``.
+STATUS_FIELDS = {
+    'TODO': 'todo',
+    'IN_PROGRESS': 'in_progress',
+    'IN_REVIEW': 'in_review',
+    'DONE': 'done',
+    'BLOCKED': 'blocked',
+}
+
+# PR status -> counter column (matched exactly, as the dashboard always has).
+PR_STATUS_FIELDS = {
+    'OPEN': 'open_prs',
+    'MERGED': 'merged_prs',
+}
+
+COUNTER_FIELDS = (
+    'total_tickets', 'todo', 'in_progress', 'in_review', 'done', 'blocked',
+    'overdue', 'total_prs', 'open_prs', 'merged_prs', 'total_members',
+)
+
+
+def _today():
+    return timezone.now().date()
+
+
+def _scope_filter(team_id):
+    # board-wide row plus the team row, if any
+    q = Q(team__isnull=True)
+    if team_id is not None:
+        q |= Q(team_id=team_id)
+    return q
+
+
+def member_team_id(member_id):
+    if member_id is None:
+        return None
+    return Member.objects.filter(pk=member_id).values_list('team_id', flat=True).first()
+
+
+def ticket_contribution(status, due_date, today):
+    """Counter values a single ticket contributes."""
+    out = {'total_tickets': 1}
+    field = STATUS_FIELDS.get(status)
+    if field:
+        out[field] = 1
+    if status != 'DONE' and due_date is not None and due_date < today:
+        out['overdue'] = 1
+    return out
+
+
+def pr_contribution(status):
+    out = {'total_prs': 1}
+    field = PR_STATUS_FIELDS.get(status)
+    if field:
+        out[field] = 1
+    return out
+
+
+def apply_delta(team_id, delta):
+    """Add ``delta`` (field -> int) to the board-wide row and ``team_id``'s row."""
+    apply_deltas({team_id: delta})
+
+
+def apply_deltas(by_team):
+    """``apply_delta`` for several teams (team id -> delta) with one UPDATE.
+
+    The board-wide row takes the sum of all deltas; one ``counters`` event
+    is published per team, as ``apply_delta`` would.
+    """
+    by_team = {team_id: {k: v for k, v in delta.items() if v} for team_id, delta in by_team.items()}
+    by_team = {team_id: delta for team_id, delta in by_team.items() if delta}
+    if not by_team:
+        return
+    teams = [team_id for team_id in by_team if team_id is not None]
+    if len(by_team) == 1:
+        (team_id, delta), = by_team.items()
+        updates = {k: F(k) + v for k, v in delta.items()}
+    else:
+        board = {}
+        for delta in by_team.values():
+            for k, v in delta.items():
+                board[k] = board.get(k, 0) + v
+        updates = {
+            k: F(k) + Case(
+                When(team__isnull=True, then=Value(board[k])),
+                *(When(team_id=t, then=Value(by_team[t][k])) for t in teams if by_team[t].get(k)),
+                default=Value(0),
+            )
+            for k in board
+        }
+    DashboardCounters.objects.filter(Q(team__isnull=True) | Q(team_id__in=teams)).update(**updates)
+    events.publish_many('counters', [{'team_id': team_id, 'delta': delta} for team_id, delta in by_team.items()])
+
+
+def _changed(changes, contribution):
+    # (old, new) state pairs -> summed deltas per team, applied in one UPDATE
+    by_team = {}
+    for old, new in changes:
+        for state, sign in ((old, -1), (new, 1)):
+            if state is None:
+                continue
+            delta = by_team.setdefault(state[0], {})
+            for field, n in contribution(state).items():
+                delta[field] = delta.get(field, 0) + sign * n
+    apply_deltas(by_team)
+
+
+def ticket_changed(old, new):
+    """Apply the change of a ticket from ``old`` to ``new`` state.
+
+    Both are ``(team_id, status, due_date)`` tuples or ``None`` for
+    created/deleted tickets.
+    """
+    tickets_changed([(old, new)])
+
+
+def tickets_changed(changes):
+    """``ticket_changed`` for many tickets at once.
+
+    ``changes`` holds ``(old, new)`` pairs; the deltas are summed per team and
+    every affected counter row is updated by one statement.
+    """
+    today = refresh_overdue()
+    _changed(changes, lambda state: ticket_contribution(state[1], state[2], today))
+
+
+def pr_changed(old, new):
+    """Same as ``ticket_changed`` for PRs, with ``(team_id, status)`` tuples."""
+    _changed([(old, new)], lambda state: pr_contribution(state[1]))
+
+
+def _compute(team_ids, today):
+    """Aggregate counter values from scratch.
+
+    Returns ``{scope: {field: value}}`` where scope is ``None`` for the
+    board-wide row or a team id.
+    """
+    want_all = team_ids is None
+    scopes = {None: dict.fromkeys(COUNTER_FIELDS, 0)}
+    for tid in (Team.objects.values_list('id', flat=True) if want_all else team_ids):
+        scopes[tid] = dict.fromkeys(COUNTER_FIELDS, 0)
+
+    def add(team_id, field, n):
+        scopes[None][field] += n
+        if team_id in scopes and team_id is not None:
+            scopes[team_id][field] += n
+
+    for row in Ticket.objects.order_by().values('assignee__team_id', 'status').annotate(n=Count('id')):
+        add(row['assignee__team_id'], 'total_tickets', row['n'])
+        field = STATUS_FIELDS.get(row['status'])
+        if field:
+            add(row['assignee__team_id'], field, row['n'])
+    overdue_qs = Ticket.objects.exclude(status='DONE').filter(due_date__lt=today)
+    for row in overdue_qs.order_by().values('assignee__team_id').annotate(n=Count('id')):
+        add(row['assignee__team_id'], 'overdue', row['n'])
+    for row in PullRequest.objects.order_by().values('author__team_id', 'status').annotate(n=Count('id')):
+        add(row['author__team_id'], 'total_prs', row['n'])
+        field = PR_STATUS_FIELDS.get(row['status'])
+        if field:
+            add(row['author__team_id'], field, row['n'])
+    for row in Member.objects.order_by().values('team_id').annotate(n=Count('id')):
+        add(row['team_id'], 'total_members', row['n'])
+    return scopes
+
+
+def rebuild_counters(team_ids=None):
+    """Recompute counter rows from the source tables.
+
+    With ``team_ids`` only those team rows are rewritten (the board-wide row is
+    left alone); otherwise every row is rebuilt and orphans are removed.
+    """
+    today = _today()
+    scopes = _compute(team_ids, today)
+    if team_ids is not None:
+        scopes.pop(None)
+    with transaction.atomic():
+        for team_id, values in scopes.items():
+            DashboardCounters.objects.update_or_create(
+                team_id=team_id, defaults={**values, 'overdue_as_of': today},
+            )
+        if team_ids is None:
+            # rows for teams that no longer exist; a missing row is rebuilt on first use
+            rebuilt = [team_id for team_id in scopes if team_id is not None]
+            DashboardCounters.objects.filter(team__isnull=False).exclude(team_id__in=rebuilt).delete()
+        events.publish('counters_rebuilt', {'team_ids': team_ids})
+    return scopes
+
+
+def refresh_overdue(today=None):
+    """Recompute overdue counts on rows whose ``overdue_as_of`` is stale."""
+    today = today or _today()
+    if not DashboardCounters.objects.exclude(overdue_as_of=today).exists():
+        return today
+    overdue_qs = Ticket.objects.exclude(status='DONE').filter(due_date__lt=today)
+    by_team = dict(overdue_qs.order_by().values('assignee__team_id').annotate(n=Count('id')).values_list('assignee__team_id', 'n'))
+    with transaction.atomic():
+        for row in DashboardCounters.objects.select_for_update().exclude(overdue_as_of=today):
+            if row.team_id is None:
+                row.overdue = sum(by_team.values())
+            else:
+                row.overdue = by_team.get(row.team_id, 0)
+            row.overdue_as_of = today
+            row.save(update_fields=['overdue', 'overdue_as_of', 'updated_at'])
+        events.publish('counters_rebuilt', {'team_ids': None})
+    return today
+
+
+def get_counters(team_id=None):
+    """Return the counters row for ``team_id`` (board-wide when None).
+
+    Missing rows are built on first use; an up-to-date row costs one query.
+    """
+    row = DashboardCounters.objects.filter(team_id=team_id).first() if team_id is not None \
+        else DashboardCounters.objects.filter(team__isnull=True).first()
+    if row is None:
+        if team_id is not None and not Team.objects.filter(pk=team_id).exists():
+            return None
+        rebuild_counters(None if team_id is None else [team_id])
+        return get_counters(team_id)
+    if row.overdue_as_of != _today():
+        refresh_overdue()
+        row.refresh_from_db()
+    return row
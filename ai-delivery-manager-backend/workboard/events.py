@@ -0,0 +1,226 @@
+"""Workboard change events for the server-sent events stream.
+
+Signal handlers ``publish()`` small events (ticket status/assignee changes,
+PR links, dependency edges, dashboard counter deltas) into the
+``ChangeEvent`` table inside the writer's transaction. A rolled-back write
+therefore never emits anything, and every web process reads the same
+ordered log.
+
+``/api/workboard/events/`` streams the log. Under ASGI one poller per
+process reads new rows and fans them out to every connected client, so the
+database cost does not grow with the number of open tabs; a client more
+than ``QUEUE_SIZE`` events behind is sent a ``resync`` instead of its
+backlog. Under WSGI each stream polls on its own and holds a worker for as
+long as it is open.
+"""
+import asyncio
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import ChangeEvent
+
+
+def config():
+    return {
+        "ENABLED": True, "MAX_EVENTS": 10000, "POLL_INTERVAL": 1.0, "HEARTBEAT": 15, "QUEUE_SIZE": 1000,
+        **getattr(settings, "WORKBOARD_EVENTS", {}),
+    }
+
+
+_PRUNE_EVERY = 500
+
+_state = threading.local()
+
+
+@contextmanager
+def batched():
+    """Hold the events published in this thread and INSERT them together on exit.
+
+    For handlers that publish several events per write (a ticket event plus
+    its counter deltas). Nested blocks flush with the outermost one; nothing
+    is written if the block raises.
+    """
+    outer = getattr(_state, 'pending', None)
+    if outer is not None:
+        yield
+        return
+    _state.pending = []
+    try:
+        yield
+        pending = _state.pending
+    finally:
+        _state.pending = None
+    _insert(pending)
+
+
+def _insert(rows):
+    """INSERT ``(kind, data)`` rows in one statement, pruning the log now and then."""
+    if not rows:
+        return
+    pending = getattr(_state, 'pending', None)
+    if pending is not None:
+        pending.extend(rows)
+        return
+    created = ChangeEvent.objects.bulk_create([ChangeEvent(kind=kind, data=data) for kind, data in rows])
+    last = created[-1].id
+    if last is not None and (last - len(created)) // _PRUNE_EVERY != last // _PRUNE_EVERY:
+        ChangeEvent.objects.filter(id__lte=last - config()["MAX_EVENTS"]).delete()
+
+
+def publish(kind, data):
+    """Append an event; call from inside the write it describes."""
+    if config()["ENABLED"]:
+        _insert([(kind, data)])
+
+
+def ticket_event(ticket, action, changed=()):
+    """Payload of a ``ticket`` event."""
+    return {
+        'action': action, 'id': ticket.pk, 'key': ticket.key, 'status': ticket.status,
+        'assignee_id': ticket.assignee_id, 'changed': list(changed),
+    }
+
+
+def publish_many(kind, items):
+    """``publish`` several events of one kind with a single INSERT."""
+    if items and config()["ENABLED"]:
+        _insert([(kind, data) for data in items])
+
+
+def latest_id():
+    return ChangeEvent.objects.order_by("-id").values_list("id", flat=True).first() or 0
+
+
+def events_after(after, limit=500):
+    return list(ChangeEvent.objects.filter(id__gt=after).order_by("id").values("id", "kind", "data")[:limit])
+
+
+def format_event(event):
+    data = json.dumps(event["data"], cls=JSONEncoder, separators=(",", ":"))
+    return f"id: {event['id']}\nevent: {event['kind']}\ndata: {data}\n\n".encode()
+
+
+# --- ASGI: one poller per process ---------------------------------------------
+
+class EventHub:
+    """Polls ``ChangeEvent`` once per interval and fans rows out to subscribers."""
+
+    def __init__(self):
+        self.subscribers = set()
+        self.last_id = None
+        self._task = None
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=config()["QUEUE_SIZE"])
+        self.subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+
+    async def _poll(self):
+        fetch = sync_to_async(_fetch_after, thread_sensitive=False)
+        if self.last_id is None:
+            self.last_id = await sync_to_async(_latest_id, thread_sensitive=False)()
+        while self.subscribers:
+            for event in await fetch(self.last_id):
+                self.last_id = event["id"]
+                for queue in list(self.subscribers):
+                    _offer(queue, event)
+            await asyncio.sleep(config()["POLL_INTERVAL"])
+        self.last_id = None
+
+
+def _offer(queue, event):
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        # the client has fallen behind: drop its backlog and have it reload
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait({"id": event["id"], "kind": "resync", "data": {"source": "overflow"}})
+
+
+def _fetch_after(after):
+    close_old_connections()
+    return events_after(after)
+
+
+def _latest_id():
+    close_old_connections()
+    return latest_id()
+
+
+_hubs = {}
+
+
+def _hub():
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        _hubs.clear()  # a new loop means the old one has gone away
+        hub = _hubs[loop] = EventHub()
+    return hub
+
+
+async def stream_async(after):
+    """Async SSE byte stream of events newer than ``after`` (None = from now)."""
+    hub = _hub()
+    # subscribe before reading the backlog, so nothing falls between the two
+    queue = hub.subscribe()
+    try:
+        yield b"retry: 3000\n\n"
+        if after is None:
+            after = await sync_to_async(_latest_id, thread_sensitive=False)()
+        else:
+            while True:
+                backlog = await sync_to_async(_fetch_after, thread_sensitive=False)(after)
+                for event in backlog:
+                    yield format_event(event)
+                    after = event["id"]
+                if len(backlog) < 500:
+                    break
+        heartbeat = config()["HEARTBEAT"]
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield b": keep-alive\n\n"
+                continue
+            if event["id"] > after:
+                yield format_event(event)
+                after = event["id"]
+    finally:
+        hub.unsubscribe(queue)
+
+
+# --- WSGI: each stream polls --------------------------------------------------
+
+def stream_sync(after):
+    """Blocking SSE byte stream for WSGI servers."""
+    yield b"retry: 3000\n\n"
+    if after is None:
+        after = latest_id()
+    interval = config()["POLL_INTERVAL"]
+    heartbeat = config()["HEARTBEAT"]
+    quiet_since = time.monotonic()
+    while True:
+        events = events_after(after)
+        for event in events:
+            yield format_event(event)
+            after = event["id"]
+        if events:
+            quiet_since = time.monotonic()
+        elif time.monotonic() - quiet_since >= heartbeat:
+            yield b": keep-alive\n\n"
+            quiet_since = time.monotonic()
+        time.sleep(interval)
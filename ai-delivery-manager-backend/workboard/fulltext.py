@@ -0,0 +1,114 @@
+"""Full-text search over tickets and pull requests (``/api/workboard/search/``).
+
+``workboard_search`` is an SQLite FTS5 table over ticket keys, titles and
+descriptions and PR titles, maintained by triggers (migration 0008), so it
+also follows bulk writes and ``QuerySet.update``. Every word of the query
+must match and the last one matches as a prefix, which suits search-as-you-
+type; results are ordered by bm25 with key matches weighted over title over
+description. A query matching more than ``WORKBOARD_SEARCH_RANK_WINDOW`` rows
+ranks only its newest N matches and lists the rest after them, newest first,
+which keeps very common words fast without dropping any hits.
+"""
+import html
+import re
+
+from django.conf import settings
+from django.db import connection
+
+from .models import PullRequest, Ticket
+
+KINDS = ('ticket', 'pr')
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+MAX_TERMS = 16
+SNIPPET_TOKENS = 16
+# highlight markers, swapped for <mark> once the text is HTML-escaped
+_OPEN, _CLOSE = '\x02', '\x03'
+
+
+def available():
+    return connection.vendor == 'sqlite'
+
+
+def match_expression(query):
+    """FTS5 MATCH string for free text; raises ValueError if it has no words."""
+    terms = re.findall(r'\w+', query)[:MAX_TERMS]
+    if not terms:
+        raise ValueError('empty query')
+    phrases = [f'"{t}"' for t in terms]
+    # one-letter prefixes would expand to most of the vocabulary
+    if len(terms[-1]) >= 2:
+        phrases[-1] += '*'
+    return ' '.join(phrases)
+
+
+_HITS = (
+    "SELECT kind, ref, key, highlight(workboard_search, 3, %s, %s), "
+    "snippet(workboard_search, 4, %s, %s, '…', %s) "
+    "FROM workboard_search WHERE workboard_search MATCH %s"
+)
+
+
+def _marked(text):
+    return html.escape(text or '').replace(_OPEN, '<mark>').replace(_CLOSE, '</mark>')
+
+
+def search(query, kind=None, offset=0, limit=DEFAULT_LIMIT):
+    """One page of ranked matches and whether more follow.
+
+    Each hit carries ``title_html`` (the full title) and ``snippet_html`` (a
+    window of the description) with matches wrapped in ``<mark>``; all other
+    text is HTML-escaped.
+    """
+    window = settings.WORKBOARD_SEARCH_RANK_WINDOW
+    match = match_expression(query)
+    # tickets have even rowids and PRs odd ones, so no stored column is read
+    parity, where = (' AND rowid %% 2 = %s', [match, KINDS.index(kind)]) if kind else ('', [match])
+    marks = [_OPEN, _CLOSE, _OPEN, _CLOSE, SNIPPET_TOKENS]
+    with connection.cursor() as cursor:
+        cutoff = None
+        if window:
+            # bm25 has to score every match, so only the newest N of a broad
+            # query are ranked; the older ones follow them newest first
+            cursor.execute(
+                f'SELECT rowid FROM workboard_search WHERE workboard_search MATCH %s{parity} '
+                'ORDER BY rowid DESC LIMIT 1 OFFSET %s', where + [window],
+            )
+            row = cursor.fetchone()
+            cutoff = row[0] if row else None
+        if cutoff is None:
+            cursor.execute(_HITS + parity + ' ORDER BY rank, rowid LIMIT %s OFFSET %s', marks + where + [limit + 1, offset])
+            rows = cursor.fetchall()
+        else:
+            rows = []
+            if offset < window:
+                cursor.execute(
+                    _HITS + parity + ' AND rowid > %s ORDER BY rank, rowid LIMIT %s OFFSET %s',
+                    marks + where + [cutoff, limit + 1, offset],
+                )
+                rows = cursor.fetchall()
+            if len(rows) <= limit:
+                cursor.execute(
+                    _HITS + parity + ' AND rowid <= %s ORDER BY rowid DESC LIMIT %s OFFSET %s',
+                    marks + where + [cutoff, limit + 1 - len(rows), max(0, offset - window)],
+                )
+                rows += cursor.fetchall()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    ids = {k: [ref for kind_, ref, *_ in rows if kind_ == k] for k in KINDS}
+    tickets = Ticket.objects.only('status').in_bulk(ids['ticket']) if ids['ticket'] else {}
+    prs = PullRequest.objects.only('repo', 'status').in_bulk(ids['pr']) if ids['pr'] else {}
+    results = []
+    for kind_, ref, key, title, snippet in rows:
+        hit = {'type': kind_, 'id': ref}
+        if kind_ == 'ticket':
+            ticket = tickets.get(ref)
+            hit.update(key=key, status=ticket.status if ticket else None)
+        else:
+            pr = prs.get(ref)
+            hit.update(repo=pr.repo if pr else None, status=pr.status if pr else None)
+        hit['title_html'] = _marked(title)
+        hit['snippet_html'] = _marked(snippet) if kind_ == 'ticket' else ''
+        results.append(hit)
+    return results, has_more
@@ -0,0 +1,23 @@
+"""Workboard data generation counter.
+
+``bump_generation()`` runs from model signals on every Ticket, PullRequest,
+Member, Team and Dependency write, inside the writer's transaction. Readers
+(e.g. the report cache) key derived data on ``current_generation()`` and so
+never observe a value older than the data they read. Code that writes with
+``QuerySet.update`` / ``bulk_create`` must call ``bump_generation()`` itself.
+"""
+from django.db.models import F
+
+from .models import DataGeneration
+
+
+def current_generation():
+    value = DataGeneration.objects.filter(pk=1).values_list('value', flat=True).first()
+    return value or 0
+
+
+def bump_generation():
+    if not DataGeneration.objects.filter(pk=1).update(value=F('value') + 1):
+        obj, created = DataGeneration.objects.get_or_create(pk=1, defaults={'value': 1})
+        if not created:
+            DataGeneration.objects.filter(pk=1).update(value=F('value') + 1)
@@ -0,0 +1,199 @@
+"""In-memory DAG index over ``Dependency`` rows.
+
+Edges point from a ticket to the tickets it depends on
+(``Dependency(ticket=A, depends_on=B)`` is ``A -> B``). Every query below is a
+single BFS / topological pass, so it runs in O(V+E) over the part of the graph
+it touches.
+
+``get_graph()`` returns a process-wide index that is kept up to date by the
+``Dependency`` signals in ``workboard.signals`` and reloaded when the table's
+``(count, max id, max updated_at)`` fingerprint shows another process has
+written to it; ``updated_at`` catches edges that were changed in place.
+"""
+from collections import deque
+import threading
+
+from django.db.models import Count, Max
+
+
+class DependencyGraph:
+    def __init__(self, edges=()):
+        self.deps = {}        # ticket id -> {ids it depends on}
+        self.dependents = {}  # ticket id -> {ids depending on it}
+        for ticket_id, depends_on_id in edges:
+            self.add_edge(ticket_id, depends_on_id)
+
+    def __len__(self):
+        return sum(len(v) for v in self.deps.values())
+
+    def add_edge(self, ticket_id, depends_on_id):
+        self.deps.setdefault(ticket_id, set()).add(depends_on_id)
+        self.dependents.setdefault(depends_on_id, set()).add(ticket_id)
+
+    def remove_edge(self, ticket_id, depends_on_id):
+        for index, a, b in ((self.deps, ticket_id, depends_on_id), (self.dependents, depends_on_id, ticket_id)):
+            targets = index.get(a)
+            if targets is not None:
+                targets.discard(b)
+                if not targets:
+                    del index[a]
+
+    def _walk(self, index, start, skip=None, skip_level=None):
+        """BFS from ``start``; returns ``{id: depth}`` of reachable nodes.
+
+        Nodes for which ``skip(id)`` is true are neither returned nor expanded.
+        ``skip_level(ids)`` does the same for each newly reached depth at once:
+        it returns the ids to drop, so callers can look a level up in one query.
+        """
+        seen = {start: 0}
+        skipped = set()
+        level = [start]
+        depth = 0
+        while level:
+            depth += 1
+            found = []
+            for node in level:
+                for nxt in index.get(node, ()):
+                    if nxt in seen or nxt in skipped:
+                        continue
+                    if skip is not None and skip(nxt):
+                        skipped.add(nxt)
+                        continue
+                    seen[nxt] = depth
+                    found.append(nxt)
+            if skip_level is not None and found:
+                dropped = skip_level(found)
+                for node in dropped:
+                    del seen[node]
+                skipped.update(dropped)
+                found = [node for node in found if node not in dropped]
+            level = found
+        del seen[start]
+        return seen
+
+    def upstream(self, ticket_id, skip=None, skip_level=None):
+        """Tickets ``ticket_id`` depends on, directly or transitively."""
+        return self._walk(self.deps, ticket_id, skip, skip_level)
+
+    def downstream(self, ticket_id, skip=None, skip_level=None):
+        """Tickets that depend on ``ticket_id``, directly or transitively."""
+        return self._walk(self.dependents, ticket_id, skip, skip_level)
+
+    def cycle_path(self, ticket_id, depends_on_id):
+        """Path that adding ``ticket_id -> depends_on_id`` would close, or None.
+
+        The returned list starts and ends with ``ticket_id``.
+        """
+        if ticket_id == depends_on_id:
+            return [ticket_id, ticket_id]
+        parent = {depends_on_id: None}
+        queue = deque([depends_on_id])
+        while queue:
+            node = queue.popleft()
+            if node == ticket_id:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parent[node]
+                return [ticket_id] + path[::-1]
+            for nxt in self.deps.get(node, ()):
+                if nxt not in parent:
+                    parent[nxt] = node
+                    queue.append(nxt)
+        return None
+
+    def would_create_cycle(self, ticket_id, depends_on_id):
+        return self.cycle_path(ticket_id, depends_on_id) is not None
+
+    def critical_path(self, ticket_id, skip=None):
+        """Longest chain of tickets that must finish before ``ticket_id``.
+
+        Returned root-first and ending with ``ticket_id``; every ticket counts
+        as one unit of work. Ties are broken towards the lower ticket id.
+        """
+        nodes = set(self.upstream(ticket_id, skip))
+        nodes.add(ticket_id)
+
+        # Kahn's algorithm over the sub-graph, sources (no pending deps) first
+        pending = {n: len(self.deps.get(n, set()) & nodes) for n in nodes}
+        queue = deque(sorted(n for n, c in pending.items() if c == 0))
+        length = {}
+        best_dep = {}
+        while queue:
+            node = queue.popleft()
+            choices = [d for d in self.deps.get(node, ()) if d in nodes]
+            if choices:
+                prev = min(choices, key=lambda d: (-length[d], d))
+                length[node] = length[prev] + 1
+                best_dep[node] = prev
+            else:
+                length[node] = 1
+            for nxt in self.dependents.get(node, ()):
+                if nxt in pending:
+                    pending[nxt] -= 1
+                    if pending[nxt] == 0:
+                        queue.append(nxt)
+
+        path = []
+        node = ticket_id if ticket_id in length else None
+        while node is not None:
+            path.append(node)
+            node = best_dep.get(node)
+        return path[::-1]
+
+
+class _GraphIndex:
+    """Process-wide ``DependencyGraph`` with staleness detection."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._graph = None
+        self._fingerprint = None
+
+    @staticmethod
+    def _db_fingerprint():
+        from .models import Dependency
+        agg = Dependency.objects.aggregate(n=Count('id'), last=Max('id'), updated=Max('updated_at'))
+        return agg['n'], agg['last'], agg['updated']
+
+    def get(self):
+        fingerprint = self._db_fingerprint()
+        with self._lock:
+            if self._graph is None or fingerprint != self._fingerprint:
+                from .models import Dependency
+                edges = Dependency.objects.values_list('ticket_id', 'depends_on_id')
+                self._graph = DependencyGraph(edges.iterator(chunk_size=5000))
+                self._fingerprint = fingerprint
+            return self._graph
+
+    def edge_added(self, dependency_id, ticket_id, depends_on_id, updated_at):
+        with self._lock:
+            if self._graph is None:
+                return
+            self._graph.add_edge(ticket_id, depends_on_id)
+            n, last, updated = self._fingerprint
+            self._fingerprint = (n + 1, max(last or 0, dependency_id), max(updated or updated_at, updated_at))
+
+    def edge_removed(self, dependency_id, ticket_id, depends_on_id, updated_at):
+        with self._lock:
+            if self._graph is None:
+                return
+            self._graph.remove_edge(ticket_id, depends_on_id)
+            n, last, updated = self._fingerprint
+            if dependency_id == last or updated_at == updated:
+                # the new maximum is unknown; reload on next use
+                self.invalidate()
+            else:
+                self._fingerprint = (n - 1, last, updated)
+
+    def invalidate(self):
+        with self._lock:
+            self._graph = None
+            self._fingerprint = None
+
+
+graph_index = _GraphIndex()
+
+
+def get_graph():
+    return graph_index.get()
@@ -0,0 +1,209 @@
+"""Ticket status history and the daily rollups behind burndown, cumulative
+flow and velocity.
+
+Ticket signals (and ``workboard.bulk``) call ``tickets_changed`` with the
+old and new ``(team_id, status)`` of each ticket that was created, deleted,
+changed status or moved team. That appends ``StatusTransition`` rows and
+adjusts today's ``DailyStatusRollup`` rows for the ticket's team and the
+board, so the reads below only touch rollup rows for the requested window
+(plus one row per status to carry totals into it).
+
+Bulk loaders that bypass the signals (``import_workboard``,
+``generate_board``) pass their batches to ``tickets_changed`` too.
+``rebuild_today()`` resets today's totals from the ticket table, to repair
+drift after writes that do not.
+"""
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Q, Sum
+from django.utils import timezone
+
+from .models import DailyStatusRollup, StatusTransition, Team, Ticket
+
+STATUSES = tuple(status for status, _ in Ticket.STATUS_CHOICES)
+DONE = 'DONE'
+
+
+def _today():
+    return timezone.now().date()
+
+
+def tickets_changed(changes, at=None):
+    """Record ``(ticket_id, old, new)`` changes; ``old``/``new`` are ``(team_id, status)`` or None.
+
+    Changes that neither move a ticket between statuses nor between teams
+    are ignored.
+    """
+    at = at or timezone.now()
+    transitions, deltas = [], {}
+
+    def add(team_id, status, **delta):
+        for scope in {None, team_id}:
+            row = deltas.setdefault((scope, status), {})
+            for field, n in delta.items():
+                row[field] = row.get(field, 0) + n
+
+    for ticket_id, old, new in changes:
+        if old == new:
+            continue
+        transitions.append(StatusTransition(
+            ticket_id=ticket_id, at=at,
+            from_status=old[1] if old else '', to_status=new[1] if new else '',
+            from_team_id=old[0] if old else None, to_team_id=new[0] if new else None,
+        ))
+        # creating, deleting or moving a ticket between teams is not a status change
+        changed = old is not None and new is not None and old[1] != new[1]
+        if old:
+            add(old[0], old[1], count=-1, **({'exited': 1} if changed else {}))
+        if new:
+            add(new[0], new[1], count=1, **({'entered': 1} if changed else {}))
+    if not transitions:
+        return
+    with transaction.atomic():
+        StatusTransition.objects.bulk_create(transitions)
+        day = at.date()
+        for (team_id, status), delta in deltas.items():
+            _bump(day, team_id, status, delta)
+
+
+def _bump(day, team_id, status, delta):
+    delta = {k: v for k, v in delta.items() if v}
+    if not delta:
+        return
+    rows = DailyStatusRollup.objects.filter(team_id=team_id, day=day, status=status)
+    changes = {k: F(k) + v for k, v in delta.items()}
+    if rows.update(**changes):
+        return
+    # first change of the day: carry the previous total forward
+    previous = (
+        DailyStatusRollup.objects.filter(team_id=team_id, day__lt=day, status=status)
+        .order_by('-day').values_list('count', flat=True).first()
+    ) or 0
+    if not _create(
+        team_id=team_id, day=day, status=status,
+        count=previous + delta.get('count', 0), entered=delta.get('entered', 0), exited=delta.get('exited', 0),
+    ):
+        rows.update(**changes)
+
+
+def _create(**fields):
+    """Insert a rollup row; False if a concurrent writer created it first."""
+    try:
+        with transaction.atomic():
+            DailyStatusRollup.objects.create(**fields)
+    except IntegrityError:
+        return False
+    return True
+
+
+def rebuild_today():
+    """Set today's totals from the ticket table for the board and every team.
+
+    Keeps today's ``entered`` / ``exited``; used after writes that bypass the
+    signals, and to repair drift.
+    """
+    today = _today()
+    counts = {}
+    for row in Ticket.objects.order_by().values('assignee__team_id', 'status').annotate(n=Count('id')):
+        for scope in {None, row['assignee__team_id']}:
+            counts[(scope, row['status'])] = counts.get((scope, row['status']), 0) + row['n']
+    teams = set(Team.objects.values_list('id', flat=True))
+    with transaction.atomic():
+        for scope in {None} | teams:
+            known = dict(_counts_before(scope, today + timedelta(days=1)))
+            for status in set(known) | {s for t, s in counts if t == scope}:
+                n = counts.get((scope, status), 0)
+                if known.get(status, 0) == n:
+                    continue
+                rows = DailyStatusRollup.objects.filter(team_id=scope, day=today, status=status)
+                if not rows.update(count=n) and not _create(team_id=scope, day=today, status=status, count=n):
+                    rows.update(count=n)
+
+
+def _counts_before(team_id, day):
+    """``{status: count}`` at the end of the last day before ``day`` that has a row."""
+    scope = DailyStatusRollup.objects.filter(team_id=team_id, day__lt=day)
+    last = scope.values('status').annotate(last=Max('day')).order_by()
+    q = Q()
+    for row in last:
+        q |= Q(status=row['status'], day=row['last'])
+    if not q:
+        return {}
+    return dict(scope.filter(q).values_list('status', 'count'))
+
+
+def daily_counts(start, end, team_id=None):
+    """``[(day, {status: count})]`` for every day from ``start`` to ``end``."""
+    counts = _counts_before(team_id, start)
+    rows = {}
+    for day, status, count in (
+        DailyStatusRollup.objects.filter(team_id=team_id, day__range=(start, end))
+        .order_by('day').values_list('day', 'status', 'count')
+    ):
+        rows.setdefault(day, {})[status] = count
+    out = []
+    day = start
+    while day <= end:
+        counts = {**counts, **rows.get(day, {})}
+        out.append((day, counts))
+        day += timedelta(days=1)
+    return out
+
+
+def _status_order(counts):
+    extra = sorted({s for _, c in counts for s in c} - set(STATUSES))
+    return list(STATUSES) + extra
+
+
+def cumulative_flow(start, end, team_id=None):
+    """Tickets per status at the end of each day, for a cumulative flow chart."""
+    counts = daily_counts(start, end, team_id)
+    statuses = _status_order(counts)
+    return {
+        'start': start, 'end': end, 'team': team_id, 'statuses': statuses,
+        'days': [{'date': day, **{s: c.get(s, 0) for s in statuses}} for day, c in counts],
+    }
+
+
+def burndown(start, end, team_id=None):
+    """Open (not DONE) tickets at the end of each day; ``total`` shows scope changes."""
+    days = []
+    for day, c in daily_counts(start, end, team_id):
+        total = sum(c.values())
+        done = c.get(DONE, 0)
+        days.append({'date': day, 'total': total, 'done': done, 'remaining': total - done})
+    return {'start': start, 'end': end, 'team': team_id, 'days': days}
+
+
+def velocity(weeks, team_id=None, status=DONE, today=None):
+    """Tickets moved into ``status`` in each of the last ``weeks`` weeks (Monday to Sunday).
+
+    Tickets created directly in ``status`` are not counted.
+    """
+    today = today or _today()
+    first = today - timedelta(days=today.weekday() + 7 * (weeks - 1))
+    per_day = dict(
+        DailyStatusRollup.objects.filter(team_id=team_id, status=status, day__range=(first, today))
+        .values_list('day', 'entered')
+    )
+    out = []
+    for i in range(weeks):
+        week = first + timedelta(days=7 * i)
+        out.append({
+            'week_start': week,
+            'completed': sum(per_day.get(week + timedelta(days=d), 0) for d in range(7)),
+        })
+    finished = [w['completed'] for w in out[:-1]]  # the current week is still running
+    return {
+        'team': team_id, 'status': status, 'weeks': out,
+        'average': round(sum(finished) / len(finished), 2) if finished else None,
+    }
+
+
+def entered_between(start, end, status=DONE, team_id=None):
+    """How many tickets moved into ``status`` from ``start`` to ``end`` inclusive."""
+    return (
+        DailyStatusRollup.objects.filter(team_id=team_id, status=status, day__range=(start, end))
+        .aggregate(n=Sum('entered'))['n'] or 0
+    )
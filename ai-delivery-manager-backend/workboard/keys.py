@@ -0,0 +1,113 @@
+"""Ticket keys (``<project>-<n>``) from a per-project sequence.
+
+``KeySequence`` holds the next unused number for each key prefix and numbers
+are reserved with ``UPDATE ... SET next_value = next_value + n``, so two
+writers can never be handed the same key and inserts need no uniqueness
+retry. Outside a transaction each process reserves ``TICKET_KEYS['BLOCK_SIZE']``
+numbers at a time and hands them out from memory: keys increase within a
+process and are unique across processes, and numbers left in a block when
+the process exits are skipped. Inside a transaction exactly the numbers
+needed are reserved, so a rollback returns them along with the rows that
+would have used them. Either way a number whose key already exists, written
+by a seed or import that bypassed the sequence, is skipped; existing keys
+are looked up once per reserved block.
+"""
+import re
+import threading
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+
+from .models import KeySequence, Ticket
+
+_lock = threading.Lock()
+# (database name, project) -> (next number, end of block)
+_blocks = {}
+# keys per existence query, below SQLite's bound-parameter limit
+_CHECK_BATCH = 900
+
+
+def next_key_number(prefix):
+    """Highest numeric suffix used by ``<prefix>-<n>`` keys, so new keys never collide."""
+    pattern = re.compile(rf'^{re.escape(prefix)}-(\d+)$')
+    highest = 0
+    for key in Ticket.objects.filter(key__startswith=f'{prefix}-').values_list('key', flat=True).iterator(chunk_size=10000):
+        m = pattern.match(key)
+        if m:
+            highest = max(highest, int(m.group(1)))
+    return highest
+
+
+def reserve(project, n):
+    """Reserve ``n`` consecutive numbers for ``project`` and return the first.
+
+    The sequence row is created on first use, starting after the highest
+    ``<project>-<n>`` key already on the board.
+    """
+    with transaction.atomic():
+        if not KeySequence.objects.filter(project=project).update(next_value=F('next_value') + n):
+            seq, created = KeySequence.objects.get_or_create(
+                project=project, defaults={'next_value': next_key_number(project) + 1 + n},
+            )
+            if not created:
+                KeySequence.objects.filter(project=project).update(next_value=F('next_value') + n)
+        end = KeySequence.objects.filter(project=project).values_list('next_value', flat=True).get()
+    return end - n
+
+
+def _taken(project, first, end):
+    """Numbers in ``[first, end)`` whose ``<project>-<n>`` key already exists."""
+    candidates = [f'{project}-{i}' for i in range(first, end)]
+    taken = set()
+    for i in range(0, len(candidates), _CHECK_BATCH):
+        batch = candidates[i:i + _CHECK_BATCH]
+        taken.update(int(key.rsplit('-', 1)[1]) for key in Ticket.objects.filter(key__in=batch).values_list('key', flat=True))
+    return taken
+
+
+def _reserve_checked(project, n):
+    """Reserve ``n`` numbers; return ``(first, end, taken)`` for the block."""
+    first = reserve(project, n)
+    return first, first + n, _taken(project, first, first + n)
+
+
+def _numbers(project, n):
+    if connection.in_atomic_block:
+        numbers = []
+        while len(numbers) < n:
+            first, end, taken = _reserve_checked(project, n - len(numbers))
+            numbers += [i for i in range(first, end) if i not in taken]
+        return numbers
+    block = (connection.settings_dict['NAME'], project)
+    numbers = []
+    with _lock:
+        start, end, taken = _blocks.get(block, (0, 0, ()))
+        while len(numbers) < n:
+            if start == end:
+                start, end, taken = _reserve_checked(project, max(settings.TICKET_KEYS['BLOCK_SIZE'], n - len(numbers)))
+            if start not in taken:
+                numbers.append(start)
+            start += 1
+        _blocks[block] = (start, end, taken)
+    return numbers
+
+
+def allocate(n=1, project=None):
+    """Return ``n`` new keys for ``project`` (default ``TICKET_KEYS['PREFIX']``) in increasing order.
+
+    Numbers that a seed or import already wrote directly (say ``PROJ-25``
+    while this process holds the block 21-40) are skipped. Existing keys are
+    looked up once per reserved block, so a direct write into a block this
+    process already holds is not seen; the import and seed commands move the
+    sequence past what they wrote, which keeps later blocks clear of it.
+    """
+    project = project or settings.TICKET_KEYS['PREFIX']
+    return [f'{project}-{i}' for i in _numbers(project, n)]
+
+
+def sync_sequences():
+    """Move every sequence past keys written without it (imports, fixtures)."""
+    for project in KeySequence.objects.values_list('project', flat=True):
+        highest = next_key_number(project)
+        KeySequence.objects.filter(project=project, next_value__lte=highest).update(next_value=highest + 1)
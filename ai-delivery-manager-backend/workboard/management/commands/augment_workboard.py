@@ -1,8 +1,10 @@
 from django.core.management.base import BaseCommand
 from workboard.models import Team, Member, Ticket, PullRequest, Dependency
-from django.utils import timezone
-from django.utils.crypto import get_random_string
+from workboard import keys
+from workboard.graph import get_graph
+from workboard.synthetic import generate_board
 import random
+import time
 
 
 TICKET_TITLES = [
@@ -28,49 +30,86 @@ PR_TITLES = [
 
 
 class Command(BaseCommand):
-    help = 'Augment workboard with additional randomized tickets, PRs, and dependencies (no destructive changes)'
+    help = (
+        'Augment workboard with additional randomized tickets, PRs, and dependencies (no destructive changes). '
+        'With --generate, bulk-build a deterministic synthetic board (10k-1M tickets) for benchmarking.'
+    )
 
     def add_arguments(self, parser):
         parser.add_argument('--tickets', type=int, default=5, help='Number of tickets to create')
         parser.add_argument('--prs', type=int, default=5, help='Number of PRs to create')
+        parser.add_argument('--seed', type=int, default=None, help='Random seed; the same seed yields the same data')
+        parser.add_argument('--prefix', default='PROJ', help="Ticket key prefix; keys come from the prefix's sequence")
+        parser.add_argument('--generate', action='store_true', help='Synthetic board mode using bulk inserts (--prs is ignored)')
+        parser.add_argument('--teams', type=int, default=None, help='[--generate] Number of teams (default: one per 2,000 tickets)')
+        parser.add_argument('--pr-ratio', type=float, default=0.6, help='[--generate] PRs per ticket')
+        parser.add_argument('--dep-ratio', type=float, default=0.3, help='[--generate] Share of tickets that get dependencies')
+        parser.add_argument('--dag-depth', type=int, default=6, help='[--generate] Maximum dependency chain length')
+        parser.add_argument('--fan-out', type=int, default=3, help='[--generate] Maximum dependencies per ticket')
+        parser.add_argument('--overdue-ratio', type=float, default=0.15, help='[--generate] Share of unfinished tickets that are overdue')
+        parser.add_argument('--batch-size', type=int, default=5000, help='[--generate] Rows per bulk insert')
 
     def handle(self, *args, **options):
+        if options['generate']:
+            return self._generate(options)
+
         tcount = options.get('tickets', 5)
         pcount = options.get('prs', 5)
+        rng = random.Random(options['seed'])
+        prefix = options['prefix']
 
         team = Team.objects.first() or Team.objects.create(name='Demo Team', description='Auto-created')
         members = list(Member.objects.all())
         if not members:
-            members = [Member.objects.create(name=f'User{get_random_string(3)}', team=team) for _ in range(3)]
+            members = [Member.objects.create(name=f'User{i + 1}', team=team) for i in range(3)]
 
         created_prs = []
         for i in range(pcount):
-            title = random.choice(PR_TITLES) + f' {get_random_string(3)}'
-            author = random.choice(members)
-            pr = PullRequest.objects.create(repo=random.choice(['frontend','backend','infra']), title=title, author=author, status=random.choice(['Open','Closed','Merged']))
+            title = rng.choice(PR_TITLES) + f' #{rng.randint(100, 999)}'
+            author = rng.choice(members)
+            pr = PullRequest.objects.create(repo=rng.choice(['frontend','backend','infra']), title=title, author=author, status=rng.choice(['Open','Closed','Merged']))
             created_prs.append(pr)
 
         existing_tickets = list(Ticket.objects.all())
-        for i in range(tcount):
-            key = f'PROJ-{get_random_string(4).upper()}'
-            title = random.choice(TICKET_TITLES) + f' {get_random_string(2)}'
-            assignee = random.choice(members)
-            status = random.choice(['TODO','IN_PROGRESS','IN_REVIEW','DONE','BLOCKED'])
+        new_keys = keys.allocate(tcount, prefix)
+        for key in new_keys:
+            title = rng.choice(TICKET_TITLES) + f' #{rng.randint(10, 99)}'
+            assignee = rng.choice(members)
+            status = rng.choice(['TODO','IN_PROGRESS','IN_REVIEW','DONE','BLOCKED'])
             ticket = Ticket.objects.create(key=key, title=title, description='Auto-generated task', status=status, assignee=assignee)
             # link a random PR
-            if created_prs and random.random() < 0.6:
-                ticket.prs.add(random.choice(created_prs))
+            if created_prs and rng.random() < 0.6:
+                ticket.prs.add(rng.choice(created_prs))
             existing_tickets.append(ticket)
 
-        # create some random dependencies
+        # create some random dependencies; get_or_create bypasses the API's
+        # cycle check and existing edges may point either way, so check here
         if len(existing_tickets) > 1:
             for _ in range(max(1, tcount // 3)):
-                a = random.choice(existing_tickets)
-                b = random.choice(existing_tickets)
-                if a.id != b.id:
-                    try:
-                        Dependency.objects.create(ticket=a, depends_on=b, note='Auto-dependency')
-                    except Exception:
-                        pass
+                a = rng.choice(existing_tickets)
+                b = rng.choice(existing_tickets)
+                if a.id > b.id and get_graph().cycle_path(a.id, b.id) is None:
+                    Dependency.objects.get_or_create(ticket=a, depends_on=b, defaults={'note': 'Auto-dependency'})
 
         self.stdout.write(self.style.SUCCESS(f'Created {tcount} tickets and {pcount} PRs (approx)'))
+
+    def _generate(self, options):
+        started = time.monotonic()
+        result = generate_board(
+            tickets=options['tickets'],
+            seed=options['seed'] or 0,
+            teams=options['teams'],
+            pr_ratio=options['pr_ratio'],
+            dep_ratio=options['dep_ratio'],
+            dag_depth=options['dag_depth'],
+            fan_out=options['fan_out'],
+            overdue_ratio=options['overdue_ratio'],
+            prefix=options['prefix'],
+            batch_size=options['batch_size'],
+            log=lambda msg: self.stdout.write(f'  {msg}'),
+        )
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {result['tickets']} tickets ({result['first_key']}..{result['last_key']}), "
+            f"{result['prs']} PRs, {result['dependencies']} dependencies in {elapsed:.1f}s"
+        ))
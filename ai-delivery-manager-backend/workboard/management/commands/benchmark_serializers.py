@@ -0,0 +1,135 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from workboard.models import Member, PullRequest, Ticket
+from workboard.renderers import orjson
+from workboard.synthetic import generate_board
+import json
+import statistics
+import time
+
+
+# name -> path; each is fetched with ?fast=0 (serializers) and ?fast=1
+# (values() projections + orjson) and the bodies must match byte for byte
+CASES = {
+    'tickets': '/api/workboard/tickets/',
+    'tickets_page': '/api/workboard/tickets/?limit=200&count=exact',
+    'prs': '/api/workboard/prs/',
+    'members': '/api/workboard/members/',
+    'aggregate': '/api/workboard/aggregate/',
+    'aggregate_page': '/api/workboard/aggregate/?limit=500',
+    'aggregate_stream': '/api/workboard/aggregate/?stream=1',
+}
+
+# text the encoders must agree on: non-ASCII, escapes, control and separator characters
+AWKWARD = 'Ünïcödé “quotes” \\ "escaped" \t tab \x1f ctrl \u2028 line-sep \u2029 para-sep 🚀'
+
+
+def _with_flag(path, fast):
+    return f"{path}{'&' if '?' in path else '?'}fast={int(fast)}"
+
+
+def _body(response):
+    if response.streaming:
+        return b''.join(response.streaming_content)
+    return response.content
+
+
+def _seed_awkward_rows():
+    member = Member.objects.create(name=AWKWARD, email='odd@example.com', role=AWKWARD)
+    pr = PullRequest.objects.create(title=AWKWARD, repo='odd/repo', author=member)
+    ticket = Ticket.objects.create(key='ODD-1', title=AWKWARD, description=AWKWARD, assignee=member)
+    ticket.prs.add(pr)
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare the serializer and fast (values() + orjson) paths of the workboard list '
+        'endpoints on generated boards in a throwaway test database. Reports median times '
+        'and fails if the two paths return different bytes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000', help='Comma-separated board sizes in tickets')
+        parser.add_argument('--only', action='append', choices=sorted(CASES), help='Run only this case (repeatable)')
+        parser.add_argument('--repeat', type=int, default=3, help='Timed runs per path; the median is reported')
+        parser.add_argument('--seed', type=int, default=0, help='Seed for the generated boards')
+        parser.add_argument('--output', default='', help='Write JSON results to this file')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted({int(s) for s in options['sizes'].split(',') if s.strip()})
+        except ValueError:
+            raise CommandError('--sizes must be comma-separated integers')
+        names = options['only'] or list(CASES)
+        repeat = max(1, options['repeat'])
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed; the fast path encodes with json'))
+
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            results = self._run(sizes, names, repeat, options['seed'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as fh:
+                json.dump({'orjson': orjson is not None, 'results': results}, fh, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        different = [r for r in results if not r['identical']]
+        if different:
+            raise CommandError('Fast path output differs: ' + ', '.join(
+                f"{r['name']}@{r['tickets']}" for r in different
+            ))
+        self.stdout.write(self.style.SUCCESS(f'{len(results)} case(s) byte-identical'))
+
+    def _run(self, sizes, names, repeat, seed):
+        client = Client()
+        results = []
+        current = 0
+        _seed_awkward_rows()
+        for i, size in enumerate(sizes):
+            if size > current:
+                self.stdout.write(f'Generating board: {current} -> {size} tickets')
+                generate_board(tickets=size - current, seed=seed + i)
+                current = size
+            self.stdout.write(f'{"case":<20}{"tickets":>9}{"serializer ms":>15}{"fast ms":>10}{"speedup":>9}{"KiB":>9}')
+            for name in names:
+                result = self._measure(client, name, size, repeat)
+                results.append(result)
+                self.stdout.write(
+                    f"{name:<20}{size:>9}{result['serializer_ms']:>15.1f}{result['fast_ms']:>10.1f}"
+                    f"{result['speedup']:>8.2f}x{result['bytes'] // 1024:>9}"
+                    + ('' if result['identical'] else self.style.ERROR('  output differs'))
+                )
+        return results
+
+    def _measure(self, client, name, tickets, repeat):
+        bodies, medians = {}, {}
+        for fast in (False, True):
+            path = _with_flag(CASES[name], fast)
+
+            def call():
+                response = client.get(path)
+                if response.status_code != 200:
+                    raise CommandError(f'{path} returned {response.status_code}')
+                return _body(response)
+
+            bodies[fast] = call()  # warm-up
+            runs = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                call()
+                runs.append((time.perf_counter() - started) * 1000)
+            medians[fast] = statistics.median(runs)
+        return {
+            'name': name,
+            'tickets': tickets,
+            'serializer_ms': round(medians[False], 2),
+            'fast_ms': round(medians[True], 2),
+            'speedup': round(medians[False] / medians[True], 2) if medians[True] else None,
+            'bytes': len(bodies[False]),
+            'identical': bodies[False] == bodies[True],
+        }
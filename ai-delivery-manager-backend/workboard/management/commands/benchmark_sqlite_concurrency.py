@@ -0,0 +1,153 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections, transaction
+from reports.summary_builder import get_dashboard_stats
+from workboard.models import Ticket
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+STATUSES = ['TODO', 'IN_PROGRESS', 'IN_REVIEW', 'DONE', 'BLOCKED']
+
+# Stock Django/SQLite behaviour before tuning: rollback journal, a new
+# connection per request, deferred transactions and the default 5s timeout.
+BASELINE = {
+    'options': {'init_command': 'PRAGMA journal_mode=DELETE;PRAGMA synchronous=FULL'},
+    'persistent': False,
+}
+
+
+def _tuned():
+    return {
+        'options': {
+            'init_command': ';'.join(f'PRAGMA {k}={v}' for k, v in settings.SQLITE_PRAGMAS.items()),
+            'transaction_mode': 'IMMEDIATE',
+        },
+        'persistent': True,
+    }
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare SQLite throughput with stock settings against the tuned SQLITE_PRAGMAS '
+        '(WAL, synchronous=NORMAL, IMMEDIATE transactions, persistent connections). Reader '
+        'threads build the dashboard and list tickets while writer threads change ticket '
+        'statuses, on a copy of the configured database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=4, help='Reader threads')
+        parser.add_argument('--writers', type=int, default=2, help='Writer threads')
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds per mode')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        source = Path(connection.settings_dict['NAME'])
+        if connection.vendor != 'sqlite' or not source.exists():
+            raise CommandError('Needs an on-disk SQLite database (run migrate and seed_workboard first)')
+        self.ticket_ids = list(Ticket.objects.values_list('id', flat=True))
+        if not self.ticket_ids:
+            raise CommandError('The database has no tickets to update')
+        connection.close()
+
+        workdir = Path(tempfile.mkdtemp(prefix='sqlite-bench-'))
+        db_copy = workdir / 'bench.sqlite3'
+        with sqlite3.connect(source) as src, sqlite3.connect(db_copy) as dst:
+            src.backup(dst)
+
+        original = dict(connections.settings['default'])
+        results = {}
+        try:
+            for label, mode in (('stock', BASELINE), ('tuned', _tuned())):
+                connections.settings['default'].update(
+                    NAME=str(db_copy), OPTIONS=mode['options'], CONN_MAX_AGE=None if mode['persistent'] else 0,
+                )
+                results[label] = self._run_mode(mode, options)
+                self._print(label, results[label])
+        finally:
+            connections.settings['default'].clear()
+            connections.settings['default'].update(original)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        stock, tuned = results['stock'], results['tuned']
+        for kind in ('reads', 'writes'):
+            ratio = tuned[kind] / stock[kind] if stock[kind] else float('inf')
+            self.stdout.write(f'{kind} throughput: x{ratio:.2f}')
+        self.stdout.write(self.style.SUCCESS(
+            f"'database is locked' errors: stock {stock['locked']}, tuned {tuned['locked']}"
+        ))
+
+    def _run_mode(self, mode, options):
+        stop = threading.Event()
+        lock = threading.Lock()
+        totals = {'reads': 0, 'writes': 0, 'locked': 0, 'read_ms': [], 'write_ms': []}
+
+        def worker(kind, seed):
+            rng = random.Random(seed)
+            done, locked, latencies = 0, 0, []
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    if kind == 'reads':
+                        get_dashboard_stats()
+                        list(Ticket.objects.order_by('-created_at').values('id', 'key', 'status')[:50])
+                    else:
+                        with transaction.atomic():
+                            ticket = Ticket.objects.get(pk=rng.choice(self.ticket_ids))
+                            ticket.status = rng.choice(STATUSES)
+                            ticket.save(update_fields=['status', 'updated_at'])
+                    done += 1
+                    latencies.append((time.perf_counter() - started) * 1000)
+                except OperationalError as exc:
+                    if 'locked' not in str(exc):
+                        raise
+                    locked += 1
+                if not mode['persistent']:
+                    # what request_finished does with CONN_MAX_AGE=0
+                    connection.close()
+            connection.close()
+            with lock:
+                totals[kind] += done
+                totals['locked'] += locked
+                totals['read_ms' if kind == 'reads' else 'write_ms'].extend(latencies)
+
+        seed = options['seed']
+        threads = [threading.Thread(target=worker, args=('reads', seed + i)) for i in range(options['readers'])]
+        threads += [threading.Thread(target=worker, args=('writes', seed + 100 + i)) for i in range(options['writers'])]
+        for t in threads:
+            t.start()
+        time.sleep(options['duration'])
+        stop.set()
+        for t in threads:
+            t.join()
+
+        duration = options['duration']
+        return {
+            'reads': totals['reads'] / duration,
+            'writes': totals['writes'] / duration,
+            'locked': totals['locked'],
+            'read_p50': statistics.median(totals['read_ms']) if totals['read_ms'] else 0.0,
+            'read_p99': _percentile(totals['read_ms'], 99),
+            'write_p50': statistics.median(totals['write_ms']) if totals['write_ms'] else 0.0,
+            'write_p99': _percentile(totals['write_ms'], 99),
+        }
+
+    def _print(self, label, r):
+        self.stdout.write(
+            f"{label:<6} reads/s {r['reads']:>8.1f} (p50 {r['read_p50']:.1f} ms, p99 {r['read_p99']:.1f} ms)  "
+            f"writes/s {r['writes']:>7.1f} (p50 {r['write_p50']:.1f} ms, p99 {r['write_p99']:.1f} ms)  "
+            f"locked {r['locked']}"
+        )
@@ -0,0 +1,194 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from reports.cache import report_cache
+from reports import summary_builder
+from workboard.synthetic import generate_board
+from datetime import datetime, timezone
+import json
+import math
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+import django
+
+
+# name -> (kind, target, query budget as (fixed, per 1,000 tickets)).
+# Builders are called directly; endpoints go through the full request stack.
+# A budget that grows with the board means a query per row (N+1) crept in.
+BENCHMARKS = {
+    'analyze_risks': ('builder', summary_builder.analyze_risks, (6, 0)),
+    'build_daily_standup': ('builder', summary_builder.build_daily_standup, (6, 0)),
+    'build_weekly_client': ('builder', summary_builder.build_weekly_client, (6, 0)),
+    'get_dashboard_stats': ('builder', summary_builder.get_dashboard_stats, (6, 0)),
+    'aggregate_project': ('endpoint', '/api/workboard/aggregate/', (8, 8)),
+    'debug_ticket_statuses': ('endpoint', '/api/workboard/debug/ticket_statuses/', (3, 2)),
+}
+
+
+def query_budget(name, tickets):
+    fixed, per_thousand = BENCHMARKS[name][2]
+    return fixed + math.ceil(per_thousand * tickets / 1000)
+
+
+class _QueryCounter:
+    """Counts statements through ``connection.execute_wrapper``.
+
+    ``CaptureQueriesContext`` loses queries when the test client's
+    ``request_started`` signal resets the query log, so count them directly.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the report builders and heavy workboard endpoints on generated boards '
+        '(wall time, SQL query count, peak Python memory). Runs against a throwaway test '
+        'database, writes JSON results and fails if any case exceeds its query budget.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,100000', help='Comma-separated board sizes in tickets')
+        parser.add_argument('--only', action='append', choices=sorted(BENCHMARKS), help='Run only this case (repeatable)')
+        parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case; the median is reported')
+        parser.add_argument('--seed', type=int, default=0, help='Seed for the generated boards')
+        parser.add_argument('--output', default='', help='Write JSON results to this file')
+        parser.add_argument('--compare', default='', help='Earlier JSON results to print deltas against')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted({int(s) for s in options['sizes'].split(',') if s.strip()})
+        except ValueError:
+            raise CommandError('--sizes must be comma-separated integers')
+        names = options['only'] or list(BENCHMARKS)
+        repeat = max(1, options['repeat'])
+
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            results = self._run(sizes, names, repeat, options['seed'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        report = {
+            'meta': {
+                'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'git_revision': _git_revision(),
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'seed': options['seed'],
+                'repeat': repeat,
+            },
+            'results': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as fh:
+                json.dump(report, fh, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+        if options['compare']:
+            self._compare(options['compare'], results)
+
+        over = [r for r in results if not r['within_budget']]
+        if over:
+            raise CommandError('Query budget exceeded: ' + ', '.join(
+                f"{r['name']}@{r['tickets']} ({r['queries']} > {r['query_budget']})" for r in over
+            ))
+        self.stdout.write(self.style.SUCCESS(f'{len(results)} case(s) within their query budgets'))
+
+    def _run(self, sizes, names, repeat, seed):
+        client = Client()
+        results = []
+        current = 0
+        for i, size in enumerate(sizes):
+            if size > current:
+                self.stdout.write(f'Generating board: {current} -> {size} tickets')
+                generate_board(tickets=size - current, seed=seed + i)
+                current = size
+            self.stdout.write(f'{"case":<24}{"tickets":>9}{"median ms":>12}{"queries":>9}{"budget":>8}{"peak KiB":>11}')
+            for name in names:
+                kind, target, _ = BENCHMARKS[name]
+                if kind == 'builder':
+                    call = target
+                else:
+                    def call(path=target):
+                        response = client.get(path)
+                        if response.status_code != 200:
+                            raise CommandError(f'{path} returned {response.status_code}')
+                        return response.content
+                result = self._measure(name, call, size, repeat)
+                results.append(result)
+                self.stdout.write(
+                    f"{name:<24}{size:>9}{result['wall_ms']:>12.1f}{result['queries']:>9}"
+                    f"{result['query_budget']:>8}{result['peak_kib']:>11}"
+                    + ('' if result['within_budget'] else self.style.ERROR('  over budget'))
+                )
+        return results
+
+    def _measure(self, name, call, tickets, repeat):
+        # warm-up: import paths, graph index, data source caches
+        report_cache.clear()
+        call()
+
+        report_cache.clear()
+        counter = _QueryCounter()
+        tracemalloc.start()
+        with connection.execute_wrapper(counter):
+            call()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        runs = []
+        for _ in range(repeat):
+            report_cache.clear()
+            started = time.perf_counter()
+            call()
+            runs.append((time.perf_counter() - started) * 1000)
+
+        budget = query_budget(name, tickets)
+        return {
+            'name': name,
+            'tickets': tickets,
+            'wall_ms': round(statistics.median(runs), 2),
+            'wall_ms_runs': [round(r, 2) for r in runs],
+            'queries': counter.count,
+            'query_budget': budget,
+            'within_budget': counter.count <= budget,
+            'peak_kib': peak // 1024,
+        }
+
+    def _compare(self, path, results):
+        try:
+            with open(path, encoding='utf-8') as fh:
+                baseline = json.load(fh)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f'Cannot read {path}: {exc}')
+        previous = {(r['name'], r['tickets']): r for r in baseline.get('results', [])}
+        self.stdout.write(f"Compared with {path} ({baseline.get('meta', {}).get('git_revision') or 'unknown revision'}):")
+        for r in results:
+            old = previous.get((r['name'], r['tickets']))
+            if old is None:
+                continue
+            ratio = r['wall_ms'] / old['wall_ms'] if old['wall_ms'] else float('inf')
+            self.stdout.write(
+                f"  {r['name']:<24}{r['tickets']:>9}  time x{ratio:.2f}  "
+                f"queries {old['queries']} -> {r['queries']}  peak KiB {old['peak_kib']} -> {r['peak_kib']}"
+            )
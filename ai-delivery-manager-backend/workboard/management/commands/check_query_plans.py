@@ -0,0 +1,130 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from reports.cache import report_cache
+from reports import summary_builder
+from workboard.models import Team, Ticket
+from workboard.synthetic import generate_board
+import re
+
+
+# Bare "SCAN <table>" (no index) in SQLite's EXPLAIN QUERY PLAN output;
+# older SQLite versions print "SCAN TABLE <table>".
+FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$')
+TEMP_SORT = 'USE TEMP B-TREE FOR ORDER BY'
+
+
+def _workloads(client):
+    """(label, callable) pairs covering the report builders and list reads."""
+    ticket_id = Ticket.objects.order_by('id').values_list('id', flat=True).first()
+    team_id = Team.objects.order_by('id').values_list('id', flat=True).first()
+    assignee_id = Ticket.objects.exclude(assignee=None).values_list('assignee_id', flat=True).first()
+
+    def get(path):
+        response = client.get(path)
+        if response.status_code != 200:
+            raise CommandError(f'{path} returned {response.status_code}')
+        return response
+
+    def paged(path):
+        def run():
+            page = get(path).json()
+            if page.get('next_cursor'):
+                get(f"{path}&cursor={page['next_cursor']}")
+        return run
+
+    return [
+        ('analyze_risks', summary_builder.analyze_risks),
+        ('build_daily_standup', summary_builder.build_daily_standup),
+        ('build_weekly_client', summary_builder.build_weekly_client),
+        ('get_dashboard_stats', summary_builder.get_dashboard_stats),
+        ('get_dashboard_stats(team)', lambda: summary_builder.get_dashboard_stats(team_id=team_id)),
+        ('tickets list', paged('/api/workboard/tickets/?limit=50&count=exact')),
+        ('tickets by status', paged('/api/workboard/tickets/?status=BLOCKED&limit=50&count=exact')),
+        ('tickets by assignee', paged(f'/api/workboard/tickets/?assignee_id={assignee_id}&limit=50')),
+        ('aggregate page', paged('/api/workboard/aggregate/?limit=200')),
+        ('ticket blockers', lambda: get(f'/api/workboard/tickets/{ticket_id}/blockers/')),
+        ('ticket downstream', lambda: get(f'/api/workboard/tickets/{ticket_id}/downstream/')),
+        ('ticket critical path', lambda: get(f'/api/workboard/tickets/{ticket_id}/critical-path/')),
+    ]
+
+
+class _Statements:
+    def __init__(self):
+        self.seen = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        if not many and sql.lstrip().upper().startswith('SELECT'):
+            self.seen.setdefault(sql, params)
+        return execute(sql, params, many, context)
+
+
+def problems(sql, plan):
+    """Reasons a statement's plan is unacceptable (empty if it is fine).
+
+    Unfiltered reads (no WHERE, no LIMIT) load whole tables on purpose, such
+    as the report snapshot, and may scan. A filtered or LIMIT-ed statement
+    must reach its rows through an index.
+    """
+    upper = sql.upper()
+    filtered = ' WHERE ' in upper
+    limited = ' LIMIT ' in upper
+    found = []
+    for detail in plan:
+        m = FULL_SCAN.match(detail)
+        if not m:
+            continue
+        if filtered:
+            found.append(f'full scan of {m.group(1)} for a filtered read')
+        elif limited and TEMP_SORT in plan:
+            found.append(f'sorts all of {m.group(1)} to return a LIMIT')
+    return found
+
+
+class Command(BaseCommand):
+    help = (
+        'Run the report builders and workboard list endpoints on a generated board in a throwaway '
+        'test database, capture every SELECT they issue and check its SQLite EXPLAIN QUERY PLAN. '
+        'Fails if a filtered or LIMIT-ed query falls back to a full table scan.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tickets', type=int, default=2000, help='Size of the generated board')
+        parser.add_argument('--verbose-plans', action='store_true', help='Print the plan of every statement')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('EXPLAIN QUERY PLAN checks need the SQLite backend')
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            generate_board(tickets=options['tickets'])
+            failures = self._check(options['verbose_plans'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+        if failures:
+            raise CommandError(f'{failures} statement(s) fall back to full scans')
+        self.stdout.write(self.style.SUCCESS('All captured report queries use indexes'))
+
+    def _check(self, verbose):
+        client = Client()
+        failures = 0
+        for label, run in _workloads(client):
+            report_cache.clear()
+            statements = _Statements()
+            with connection.execute_wrapper(statements):
+                run()
+            self.stdout.write(f'{label}: {len(statements.seen)} distinct statement(s)')
+            for sql, params in statements.seen.items():
+                with connection.cursor() as cursor:
+                    cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+                    plan = [row[-1] for row in cursor.fetchall()]
+                found = problems(sql, plan)
+                if found or verbose:
+                    self.stdout.write(f'  {sql[:200]}')
+                    for detail in plan:
+                        self.stdout.write(f'    {detail}')
+                for reason in found:
+                    failures += 1
+                    self.stdout.write(self.style.ERROR(f'    -> {reason}'))
+        return failures
@@ -0,0 +1,269 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from data_sources.loaders import iter_records
+from workboard import events, history
+from workboard.counters import rebuild_counters
+from workboard.generation import bump_generation
+from workboard.graph import DependencyGraph
+from workboard.keys import sync_sequences
+from workboard.models import Team, Member, Ticket, PullRequest, Dependency, Commit
+from datetime import datetime
+import re
+
+
+STATUS_ALIASES = {
+    'TO_DO': 'TODO',
+    'OPEN': 'TODO',
+    'INPROGRESS': 'IN_PROGRESS',
+    'IN_DEVELOPMENT': 'IN_PROGRESS',
+    'REVIEW': 'IN_REVIEW',
+    'CODE_REVIEW': 'IN_REVIEW',
+    'COMPLETED': 'DONE',
+    'CLOSED': 'DONE',
+    'RESOLVED': 'DONE',
+}
+
+TICKET_FIELDS = ('title', 'description', 'status', 'priority', 'due_date', 'assignee_id')
+PR_FIELDS = ('repo', 'title', 'status', 'url', 'author_id')
+COMMIT_FIELDS = ('repo', 'message', 'author_id', 'date')
+
+
+def _batches(records, size):
+    batch = []
+    for rec in records:
+        batch.append(rec)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _status(value):
+    s = re.sub(r'[\s-]+', '_', str(value or 'TODO').strip().upper())
+    return STATUS_ALIASES.get(s, s)
+
+
+def _date(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value)).date()
+    except ValueError:
+        return None
+
+
+def _keys(value):
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [k.strip() for k in value.split(',') if k.strip()]
+    return [str(k) for k in value]
+
+
+class Command(BaseCommand):
+    help = (
+        'Import tickets, members, PRs, commits and dependencies from the data_sources exports '
+        '(jira_tickets / git_activity, JSON or JSONL, optionally gzipped). Upserts tickets by key, '
+        'members by name, commits by sha and PRs by url (or repo + title), in batched '
+        'bulk_create / bulk_update transactions. Re-running on an unchanged export writes nothing. '
+        'Ticket creations and status or team changes are recorded in the status history as they are written.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jira', default='jira_tickets.json', help='Jira export name inside DATA_SOURCES_DIR')
+        parser.add_argument('--git', default='git_activity.json', help='Git export name inside DATA_SOURCES_DIR')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Records read and written per transaction')
+        parser.add_argument('--team', default='', help='Team for newly created members (created if missing)')
+
+    def handle(self, *args, **options):
+        self.batch_size = max(1, options['batch_size'])
+        self.team = Team.objects.get_or_create(name=options['team'])[0] if options['team'] else None
+        self.members = dict(Member.objects.values_list('name', 'id'))
+        self.member_teams = dict(Member.objects.values_list('id', 'team_id'))
+        self.stats = {k: 0 for k in (
+            'members_created', 'tickets_created', 'tickets_updated', 'prs_created', 'prs_updated',
+            'pr_links_created', 'commits_created', 'commits_updated', 'dependencies_created', 'dependencies_skipped',
+        )}
+
+        for batch in _batches(iter_records(options['jira'], missing_ok=True), self.batch_size):
+            with transaction.atomic():
+                self._import_tickets(batch)
+        # second pass: every ticket key now exists, so edges can be resolved
+        graph = DependencyGraph(Dependency.objects.values_list('ticket_id', 'depends_on_id').iterator())
+        for batch in _batches(iter_records(options['jira'], missing_ok=True), self.batch_size):
+            with transaction.atomic():
+                self._import_dependencies(batch, graph)
+        for batch in _batches(iter_records(options['git'], missing_ok=True), self.batch_size):
+            with transaction.atomic():
+                self._import_git(batch)
+
+        changed = any(v for k, v in self.stats.items() if k != 'dependencies_skipped')
+        if changed:
+            # bulk writes bypass model signals; bring derived state up to date
+            rebuild_counters()
+            sync_sequences()
+            bump_generation()
+            events.publish('resync', {'source': 'import_workboard'})
+        summary = ', '.join(f'{k}={v}' for k, v in self.stats.items())
+        self.stdout.write(self.style.SUCCESS(f'Import finished ({summary})' if changed else f'Nothing to import ({summary})'))
+
+    # --- helpers ------------------------------------------------------------
+
+    def _member_ids(self, names):
+        missing = {n for n in names if n and n not in self.members}
+        if missing:
+            Member.objects.bulk_create(
+                [Member(name=n, team=self.team) for n in sorted(missing)], batch_size=self.batch_size,
+            )
+            created = list(Member.objects.filter(name__in=missing).values_list('name', 'id'))
+            self.members.update(created)
+            self.member_teams.update((member_id, self.team and self.team.id) for _, member_id in created)
+            self.stats['members_created'] += len(missing)
+        return self.members
+
+    def _upsert(self, model, lookup, rows, fields, stat):
+        """Create or update ``rows`` (natural key -> field dict) against ``lookup`` (key -> instance).
+
+        Returns the created and the updated instances.
+        """
+        now = timezone.now()
+        to_create, to_update = [], []
+        for key, values in rows.items():
+            obj = lookup.get(key)
+            if obj is None:
+                to_create.append(model(**values))
+                continue
+            if any(getattr(obj, f) != values[f] for f in fields):
+                for f in fields:
+                    setattr(obj, f, values[f])
+                to_update.append(obj)
+        if to_create:
+            model.objects.bulk_create(to_create, batch_size=self.batch_size)
+            self.stats[f'{stat}_created'] += len(to_create)
+        if to_update:
+            update_fields = list(fields)
+            if any(f.name == 'updated_at' for f in model._meta.fields):
+                for obj in to_update:
+                    obj.updated_at = now
+                update_fields.append('updated_at')
+            model.objects.bulk_update(to_update, update_fields, batch_size=self.batch_size)
+            self.stats[f'{stat}_updated'] += len(to_update)
+        return to_create, to_update
+
+    # --- Jira ---------------------------------------------------------------
+
+    def _import_tickets(self, batch):
+        members = self._member_ids({r.get('assignee') for r in batch})
+        rows = {}
+        for r in batch:
+            key = r.get('key') or r.get('id')
+            if not key:
+                continue
+            rows[str(key)] = {
+                'key': str(key),
+                'title': (r.get('title') or r.get('summary') or '')[:255],
+                'description': r.get('description') or r.get('blocked_reason') or '',
+                'status': _status(r.get('status')),
+                'priority': r.get('priority') or '',
+                'due_date': _date(r.get('due_date')),
+                'assignee_id': members.get(r.get('assignee')),
+            }
+        existing = {t.key: t for t in Ticket.objects.filter(key__in=rows).only('id', 'key', *TICKET_FIELDS)}
+        before = {key: self._history_state(t) for key, t in existing.items()}
+        created, updated = self._upsert(Ticket, existing, rows, TICKET_FIELDS, 'tickets')
+        # bulk writes send no signals; record the history as bulk._after_write does
+        history.tickets_changed([(t.id, before.get(t.key), self._history_state(t)) for t in created + updated])
+
+    def _history_state(self, ticket):
+        team_id = self.member_teams.get(ticket.assignee_id) if ticket.assignee_id is not None else None
+        return team_id, ticket.status
+
+    def _import_dependencies(self, batch, graph):
+        wanted = []
+        for r in batch:
+            key = r.get('key') or r.get('id')
+            for dep in _keys(r.get('depends_on')) + _keys(r.get('blocked_by')):
+                wanted.append((str(key), dep))
+        if not wanted:
+            return
+        keys = {k for pair in wanted for k in pair}
+        ids = dict(Ticket.objects.filter(key__in=keys).values_list('key', 'id'))
+        new_edges = []
+        for ticket_key, dep_key in wanted:
+            a, b = ids.get(ticket_key), ids.get(dep_key)
+            if a is None or b is None or b in graph.deps.get(a, ()):
+                continue
+            if graph.would_create_cycle(a, b):
+                self.stderr.write(f'Skipping {ticket_key} -> {dep_key}: would create a dependency cycle')
+                self.stats['dependencies_skipped'] += 1
+                continue
+            graph.add_edge(a, b)
+            new_edges.append(Dependency(ticket_id=a, depends_on_id=b, note='Imported'))
+        if new_edges:
+            Dependency.objects.bulk_create(new_edges, batch_size=self.batch_size, ignore_conflicts=True)
+            self.stats['dependencies_created'] += len(new_edges)
+
+    # --- Git ----------------------------------------------------------------
+
+    def _import_git(self, batch):
+        members = self._member_ids({r.get('author') for r in batch})
+        commits, prs, pr_tickets = {}, {}, {}
+        for r in batch:
+            if r.get('type') in ('pr', 'pull_request'):
+                key = r.get('url') or (r.get('repo') or '', r.get('title') or '')
+                prs[key] = {
+                    'repo': r.get('repo') or '',
+                    'title': (r.get('title') or '')[:255],
+                    'status': r.get('status') or 'Open',
+                    'url': r.get('url') or '',
+                    'author_id': members.get(r.get('author')),
+                }
+                pr_tickets[key] = _keys(r.get('tickets'))
+            elif r.get('sha'):
+                commits[r['sha']] = {
+                    'sha': r['sha'],
+                    'repo': r.get('repo') or '',
+                    'message': r.get('commit') or r.get('message') or '',
+                    'author_id': members.get(r.get('author')),
+                    'date': _date(r.get('date')),
+                }
+
+        if commits:
+            existing = {c.sha: c for c in Commit.objects.filter(sha__in=commits).only('id', 'sha', *COMMIT_FIELDS)}
+            self._upsert(Commit, existing, commits, COMMIT_FIELDS, 'commits')
+
+        if prs:
+            urls = [k for k in prs if isinstance(k, str)]
+            titles = [k[1] for k in prs if isinstance(k, tuple)]
+            existing = {}
+            for pr in PullRequest.objects.filter(url__in=urls).only('id', *PR_FIELDS):
+                existing[pr.url] = pr
+            for pr in PullRequest.objects.filter(url='', title__in=titles).only('id', *PR_FIELDS):
+                existing[(pr.repo, pr.title)] = pr
+            self._upsert(PullRequest, existing, prs, PR_FIELDS, 'prs')
+            self._link_prs(prs, pr_tickets, urls, titles)
+
+    def _link_prs(self, prs, pr_tickets, urls, titles):
+        pr_ids = {pr.url: pr.id for pr in PullRequest.objects.filter(url__in=urls).only('id', 'url')}
+        pr_ids.update({
+            (pr.repo, pr.title): pr.id
+            for pr in PullRequest.objects.filter(url='', title__in=titles).only('id', 'repo', 'title')
+        })
+        ticket_ids = dict(Ticket.objects.filter(
+            key__in={k for keys in pr_tickets.values() for k in keys}
+        ).values_list('key', 'id'))
+        Link = Ticket.prs.through
+        pairs = {
+            (ticket_ids[k], pr_ids[pr_key])
+            for pr_key, keys in pr_tickets.items() for k in keys
+            if k in ticket_ids and pr_key in pr_ids
+        }
+        if not pairs:
+            return
+        existing = set(Link.objects.filter(pullrequest_id__in={p for _, p in pairs}).values_list('ticket_id', 'pullrequest_id'))
+        new = [Link(ticket_id=t, pullrequest_id=p) for t, p in pairs - existing]
+        if new:
+            Link.objects.bulk_create(new, batch_size=self.batch_size, ignore_conflicts=True)
+            self.stats['pr_links_created'] += len(new)
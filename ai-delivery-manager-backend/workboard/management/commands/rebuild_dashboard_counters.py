@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from workboard.counters import rebuild_counters, COUNTER_FIELDS
+from workboard.models import DashboardCounters
+
+
+class Command(BaseCommand):
+    help = 'Recompute the materialized dashboard counters from tickets, PRs and members (repairs drift)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--team', type=int, action='append', help='Only rebuild the row of this team id (repeatable)')
+
+    def handle(self, *args, **options):
+        team_ids = options.get('team')
+        before = {
+            row.team_id: {f: getattr(row, f) for f in COUNTER_FIELDS}
+            for row in DashboardCounters.objects.all()
+        }
+        scopes = rebuild_counters(team_ids)
+
+        drifted = 0
+        for team_id, values in scopes.items():
+            old = before.get(team_id)
+            if old is not None and old != values:
+                drifted += 1
+                diff = {f: (old[f], values[f]) for f in COUNTER_FIELDS if old[f] != values[f]}
+                self.stdout.write(f"Repaired {'team ' + str(team_id) if team_id else 'board-wide'} row: {diff}")
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {len(scopes)} counter row(s), {drifted} had drifted'))
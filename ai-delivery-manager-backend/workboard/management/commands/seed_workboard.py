@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from workboard import keys
 from workboard.models import Team, Member, Ticket, PullRequest, Dependency
 from django.utils import timezone
 import datetime
@@ -115,6 +116,8 @@ class Command(BaseCommand):
         Dependency.objects.create(ticket=t3, depends_on=t1, note='Payment flow requires auth API to be fully implemented')
         Dependency.objects.create(ticket=t8, depends_on=t2, note='E2E tests need dashboard UI to be stable')
         Dependency.objects.create(ticket=t9, depends_on=t1, note='Security audit scope includes auth endpoints')
+        # the demo keys are fixed; new tickets continue after them
+        keys.sync_sequences()
 
         self.stdout.write(self.style.SUCCESS(
             'Seeded: 1 team, 4 members, 7 PRs, 10 tickets, 3 dependencies'
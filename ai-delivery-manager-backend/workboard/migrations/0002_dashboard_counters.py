@@ -0,0 +1,37 @@
+# Generated by Django 6.0.2 on 2026-10-18 10:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workboard', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCounters',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_tickets', models.IntegerField(default=0)),
+                ('todo', models.IntegerField(default=0)),
+                ('in_progress', models.IntegerField(default=0)),
+                ('in_review', models.IntegerField(default=0)),
+                ('done', models.IntegerField(default=0)),
+                ('blocked', models.IntegerField(default=0)),
+                ('overdue', models.IntegerField(default=0)),
+                ('overdue_as_of', models.DateField(blank=True, null=True)),
+                ('total_prs', models.IntegerField(default=0)),
+                ('open_prs', models.IntegerField(default=0)),
+                ('merged_prs', models.IntegerField(default=0)),
+                ('total_members', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('team', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_counters', to='workboard.team')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(models.Value(1), condition=models.Q(('team__isnull', True)), name='counters_one_board_row')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.2 on 2026-10-18 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workboard', '0003_data_generation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Commit',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha', models.CharField(max_length=64, unique=True)),
+                ('repo', models.CharField(blank=True, max_length=200)),
+                ('message', models.TextField(blank=True)),
+                ('date', models.DateField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('author', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='commits', to='workboard.member')),
+            ],
+        ),
+    ]
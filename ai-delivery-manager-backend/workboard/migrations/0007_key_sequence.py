@@ -0,0 +1,20 @@
+# Generated by Django 6.0.2 on 2026-10-18 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workboard', '0006_change_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeySequence',
+            fields=[
+                ('project', models.CharField(max_length=12, primary_key=True, serialize=False)),
+                ('next_value', models.BigIntegerField(default=1)),
+            ],
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 6.0.2 on 2026-10-18 15:20
+
+from django.db import migrations
+
+# SQLite FTS5 index behind /api/workboard/search/ (see workboard.fulltext).
+# Tickets use rowid 2 * id and PRs 2 * id + 1; triggers keep the index in
+# step with every insert, update and delete, bulk writes included.
+CREATE = [
+    """CREATE VIRTUAL TABLE workboard_search USING fts5(
+        kind UNINDEXED, ref UNINDEXED, key, title, description,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+    )""",
+    # rank = bm25 weighted key > title > description
+    "INSERT INTO workboard_search(workboard_search, rank) VALUES ('rank', 'bm25(0.0, 0.0, 10.0, 4.0, 1.0)')",
+    """CREATE TRIGGER workboard_search_ticket_ai AFTER INSERT ON workboard_ticket BEGIN
+        INSERT INTO workboard_search(rowid, kind, ref, key, title, description)
+        VALUES (new.id * 2, 'ticket', new.id, new.key, new.title, new.description);
+    END""",
+    """CREATE TRIGGER workboard_search_ticket_au AFTER UPDATE OF key, title, description ON workboard_ticket BEGIN
+        UPDATE workboard_search SET key = new.key, title = new.title, description = new.description
+        WHERE rowid = old.id * 2;
+    END""",
+    """CREATE TRIGGER workboard_search_ticket_ad AFTER DELETE ON workboard_ticket BEGIN
+        DELETE FROM workboard_search WHERE rowid = old.id * 2;
+    END""",
+    """CREATE TRIGGER workboard_search_pr_ai AFTER INSERT ON workboard_pullrequest BEGIN
+        INSERT INTO workboard_search(rowid, kind, ref, key, title, description)
+        VALUES (new.id * 2 + 1, 'pr', new.id, '', new.title, '');
+    END""",
+    """CREATE TRIGGER workboard_search_pr_au AFTER UPDATE OF title ON workboard_pullrequest BEGIN
+        UPDATE workboard_search SET title = new.title WHERE rowid = old.id * 2 + 1;
+    END""",
+    """CREATE TRIGGER workboard_search_pr_ad AFTER DELETE ON workboard_pullrequest BEGIN
+        DELETE FROM workboard_search WHERE rowid = old.id * 2 + 1;
+    END""",
+    """INSERT INTO workboard_search(rowid, kind, ref, key, title, description)
+        SELECT id * 2, 'ticket', id, key, title, description FROM workboard_ticket""",
+    """INSERT INTO workboard_search(rowid, kind, ref, key, title, description)
+        SELECT id * 2 + 1, 'pr', id, '', title, '' FROM workboard_pullrequest""",
+]
+
+DROP = [
+    *(f'DROP TRIGGER IF EXISTS workboard_search_{t}' for t in (
+        'ticket_ai', 'ticket_au', 'ticket_ad', 'pr_ai', 'pr_au', 'pr_ad',
+    )),
+    'DROP TABLE IF EXISTS workboard_search',
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workboard', '0007_key_sequence'),
+    ]
+
+    operations = [
+        migrations.RunPython(_run(CREATE), _run(DROP)),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 6.0.2 on 2026-10-18 16:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+def baseline(apps, schema_editor):
+    # history starts today: seed today's totals from the current tickets
+    Ticket = apps.get_model('workboard', 'Ticket')
+    DailyStatusRollup = apps.get_model('workboard', 'DailyStatusRollup')
+    today = timezone.now().date()
+    counts = {}
+    for row in Ticket.objects.order_by().values('assignee__team_id', 'status').annotate(n=Count('id')):
+        for scope in {None, row['assignee__team_id']}:
+            counts[(scope, row['status'])] = counts.get((scope, row['status']), 0) + row['n']
+    DailyStatusRollup.objects.bulk_create([
+        DailyStatusRollup(team_id=team_id, day=today, status=status, count=n)
+        for (team_id, status), n in counts.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workboard', '0008_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusTransition',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('ticket_id', models.IntegerField(db_index=True)),
+                ('from_status', models.CharField(blank=True, max_length=30)),
+                ('to_status', models.CharField(blank=True, max_length=30)),
+                ('from_team_id', models.IntegerField(blank=True, null=True)),
+                ('to_team_id', models.IntegerField(blank=True, null=True)),
+                ('at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DailyStatusRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(max_length=30)),
+                ('count', models.IntegerField(default=0)),
+                ('entered', models.IntegerField(default=0)),
+                ('exited', models.IntegerField(default=0)),
+                ('team', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='status_rollups', to='workboard.team')),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(condition=models.Q(('team__isnull', False)), fields=('team', 'day', 'status'), name='rollup_team_day_status_uniq'),
+                    models.UniqueConstraint(condition=models.Q(('team__isnull', True)), fields=('day', 'status'), name='rollup_board_day_status_uniq'),
+                ],
+            },
+        ),
+        migrations.RunPython(baseline, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.2 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workboard', '0009_status_history'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dependency',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='dependency',
+            index=models.Index(fields=['updated_at'], name='dependency_updated_idx'),
+        ),
+    ]
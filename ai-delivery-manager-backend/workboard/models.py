@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from rest_framework.utils.encoders import JSONEncoder
 
 
 class Team(models.Model):
@@ -29,10 +30,28 @@ class PullRequest(models.Model):
     url = models.URLField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='pr_status_created_idx'),
+            models.Index(fields=['created_at'], name='pr_created_idx'),
+        ]
+
     def __str__(self):
         return f"PR: {self.title} ({self.status})"
 
 
+class Commit(models.Model):
+    sha = models.CharField(max_length=64, unique=True)
+    repo = models.CharField(max_length=200, blank=True)
+    message = models.TextField(blank=True)
+    author = models.ForeignKey(Member, on_delete=models.SET_NULL, null=True, blank=True, related_name='commits')
+    date = models.DateField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.sha[:7]} {self.message[:60]}"
+
+
 class Ticket(models.Model):
     STATUS_CHOICES = [
         ('TODO', 'To Do'),
@@ -53,6 +72,26 @@ class Ticket(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # Matched to the report and list filters; SQLite appends the rowid
+        # to every index, so "ORDER BY created_at, id" needs no sort step.
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='ticket_status_created_idx'),
+            models.Index(fields=['status', 'priority'], name='ticket_status_priority_idx'),
+            models.Index(fields=['assignee', 'status'], name='ticket_assignee_status_idx'),
+            # overdue lookups filter "status != DONE AND due_date < today":
+            # range on due_date first, status checked inside the index
+            models.Index(fields=['due_date', 'status'], name='ticket_due_status_idx'),
+            models.Index(fields=['created_at'], name='ticket_created_idx'),
+            models.Index(fields=['updated_at'], name='ticket_updated_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # one transaction for the row and what its signals write (counters,
+        # history, events, generation) instead of a commit per statement
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.key} - {self.title}"
 
@@ -61,9 +100,137 @@ class Dependency(models.Model):
     ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name='dependencies')
     depends_on = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name='dependents')
     note = models.CharField(max_length=255, blank=True)
+    # part of the dependency graph's change marker (workboard/graph.py)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ('ticket', 'depends_on')
+        indexes = [
+            models.Index(fields=['updated_at'], name='dependency_updated_idx'),
+        ]
 
     def __str__(self):
         return f"{self.ticket.key} depends on {self.depends_on.key}"
+
+
+class DashboardCounters(models.Model):
+    """Materialized dashboard totals, kept up to date by workboard signals.
+
+    One row per team plus a board-wide row (``team`` is NULL). Overdue counts
+    depend on the current date, so they are recomputed whenever
+    ``overdue_as_of`` falls behind today.
+    """
+    team = models.OneToOneField(Team, on_delete=models.CASCADE, null=True, blank=True, related_name='dashboard_counters')
+    total_tickets = models.IntegerField(default=0)
+    todo = models.IntegerField(default=0)
+    in_progress = models.IntegerField(default=0)
+    in_review = models.IntegerField(default=0)
+    done = models.IntegerField(default=0)
+    blocked = models.IntegerField(default=0)
+    overdue = models.IntegerField(default=0)
+    overdue_as_of = models.DateField(null=True, blank=True)
+    total_prs = models.IntegerField(default=0)
+    open_prs = models.IntegerField(default=0)
+    merged_prs = models.IntegerField(default=0)
+    total_members = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # team is unique already, but NULLs never collide; this keeps the
+        # board-wide row single
+        constraints = [
+            models.UniqueConstraint(
+                models.Value(1), condition=models.Q(team__isnull=True), name='counters_one_board_row',
+            ),
+        ]
+
+    def __str__(self):
+        return f"Counters for {self.team or 'all teams'}"
+
+
+class DataGeneration(models.Model):
+    """Single-row counter bumped on every workboard write (see ``workboard.generation``).
+
+    Lives in the database so that all workers observe the same value.
+    """
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"Workboard generation {self.value}"
+
+
+class ChangeEvent(models.Model):
+    """Append-only log of workboard changes streamed to clients over SSE.
+
+    Written by model signals inside the writer's transaction; old rows are
+    pruned as new ones arrive (see ``workboard.events``).
+    """
+    id = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=40)
+    data = models.JSONField(encoder=JSONEncoder, default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"#{self.id} {self.kind}"
+
+
+class KeySequence(models.Model):
+    """Next unused ticket key number per project prefix (see ``workboard.keys``)."""
+    project = models.CharField(max_length=12, primary_key=True)
+    next_value = models.BigIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.project}-{self.next_value}"
+
+
+class StatusTransition(models.Model):
+    """Append-only log of ticket status changes and team moves (see ``workboard.history``).
+
+    ``from_status`` is empty for a created ticket and ``to_status`` for a
+    deleted one; the ticket id is kept as a plain integer so the history
+    outlives the ticket.
+    """
+    id = models.BigAutoField(primary_key=True)
+    ticket_id = models.IntegerField(db_index=True)
+    from_status = models.CharField(max_length=30, blank=True)
+    to_status = models.CharField(max_length=30, blank=True)
+    from_team_id = models.IntegerField(null=True, blank=True)
+    to_team_id = models.IntegerField(null=True, blank=True)
+    at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"Ticket {self.ticket_id}: {self.from_status or '-'} -> {self.to_status or '-'}"
+
+
+class DailyStatusRollup(models.Model):
+    """Per-day ticket totals by status, maintained from ``StatusTransition`` writes.
+
+    Like ``DashboardCounters`` there is one set of rows per team plus a
+    board-wide set (``team`` NULL). ``count`` is the number of tickets in
+    ``status`` at the end of ``day``, carried forward from the previous row
+    when a day's row is first written; ``entered`` / ``exited`` count status
+    changes into and out of ``status`` that day (creating or deleting a
+    ticket is not a status change).
+    """
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, null=True, blank=True, related_name='status_rollups')
+    day = models.DateField()
+    status = models.CharField(max_length=30)
+    count = models.IntegerField(default=0)
+    entered = models.IntegerField(default=0)
+    exited = models.IntegerField(default=0)
+
+    class Meta:
+        # NULLs never collide in a unique index, so the board-wide rows get their own
+        constraints = [
+            models.UniqueConstraint(
+                fields=['team', 'day', 'status'], condition=models.Q(team__isnull=False),
+                name='rollup_team_day_status_uniq',
+            ),
+            models.UniqueConstraint(
+                fields=['day', 'status'], condition=models.Q(team__isnull=True),
+                name='rollup_board_day_status_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.status}: {self.count} ({self.team or 'all teams'})"
@@ -0,0 +1,28 @@
+"""Opaque keyset cursors shared by the paginated workboard reads."""
+import base64
+import json
+
+
+def encode_cursor(position):
+    """Encode a JSON-serialisable ``position`` dict as a URL-safe token."""
+    raw = json.dumps(position, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Inverse of ``encode_cursor``; raises ValueError on a malformed token."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        position = json.loads(raw)
+    except Exception as exc:
+        raise ValueError('invalid cursor') from exc
+    if not isinstance(position, dict):
+        raise ValueError('invalid cursor')
+    return position
+
+
+def parse_limit(value, default, maximum):
+    """Page size from a query param, clamped to ``[1, maximum]``."""
+    if value in (None, ''):
+        return default
+    return max(1, min(int(value), maximum))
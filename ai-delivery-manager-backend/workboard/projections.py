@@ -0,0 +1,105 @@
+"""Serializer-free rows for the read-only workboard lists.
+
+Each ``*_rows`` function reads ``values()`` projections and builds the same
+dicts, in the same key order, as the matching ``ModelSerializer`` from
+``workboard.serializers``. Encoded with ``renderers.dumps``, the bytes are
+identical to the serializer path (``benchmark_serializers`` checks this),
+but no model instances or per-field serializer calls are involved.
+"""
+from django.utils import timezone
+
+from .models import PullRequest
+
+MEMBER_COLUMNS = ('id', 'name', 'email', 'role', 'created_at', 'team_id')
+PR_COLUMNS = ('id', 'repo', 'title', 'status', 'url', 'created_at', 'author_id')
+# the assignee comes through the same LEFT JOIN select_related('assignee') uses
+TICKET_COLUMNS = (
+    'id', 'key', 'title', 'description', 'status', 'priority', 'due_date', 'created_at', 'updated_at',
+    *(f'assignee__{c}' for c in MEMBER_COLUMNS),
+)
+
+# PR links are read for this many tickets at a time
+LINK_CHUNK_SIZE = 500
+
+
+def _datetime(value, tz):
+    # DateTimeField.to_representation with the default ISO 8601 format
+    if not value:
+        return None
+    value = value.astimezone(tz).isoformat() if timezone.is_aware(value) else value.isoformat()
+    return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+
+def _date(value):
+    return value.isoformat() if value else None
+
+
+def _member(v, tz, prefix=''):
+    return {
+        'id': v[prefix + 'id'],
+        'name': v[prefix + 'name'],
+        'email': v[prefix + 'email'],
+        'role': v[prefix + 'role'],
+        'created_at': _datetime(v[prefix + 'created_at'], tz),
+        'team': v[prefix + 'team_id'],
+    }
+
+
+def _pr(v, tz):
+    return {
+        'id': v['id'],
+        'repo': v['repo'],
+        'title': v['title'],
+        'status': v['status'],
+        'url': v['url'],
+        'created_at': _datetime(v['created_at'], tz),
+        'author': v['author_id'],
+    }
+
+
+def member_rows(qs):
+    tz = timezone.get_current_timezone()
+    return [_member(v, tz) for v in qs.values(*MEMBER_COLUMNS)]
+
+
+def pr_rows(qs):
+    tz = timezone.get_current_timezone()
+    return [_pr(v, tz) for v in qs.values(*PR_COLUMNS)]
+
+
+def ticket_values(qs):
+    """``values()`` dicts for a ticket queryset; pass them to ``ticket_rows``."""
+    return list(qs.select_related(None).prefetch_related(None).values(*TICKET_COLUMNS))
+
+
+def _linked_prs(ticket_ids, tz):
+    # same join and filter as prefetch_related('prs'), so PRs keep its order
+    linked = {}
+    for i in range(0, len(ticket_ids), LINK_CHUNK_SIZE):
+        chunk = ticket_ids[i:i + LINK_CHUNK_SIZE]
+        rows = PullRequest.objects.filter(tickets__in=chunk).values(*PR_COLUMNS, 'tickets__id')
+        for v in rows:
+            linked.setdefault(v['tickets__id'], []).append(_pr(v, tz))
+    return linked
+
+
+def ticket_rows(values):
+    """TicketSerializer-shaped rows (nested ``prs`` and ``assignee``) for ``ticket_values()``."""
+    tz = timezone.get_current_timezone()
+    linked = _linked_prs([v['id'] for v in values], tz)
+    return [
+        {
+            'id': v['id'],
+            'prs': linked.get(v['id'], []),
+            'assignee': _member(v, tz, 'assignee__') if v['assignee__id'] is not None else None,
+            'key': v['key'],
+            'title': v['title'],
+            'description': v['description'],
+            'status': v['status'],
+            'priority': v['priority'],
+            'due_date': _date(v['due_date']),
+            'created_at': _datetime(v['created_at'], tz),
+            'updated_at': _datetime(v['updated_at'], tz),
+        }
+        for v in values
+    ]
@@ -0,0 +1,30 @@
+"""JSON encoding for the workboard fast read paths.
+
+``dumps`` produces the same bytes as DRF's ``JSONRenderer`` with the
+default settings (compact, unicode, ``\\u2028``/``\\u2029`` escaped) but
+encodes with ``orjson`` when it is installed. Dates and other non-JSON types
+still go through DRF's ``JSONEncoder.default``, and anything orjson rejects
+(non-string keys, huge ints) falls back to the stock renderer.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional; the stock renderer is used without it
+    orjson = None
+
+
+_default = JSONEncoder().default
+
+
+def dumps(data):
+    """``data`` as UTF-8 JSON bytes, identical to ``JSONRenderer().render(data)``."""
+    if orjson is not None:
+        try:
+            ret = orjson.dumps(data, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except (orjson.JSONEncodeError, ValueError):
+            pass
+        else:
+            return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+    return JSONRenderer().render(data)
@@ -1,35 +1,68 @@
 from rest_framework import serializers
 from .models import Team, Member, Ticket, PullRequest, Dependency
+from .graph import get_graph
+from .sparse import SparseFieldsMixin
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Team
         fields = '__all__'
 
 
-class MemberSerializer(serializers.ModelSerializer):
+class MemberSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    expandable = {'team': (TeamSerializer, False)}
+
     class Meta:
         model = Member
         fields = '__all__'
 
 
-class PullRequestSerializer(serializers.ModelSerializer):
+class PullRequestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    expandable = {'author': (MemberSerializer, False)}
+
     class Meta:
         model = PullRequest
         fields = '__all__'
 
 
-class TicketSerializer(serializers.ModelSerializer):
+class TicketSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     prs = PullRequestSerializer(many=True, read_only=True)
     assignee = MemberSerializer(read_only=True)
+    expandable = {'assignee': (MemberSerializer, False), 'prs': (PullRequestSerializer, True)}
 
     class Meta:
         model = Ticket
         fields = '__all__'
 
 
+class TicketCreateSerializer(TicketSerializer):
+    """Ticket input for the create endpoint; the server allocates the key."""
+
+    class Meta(TicketSerializer.Meta):
+        read_only_fields = ('key',)
+
+
 class DependencySerializer(serializers.ModelSerializer):
     class Meta:
         model = Dependency
         fields = '__all__'
+
+    def validate(self, attrs):
+        """Reject an edge that would close a cycle.
+
+        Run ``is_valid()`` and ``save()`` in one ``transaction.atomic()`` so the
+        graph checked here is the one the new edge is added to.
+        """
+        attrs = super().validate(attrs)
+        ticket = attrs.get('ticket', getattr(self.instance, 'ticket', None))
+        depends_on = attrs.get('depends_on', getattr(self.instance, 'depends_on', None))
+        if ticket is None or depends_on is None:
+            return attrs
+        path = get_graph().cycle_path(ticket.id, depends_on.id)
+        if path is not None:
+            keys = dict(Ticket.objects.filter(id__in=path).values_list('id', 'key'))
+            raise serializers.ValidationError({
+                'depends_on': f"Dependency would create a cycle: {' -> '.join(keys.get(i, str(i)) for i in path)}",
+            })
+        return attrs
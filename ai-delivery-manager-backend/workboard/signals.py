@@ -0,0 +1,245 @@
+"""Model signal handlers for the workboard app.
+
+Connected from ``WorkboardConfig.ready()``.
+"""
+from contextlib import contextmanager
+import threading
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.db import transaction
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import counters, events, history
+from .generation import bump_generation
+from .graph import graph_index
+from .models import DashboardCounters, Dependency, Member, PullRequest, Team, Ticket
+
+
+_state = threading.local()
+
+
+@contextmanager
+def muted():
+    """Skip the per-row Ticket and Dependency handlers in this thread.
+
+    For set-based writers (``workboard.bulk``) that keep counters, events,
+    the generation and the dependency graph up to date themselves.
+    """
+    _state.muted = True
+    try:
+        yield
+    finally:
+        _state.muted = False
+
+
+def _muted():
+    return getattr(_state, 'muted', False)
+
+
+def _due_date(instance):
+    return Ticket._meta.get_field('due_date').to_python(instance.due_date)
+
+
+# --- Ticket ------------------------------------------------------------------
+
+@receiver(pre_save, sender=Ticket)
+def ticket_pre_save(sender, instance, raw=False, **kwargs):
+    instance._counter_old = None
+    instance._event_old = None
+    if raw or instance.pk is None or _muted():
+        return
+    row = Ticket.objects.filter(pk=instance.pk).values_list(
+        'assignee__team_id', 'status', 'due_date', 'assignee_id'
+    ).first()
+    if row is not None:
+        instance._counter_old = row[:3]
+        instance._event_old = {'status': row[1], 'assignee_id': row[3]}
+
+
+def _ticket_event(instance, action, changed=()):
+    events.publish('ticket', events.ticket_event(instance, action, changed))
+
+
+@receiver(post_save, sender=Ticket)
+def ticket_post_save(sender, instance, created, raw=False, **kwargs):
+    if raw or _muted():
+        return
+    counter_old = getattr(instance, '_counter_old', None)
+    old = getattr(instance, '_event_old', None)
+    # the team only needs looking up when the assignee changed
+    if old is not None and old['assignee_id'] == instance.assignee_id:
+        team_id = counter_old[0]
+    else:
+        team_id = counters.member_team_id(instance.assignee_id)
+    new = (team_id, instance.status, _due_date(instance))
+    # the counter deltas and the ticket event go in as one INSERT
+    with events.batched():
+        counters.ticket_changed(counter_old, new)
+        history.tickets_changed([(instance.pk, counter_old[:2] if counter_old else None, new[:2])])
+        if created or old is None:
+            _ticket_event(instance, 'created')
+            return
+        changed = [f for f in ('status', 'assignee_id') if old[f] != getattr(instance, f)]
+        if changed:
+            _ticket_event(instance, 'updated', changed)
+
+
+@receiver(post_delete, sender=Ticket)
+def ticket_post_delete(sender, instance, **kwargs):
+    if _muted():
+        return
+    old = (counters.member_team_id(instance.assignee_id), instance.status, _due_date(instance))
+    with events.batched():
+        counters.ticket_changed(old, None)
+        history.tickets_changed([(instance.pk, old[:2], None)])
+        _ticket_event(instance, 'deleted')
+
+
+# --- PullRequest -------------------------------------------------------------
+
+@receiver(pre_save, sender=PullRequest)
+def pr_pre_save(sender, instance, raw=False, **kwargs):
+    instance._counter_old = None
+    if raw or instance.pk is None:
+        return
+    instance._counter_old = PullRequest.objects.filter(pk=instance.pk).values_list(
+        'author__team_id', 'status'
+    ).first()
+
+
+@receiver(post_save, sender=PullRequest)
+def pr_post_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    new = (counters.member_team_id(instance.author_id), instance.status)
+    counters.pr_changed(getattr(instance, '_counter_old', None), new)
+
+
+@receiver(post_delete, sender=PullRequest)
+def pr_post_delete(sender, instance, **kwargs):
+    counters.pr_changed((counters.member_team_id(instance.author_id), instance.status), None)
+
+
+# --- Member / Team -----------------------------------------------------------
+
+@receiver(pre_save, sender=Member)
+def member_pre_save(sender, instance, raw=False, **kwargs):
+    instance._counter_old_team = None
+    if raw or instance.pk is None:
+        return
+    instance._counter_old_team = Member.objects.filter(pk=instance.pk).values_list('team_id', flat=True).first()
+
+
+@receiver(post_save, sender=Member)
+def member_post_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        counters.apply_delta(instance.team_id, {'total_members': 1})
+        return
+    old_team = getattr(instance, '_counter_old_team', None)
+    if old_team != instance.team_id:
+        # the member's tickets and PRs move with them; rebuild both team rows
+        counters.rebuild_counters([t for t in (old_team, instance.team_id) if t is not None])
+        history.tickets_changed([
+            (ticket_id, (old_team, status), (instance.team_id, status))
+            for ticket_id, status in instance.tickets.values_list('id', 'status')
+        ])
+
+
+@receiver(pre_delete, sender=Member)
+def member_pre_delete(sender, instance, **kwargs):
+    # the member's tickets are about to lose their team (SET_NULL)
+    if instance.team_id is None:
+        return
+    history.tickets_changed([
+        (ticket_id, (instance.team_id, status), (None, status))
+        for ticket_id, status in instance.tickets.values_list('id', 'status')
+    ])
+
+
+@receiver(post_delete, sender=Member)
+def member_post_delete(sender, instance, **kwargs):
+    # tickets and PRs were detached (SET_NULL) before this fires, so the
+    # team row is rebuilt rather than adjusted
+    counters.apply_delta(None, {'total_members': -1})
+    if instance.team_id is not None and Team.objects.filter(pk=instance.team_id).exists():
+        counters.rebuild_counters([instance.team_id])
+
+
+@receiver(post_save, sender=Team)
+def team_post_save(sender, instance, created, raw=False, **kwargs):
+    if raw or not created:
+        return
+    if DashboardCounters.objects.filter(team__isnull=True).exists():
+        DashboardCounters.objects.get_or_create(team=instance, defaults={'overdue_as_of': timezone.now().date()})
+
+
+# --- Dependency --------------------------------------------------------------
+# The in-memory graph is only touched once the write has committed, so a
+# rolled-back transaction never leaves edges behind.
+
+def _dependency_event(instance, action):
+    events.publish('dependency', {
+        'action': action, 'id': instance.pk, 'ticket_id': instance.ticket_id, 'depends_on_id': instance.depends_on_id,
+    })
+
+
+@receiver(post_save, sender=Dependency)
+def dependency_post_save(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        args = (instance.pk, instance.ticket_id, instance.depends_on_id, instance.updated_at)
+        transaction.on_commit(lambda: graph_index.edge_added(*args))
+        _dependency_event(instance, 'added')
+    else:
+        transaction.on_commit(graph_index.invalidate)
+
+
+@receiver(post_delete, sender=Dependency)
+def dependency_post_delete(sender, instance, **kwargs):
+    if _muted():
+        return
+    args = (instance.pk, instance.ticket_id, instance.depends_on_id, instance.updated_at)
+    transaction.on_commit(lambda: graph_index.edge_removed(*args))
+    _dependency_event(instance, 'removed')
+
+
+# --- Ticket <-> PR links -----------------------------------------------------
+
+@receiver(m2m_changed, sender=Ticket.prs.through)
+def ticket_prs_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if action == 'pre_clear':
+        # pk_set is empty on clear; record which links are about to go
+        field = 'ticket_id' if reverse else 'pullrequest_id'
+        pk_set = set(sender.objects.filter(**{('pullrequest_id' if reverse else 'ticket_id'): instance.pk})
+                     .values_list(field, flat=True))
+        if not pk_set:
+            return
+    ids = sorted(pk_set or ())
+    events.publish('pr_link', {
+        'action': 'added' if action == 'post_add' else 'removed',
+        'ticket_ids': ids if reverse else [instance.pk],
+        'pr_ids': [instance.pk] if reverse else ids,
+    })
+
+
+# --- Data generation ---------------------------------------------------------
+# Any write to a workboard model invalidates derived data (report cache etc.).
+
+def _bump_generation(sender, raw=False, **kwargs):
+    if not raw and not _muted():
+        bump_generation()
+
+
+def _bump_generation_m2m(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_generation()
+
+
+for _model in (Team, Member, PullRequest, Ticket, Dependency):
+    post_save.connect(_bump_generation, sender=_model, dispatch_uid=f'generation_save_{_model.__name__}')
+    post_delete.connect(_bump_generation, sender=_model, dispatch_uid=f'generation_delete_{_model.__name__}')
+m2m_changed.connect(_bump_generation_m2m, sender=Ticket.prs.through, dispatch_uid='generation_ticket_prs')
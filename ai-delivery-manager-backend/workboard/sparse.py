@@ -0,0 +1,106 @@
+"""Sparse fieldsets (``?fields=``) and opt-in expansion (``?expand=``).
+
+``parse_sparse`` turns the query parameters into ``fields`` / ``expand``
+kwargs for a serializer using ``SparseFieldsMixin``, and ``sparse_queryset``
+trims the queryset to match: unrequested columns are deferred, unexpanded
+foreign keys are read from the row itself and relations that are not asked
+for are neither joined nor prefetched.
+"""
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+def parse_sparse(params, serializer_class):
+    """``fields`` / ``expand`` serializer kwargs from ``?fields=`` and ``?expand=``.
+
+    ``?fields=key,title,assignee.name`` keeps the named fields; a dotted
+    name expands the relation with only those nested fields. ``?expand=prs``
+    nests a relation in full. Once either parameter is given, relations that
+    are not expanded are returned as primary keys. Returns ``{}`` when
+    neither is present and raises ValueError on unknown names.
+    """
+    if 'fields' not in params and 'expand' not in params:
+        return {}
+    known = set(serializer_class().fields)
+    expandable = serializer_class.expandable
+    fields, expand = None, {}
+
+    def names(value):
+        return [n.strip() for n in value.split(',') if n.strip()]
+
+    for name in names(params.get('expand', '')):
+        if name not in expandable:
+            raise ValueError(f"Cannot expand '{name}'; expandable: {', '.join(sorted(expandable)) or 'none'}")
+        expand[name] = None
+    if 'fields' in params:
+        fields = set()
+        for name in names(params['fields']):
+            relation, _, nested = name.partition('.')
+            if relation not in known:
+                raise ValueError(f"Unknown field '{relation}'; fields: {', '.join(sorted(known))}")
+            fields.add(relation)
+            if not nested:
+                continue
+            if relation not in expandable:
+                raise ValueError(f"'{relation}' has no nested fields")
+            child = expandable[relation][0]
+            if nested not in child().fields:
+                raise ValueError(f"Unknown field '{name}'")
+            if expand.get(relation, ()) is not None:
+                expand.setdefault(relation, set()).add(nested)
+    return {'fields': fields, 'expand': expand}
+
+
+class SparseFieldsMixin:
+    """Accepts the ``fields`` / ``expand`` kwargs built by ``parse_sparse``.
+
+    ``expandable`` maps relation names to ``(serializer class, many)``.
+    """
+    expandable = {}
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is None and expand is None:
+            return
+        expand = expand or {}
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+        for name, (nested, many) in self.expandable.items():
+            if name not in self.fields:
+                continue
+            if name in expand:
+                self.fields[name] = nested(many=many, read_only=True, fields=expand[name], expand={})
+            else:
+                self.fields[name] = serializers.PrimaryKeyRelatedField(many=many, read_only=True)
+
+
+def sparse_queryset(qs, sparse, serializer_class, always=()):
+    """``qs`` loading only what ``serializer_class(**sparse)`` reads.
+
+    ``always`` names extra columns the caller needs (e.g. a cursor key).
+    """
+    model = qs.model
+    declared = set(serializer_class().fields)
+    fields = sparse['fields'] if sparse['fields'] is not None else declared
+    expand = sparse['expand']
+    columns = {model._meta.pk.name, *always}
+    for name in fields:
+        field = model._meta.get_field(name)
+        if field.many_to_many:
+            if name in expand:
+                related = field.related_model.objects.all()
+                if expand[name] is not None:
+                    related = related.only('pk', *expand[name])
+            else:
+                related = field.related_model.objects.only('pk')
+            qs = qs.prefetch_related(Prefetch(name, queryset=related))
+            continue
+        columns.add(name)
+        if field.is_relation and name in expand:
+            qs = qs.select_related(name)
+            if expand[name] is not None:
+                columns.update(f'{name}__{sub}' for sub in expand[name])
+    if sparse['fields'] is None:
+        return qs
+    return qs.only(*columns)
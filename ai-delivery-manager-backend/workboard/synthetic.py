@@ -0,0 +1,175 @@
+"""Deterministic synthetic boards for load and performance testing.
+
+``generate_board`` builds teams, members, tickets, PRs and a dependency DAG
+from a single seed using bulk inserts, so the same arguments always produce
+the same board. Bulk inserts bypass model signals: the tickets' creations
+go to the status history in batches, the dashboard counters and the data
+generation are refreshed once at the end, and a single ``resync`` event
+tells open clients to reload.
+"""
+from datetime import timedelta
+import itertools
+import random
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import events, history, keys
+from .counters import rebuild_counters
+from .generation import bump_generation
+from .models import Dependency, Member, PullRequest, Team, Ticket
+
+
+STATUS_WEIGHTS = [
+    ('TODO', 30),
+    ('IN_PROGRESS', 20),
+    ('IN_REVIEW', 10),
+    ('DONE', 35),
+    ('BLOCKED', 5),
+]
+PRIORITY_WEIGHTS = [('Low', 25), ('Medium', 40), ('High', 25), ('Critical', 10)]
+PR_STATUS_WEIGHTS = [('Open', 30), ('Merged', 55), ('Closed', 10), ('Draft', 5)]
+
+TITLE_VERBS = ['Implement', 'Refactor', 'Fix', 'Add', 'Improve', 'Investigate', 'Document', 'Migrate', 'Harden', 'Remove']
+TITLE_NOUNS = [
+    'auth flow', 'dashboard widgets', 'payment retries', 'webhook handler', 'search index', 'CSV export',
+    'notification service', 'rate limiting', 'audit log', 'session storage', 'image uploads', 'billing API',
+    'feature flags', 'caching layer', 'onboarding wizard', 'report builder', 'SSO integration', 'mobile layout',
+]
+REPOS = ['frontend', 'backend', 'infra', 'mobile', 'data']
+FIRST_NAMES = ['Ali', 'Sara', 'Priya', 'James', 'Mei', 'Omar', 'Lena', 'Diego', 'Aisha', 'Tom', 'Yuki', 'Noor']
+
+
+def _weighted(rng, pairs):
+    values, weights = zip(*pairs)
+    return lambda: rng.choices(values, weights)[0]
+
+
+def generate_board(tickets=10000, seed=0, teams=None, members_per_team=(4, 12), pr_ratio=0.6,
+                   dep_ratio=0.3, dag_depth=6, fan_out=3, overdue_ratio=0.15, prefix='SYN',
+                   batch_size=5000, log=None):
+    """Add a synthetic board of ``tickets`` tickets and return counts of created rows.
+
+    - teams: defaults to one per 2,000 tickets; team sizes are drawn from
+      ``members_per_team``, and ticket load per member is heavy-tailed.
+    - due dates: roughly ``overdue_ratio`` of unfinished tickets are overdue,
+      the rest are spread over the coming weeks; DONE tickets are in the past.
+    - PRs: ``pr_ratio`` PRs per ticket, each linked to one or two tickets.
+    - dependencies: tickets are assigned to ``dag_depth`` layers and depend on
+      up to ``fan_out`` tickets from lower layers, so the graph is acyclic with
+      a longest chain of at most ``dag_depth`` tickets.
+    """
+    rng = random.Random(seed)
+    log = log or (lambda msg: None)
+    today = timezone.now().date()
+    teams = teams or max(1, tickets // 2000)
+    pick_status = _weighted(rng, STATUS_WEIGHTS)
+    pick_priority = _weighted(rng, PRIORITY_WEIGHTS)
+    pick_pr_status = _weighted(rng, PR_STATUS_WEIGHTS)
+
+    with transaction.atomic():
+        # inside the transaction: numbers come straight from the sequence and
+        # any already written by an import are skipped
+        new_keys = keys.allocate(tickets, prefix)
+        run = new_keys[0].replace('-', '') if new_keys else prefix
+
+        team_objs = Team.objects.bulk_create(
+            [Team(name=f'{run} Team {i + 1}', description='Synthetic benchmark team') for i in range(teams)]
+        )
+        team_ids = list(Team.objects.filter(name__startswith=f'{run} Team ').order_by('id').values_list('id', flat=True))
+
+        member_rows = []
+        for team_id in team_ids:
+            for _ in range(rng.randint(*members_per_team)):
+                n = len(member_rows) + 1
+                member_rows.append(Member(
+                    team_id=team_id, name=f'{rng.choice(FIRST_NAMES)} {run}-{n}',
+                    email=f'user{n}.{run.lower()}@example.com', role=rng.choice(['Engineer', 'Designer', 'QA', 'PM']),
+                ))
+        Member.objects.bulk_create(member_rows, batch_size=batch_size)
+        member_ids = list(Member.objects.filter(team_id__in=team_ids).order_by('id').values_list('id', flat=True))
+        # heavy-tailed workload: a few members carry most tickets
+        member_weights = list(itertools.accumulate(rng.paretovariate(1.5) for _ in member_ids))
+        log(f'{len(team_objs)} teams, {len(member_ids)} members')
+
+        last_ticket = Ticket.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        ticket_rows = []
+        for i in range(tickets):
+            status = pick_status()
+            if status == 'DONE':
+                due = today - timedelta(days=rng.randint(1, 90))
+            elif rng.random() < overdue_ratio:
+                due = today - timedelta(days=int(rng.expovariate(1 / 7)) + 1)
+            else:
+                due = today + timedelta(days=int(rng.triangular(0, 60, 10)))
+            ticket_rows.append(Ticket(
+                key=new_keys[i],
+                title=f'{rng.choice(TITLE_VERBS)} {rng.choice(TITLE_NOUNS)}',
+                description='Synthetic ticket',
+                status=status,
+                priority=pick_priority(),
+                due_date=due if rng.random() < 0.9 else None,
+                assignee_id=rng.choices(member_ids, cum_weights=member_weights)[0] if rng.random() < 0.92 else None,
+            ))
+        Ticket.objects.bulk_create(ticket_rows, batch_size=batch_size)
+        del ticket_rows
+        created = list(
+            Ticket.objects.filter(id__gt=last_ticket).order_by('id').values_list('id', 'assignee__team_id', 'status')
+        )
+        ticket_ids = [ticket_id for ticket_id, _, _ in created]
+        # no signals fired; record the creations in the status history
+        for i in range(0, len(created), batch_size):
+            history.tickets_changed([(ticket_id, None, state) for ticket_id, *state in created[i:i + batch_size]])
+        del created
+        log(f'{len(ticket_ids)} tickets')
+
+        last_pr = PullRequest.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        pr_count = int(tickets * pr_ratio)
+        PullRequest.objects.bulk_create([
+            PullRequest(
+                repo=rng.choice(REPOS),
+                title=f'{rng.choice(["Feat", "Fix", "Chore", "Refactor"])}: {rng.choice(TITLE_NOUNS)} #{run}-{i + 1}',
+                author_id=rng.choice(member_ids),
+                status=pick_pr_status(),
+            )
+            for i in range(pr_count)
+        ], batch_size=batch_size)
+        pr_ids = list(PullRequest.objects.filter(id__gt=last_pr).order_by('id').values_list('id', flat=True))
+        Link = Ticket.prs.through
+        links = set()
+        for pr_id in pr_ids:
+            for ticket_id in rng.sample(ticket_ids, min(len(ticket_ids), rng.choice((1, 1, 1, 2)))):
+                links.add((ticket_id, pr_id))
+        Link.objects.bulk_create(
+            [Link(ticket_id=t, pullrequest_id=p) for t, p in sorted(links)], batch_size=batch_size,
+        )
+        log(f'{len(pr_ids)} PRs, {len(links)} PR links')
+
+        layers = [[] for _ in range(max(1, dag_depth))]
+        for ticket_id in ticket_ids:
+            layers[rng.randrange(len(layers))].append(ticket_id)
+        edges = []
+        for depth in range(1, len(layers)):
+            below = layers[depth - 1]
+            lower = [t for layer in layers[:depth] for t in layer] if depth > 1 else below
+            if not below:
+                continue
+            for ticket_id in layers[depth]:
+                if rng.random() >= dep_ratio:
+                    continue
+                # at least one edge into the layer directly below keeps chains long
+                targets = {rng.choice(below)}
+                for _ in range(rng.randint(0, max(0, fan_out - 1))):
+                    targets.add(rng.choice(lower))
+                edges.extend(Dependency(ticket_id=ticket_id, depends_on_id=t, note='Synthetic') for t in sorted(targets))
+        Dependency.objects.bulk_create(edges, batch_size=batch_size)
+        log(f'{len(edges)} dependencies')
+
+    rebuild_counters()
+    bump_generation()
+    events.publish('resync', {'source': 'generate_board'})
+    return {
+        'teams': len(team_ids), 'members': len(member_ids), 'tickets': len(ticket_ids),
+        'prs': len(pr_ids), 'pr_links': len(links), 'dependencies': len(edges),
+        'first_key': new_keys[0] if new_keys else None, 'last_key': new_keys[-1] if new_keys else None,
+    }
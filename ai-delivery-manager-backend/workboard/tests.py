@@ -0,0 +1,608 @@
+import io
+import json
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from data_sources.loaders import clear_cache
+
+from . import history, keys, signals
+from .counters import COUNTER_FIELDS, get_counters, rebuild_counters
+from .generation import current_generation
+from .graph import get_graph
+from .management.commands import benchmark_workboard, check_query_plans
+from .models import (
+    ChangeEvent, DailyStatusRollup, DashboardCounters, Dependency, KeySequence, Member, PullRequest, StatusTransition,
+    Team, Ticket,
+)
+from .synthetic import generate_board
+
+
+def _counters():
+    return {
+        row.team_id: {f: getattr(row, f) for f in COUNTER_FIELDS}
+        for row in DashboardCounters.objects.all()
+    }
+
+
+def _ticket_events(after):
+    events = [e.data for e in ChangeEvent.objects.filter(id__gt=after, kind='ticket')]
+    created = {e['id'] for e in events if e['action'] == 'created'}
+    # the create endpoint saves twice (ticket, then assignee); count the ticket once
+    return sorted(
+        (e['action'], e['status']) for e in events
+        if e['action'] != 'updated' or e['id'] not in created
+    )
+
+
+class BoardTestCase(TestCase):
+    def setUp(self):
+        self.alpha = Team.objects.create(name='Alpha')
+        self.beta = Team.objects.create(name='Beta')
+        self.ann = Member.objects.create(name='Ann', team=self.alpha)
+        self.bob = Member.objects.create(name='Bob', team=self.beta)
+        self.tickets = [
+            Ticket.objects.create(key=f'T-{i}', title=f'Ticket {i}', status='TODO', assignee=self.ann)
+            for i in range(1, 5)
+        ]
+        rebuild_counters()
+        get_counters()
+
+
+class BulkTicketsTests(BoardTestCase):
+    url = '/api/workboard/tickets/bulk/'
+
+    def post(self, body):
+        return self.client.post(self.url, body, content_type='application/json')
+
+    def test_rejects_non_object_body(self):
+        self.assertEqual(self.post(['x']).status_code, 400)
+
+    def test_atomic_batch_with_an_invalid_operation_writes_nothing(self):
+        t1 = self.tickets[0]
+        response = self.post({'operations': [
+            {'op': 'update', 'id': t1.id, 'status': 'DONE'},
+            {'op': 'update', 'id': 999999, 'status': 'DONE'},
+            {'op': 'create', 'title': 'New'},
+        ]})
+        self.assertEqual(response.status_code, 400)
+        body = response.json()
+        self.assertFalse(body['applied'])
+        self.assertEqual([r['ok'] for r in body['results']], [True, False, True])
+        t1.refresh_from_db()
+        self.assertEqual(t1.status, 'TODO')
+        self.assertEqual(Ticket.objects.count(), 4)
+
+    def test_non_atomic_batch_applies_valid_operations(self):
+        response = self.post({'atomic': False, 'operations': [
+            {'op': 'update', 'id': self.tickets[0].id, 'status': 'NOPE'},
+            {'op': 'create', 'title': 'New', 'status': 'IN_PROGRESS'},
+        ]})
+        self.assertEqual(response.status_code, 207)
+        results = response.json()['results']
+        self.assertFalse(results[0]['ok'])
+        self.assertTrue(Ticket.objects.filter(id=results[1]['id'], status='IN_PROGRESS').exists())
+
+    def test_update_after_delete_is_rejected(self):
+        t1 = self.tickets[0]
+        response = self.post({'operations': [
+            {'op': 'delete', 'id': t1.id},
+            {'op': 'update', 'id': t1.id, 'status': 'DONE'},
+        ]})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('deleted earlier', response.json()['results'][1]['errors']['id'])
+        self.assertTrue(Ticket.objects.filter(id=t1.id).exists())
+
+    def test_delete_after_update_deletes(self):
+        t1 = self.tickets[0]
+        response = self.post({'operations': [
+            {'op': 'update', 'id': t1.id, 'status': 'DONE'},
+            {'op': 'delete', 'id': t1.id},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Ticket.objects.filter(id=t1.id).exists())
+
+    def test_side_effects_match_per_row_writes(self):
+        t1, t2, t3 = self.tickets[:3]
+        # the same changes through the single-ticket endpoints, rolled back afterwards
+        with transaction.atomic():
+            events_from = ChangeEvent.objects.order_by('-id').values_list('id', flat=True).first() or 0
+            self.client.patch(f'/api/workboard/tickets/{t1.id}/', {'status': 'DONE'}, content_type='application/json')
+            self.client.patch(f'/api/workboard/tickets/{t2.id}/', {'assignee': self.bob.id}, content_type='application/json')
+            self.client.delete(f'/api/workboard/tickets/{t3.id}/')
+            self.client.post(
+                '/api/workboard/tickets/',
+                {'title': 'New', 'status': 'IN_PROGRESS', 'assignee': self.bob.id}, content_type='application/json',
+            )
+            per_row = (_counters(), _ticket_events(events_from))
+            transaction.set_rollback(True)
+
+        events_from = ChangeEvent.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        generation = current_generation()
+        response = self.post({'operations': [
+            {'op': 'update', 'id': t1.id, 'status': 'DONE'},
+            {'op': 'update', 'id': t2.id, 'assignee': self.bob.id},
+            {'op': 'delete', 'id': t3.id},
+            {'op': 'create', 'title': 'New', 'status': 'IN_PROGRESS', 'assignee': self.bob.id},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((_counters(), _ticket_events(events_from)), per_row)
+        self.assertEqual(current_generation(), generation + 1)
+        counters = _counters()
+        rebuild_counters()
+        self.assertEqual(_counters(), counters)
+
+
+class TicketListTests(BoardTestCase):
+    url = '/api/workboard/tickets/'
+
+    def setUp(self):
+        super().setUp()
+        # equal created_at values, so the id tie-break decides the order
+        Ticket.objects.update(created_at=timezone.now())
+        pr = PullRequest.objects.create(repo='backend', title='PR', author=self.ann, status='OPEN')
+        for ticket in self.tickets:
+            ticket.prs.add(pr)
+
+    def walk(self, **params):
+        keys, params = [], {'limit': 3, **params}
+        while True:
+            page = self.client.get(self.url, params).json()
+            keys += [t['key'] for t in page['results']]
+            if not page['next_cursor']:
+                return keys
+            params['cursor'] = page['next_cursor']
+
+    def test_pages_follow_the_full_list_without_gaps(self):
+        for fast in ('0', '1'):
+            full = [t['key'] for t in self.client.get(self.url, {'fast': fast}).json()]
+            self.assertEqual(full, ['T-4', 'T-3', 'T-2', 'T-1'])
+            self.assertEqual(self.walk(fast=fast), full)
+        self.assertEqual(self.walk(status='TODO', limit=1), ['T-4', 'T-3', 'T-2', 'T-1'])
+
+    def test_counts(self):
+        page = self.client.get(self.url, {'limit': 1, 'count': 'exact', 'status': 'TODO'}).json()
+        self.assertEqual((page['count'], page['count_is_estimate']), (4, False))
+        page = self.client.get(self.url, {'limit': 1, 'count': 'estimate'}).json()
+        self.assertEqual(page['count'], 4)
+        self.assertEqual(self.client.get(self.url, {'cursor': 'nope'}).status_code, 400)
+
+    def test_query_count_does_not_grow_with_the_page(self):
+        def queries(limit):
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.get(self.url, {'limit': limit, 'fast': 0})
+            return len(ctx.captured_queries)
+        self.assertEqual(queries(1), queries(4))
+
+
+class FastSerializationTests(BoardTestCase):
+    def setUp(self):
+        super().setUp()
+        pr = PullRequest.objects.create(
+            repo='backend', title='Caf\u00e9 \u2028 "quoted" \U0001f600', author=self.bob, status='OPEN', url='https://x/1',
+        )
+        PullRequest.objects.create(repo='infra', title='No author', status='MERGED')
+        self.tickets[0].prs.add(pr)
+        self.tickets[1].due_date = date(2026, 1, 31)
+        self.tickets[1].assignee = None
+        self.tickets[1].save()
+
+    def test_fast_path_returns_the_serializer_bytes(self):
+        for url, params in (
+            ('/api/workboard/tickets/', {}), ('/api/workboard/tickets/', {'limit': 2}),
+            ('/api/workboard/prs/', {}), ('/api/workboard/members/', {}),
+        ):
+            slow = self.client.get(url, {**params, 'fast': 0})
+            fast = self.client.get(url, {**params, 'fast': 1})
+            self.assertEqual(fast.content, slow.content, url)
+            self.assertEqual(fast['Content-Type'], 'application/json')
+
+
+class SparseFieldsTests(BoardTestCase):
+    url = '/api/workboard/tickets/'
+
+    def setUp(self):
+        super().setUp()
+        pr = PullRequest.objects.create(repo='backend', title='PR', author=self.ann, status='OPEN')
+        self.tickets[0].prs.add(pr)
+        self.pr = pr
+
+    def first(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return next(t for t in response.json() if t['key'] == 'T-1')
+
+    def test_fields_keep_only_the_named_ones(self):
+        self.assertEqual(self.first(fields='key,status'), {'key': 'T-1', 'status': 'TODO'})
+        self.assertEqual(
+            self.first(fields='key,assignee.name,prs'),
+            {'key': 'T-1', 'assignee': {'name': 'Ann'}, 'prs': [self.pr.id]},
+        )
+
+    def test_relations_are_ids_unless_expanded(self):
+        ticket = self.first(expand='prs')
+        self.assertEqual(ticket['assignee'], self.ann.id)
+        self.assertEqual(ticket['prs'][0]['title'], 'PR')
+        self.assertEqual(ticket['prs'][0]['author'], self.ann.id)
+        self.assertEqual(self.first()['assignee']['name'], 'Ann')
+
+    def test_trimmed_reads_skip_the_joins(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.url, {'fields': 'key,status'})
+        sql = ' '.join(q['sql'] for q in ctx.captured_queries if 'workboard_ticket' in q['sql'])
+        self.assertNotIn('workboard_member', sql)
+        self.assertNotIn('workboard_ticket_prs', sql)
+        self.assertNotIn('"description"', sql)
+
+    def test_unknown_names_are_rejected(self):
+        for params in ({'fields': 'nope'}, {'fields': 'status.name'}, {'fields': 'assignee.nope'}, {'expand': 'team'}):
+            self.assertEqual(self.client.get(self.url, params).status_code, 400, params)
+
+
+class ConditionalGetTests(BoardTestCase):
+    url = '/api/workboard/tickets/'
+
+    def test_unchanged_list_answers_304_until_a_write(self):
+        first = self.client.get(self.url)
+        etag = first['ETag']
+        self.assertIn('no-cache', first['Cache-Control'])
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual((response['ETag'], response.content), (etag, b''))
+        # only the generation lookup runs
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        self.tickets[0].status = 'DONE'
+        self.tickets[0].save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_tags_depend_on_the_url(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, {'status': 'DONE'}, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_dashboard_revalidates(self):
+        first = self.client.get('/api/reports/dashboard/')
+        response = self.client.get('/api/reports/dashboard/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        Ticket.objects.create(key='T-9', title='New')
+        self.assertEqual(self.client.get('/api/reports/dashboard/', HTTP_IF_NONE_MATCH=first['ETag']).status_code, 200)
+
+
+class EventStreamTests(BoardTestCase):
+    url = '/api/workboard/events/'
+
+    def test_resumes_after_last_event_id(self):
+        after = ChangeEvent.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        self.tickets[0].status = 'DONE'
+        self.tickets[0].save()
+        event = ChangeEvent.objects.filter(id__gt=after, kind='ticket').get()
+
+        response = self.client.get(self.url, HTTP_LAST_EVENT_ID=str(after))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        chunks = iter(response.streaming_content)
+        self.assertEqual(next(chunks), b'retry: 3000\n\n')
+        frame = next(chunks).decode()
+        while not frame.startswith(f'id: {event.id}\n'):
+            frame = next(chunks).decode()
+        lines = frame.split('\n')
+        self.assertEqual(lines[1], 'event: ticket')
+        data = json.loads(lines[2].removeprefix('data: '))
+        self.assertEqual((data['key'], data['status'], data['changed']), ('T-1', 'DONE', ['status']))
+        self.assertTrue(frame.endswith('\n\n'))
+        response.close()
+
+    def test_rejects_bad_ids_and_other_methods(self):
+        self.assertEqual(self.client.get(self.url, {'since': 'abc'}).status_code, 400)
+        self.assertEqual(self.client.post(self.url).status_code, 405)
+
+
+class AggregateTests(BoardTestCase):
+    url = '/api/workboard/aggregate/'
+
+    def setUp(self):
+        super().setUp()
+        t1, t2, t3 = self.tickets[:3]
+        Dependency.objects.create(ticket=t1, depends_on=t2)
+        Dependency.objects.create(ticket=t1, depends_on=t3)
+        Dependency.objects.create(ticket=t3, depends_on=t2)
+        for i in range(3):
+            pr = PullRequest.objects.create(repo='backend', title=f'PR {i}', author=self.ann, status='OPEN')
+            t2.prs.add(pr)
+
+    def test_stream_matches_the_full_response(self):
+        for fast in ('0', '1'):
+            full = self.client.get(self.url, {'fast': fast})
+            streamed = self.client.get(self.url, {'fast': fast, 'stream': 1, 'limit': 2})
+            self.assertEqual(b''.join(streamed.streaming_content), full.content)
+
+    def test_pages_concatenate_to_the_full_response(self):
+        full = self.client.get(self.url).json()
+        rows = {section: [] for section in full}
+        params = {'limit': 3}
+        while True:
+            page = self.client.get(self.url, params).json()
+            for section in rows:
+                rows[section] += page[section]
+            if not page['next_cursor']:
+                break
+            params['cursor'] = page['next_cursor']
+        self.assertEqual(rows, full)
+        self.assertEqual(len(full['blockers']), 2)
+
+    def test_rejects_a_malformed_cursor(self):
+        self.assertEqual(self.client.get(self.url, {'cursor': 'nope'}).status_code, 400)
+
+
+class SearchTests(BoardTestCase):
+    url = '/api/workboard/search/'
+
+    def hits(self, q, **params):
+        response = self.client.get(self.url, {'q': q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(hit['type'], hit['id']) for hit in response.json()['results']]
+
+    def test_index_follows_bulk_update_and_queryset_update(self):
+        t1, t2 = self.tickets[:2]
+        t1.title = 'Quarterly invoice export'
+        Ticket.objects.bulk_update([t1], ['title'])
+        Ticket.objects.filter(id=t2.id).update(description='Invoice totals are off by one')
+        self.assertEqual(sorted(self.hits('invoice')), [('ticket', t1.id), ('ticket', t2.id)])
+
+        Ticket.objects.filter(id=t1.id).update(title='Renamed')
+        Ticket.objects.filter(id=t2.id).delete()
+        self.assertEqual(self.hits('invoice'), [])
+
+    def test_pull_requests_are_indexed_by_title(self):
+        pr = PullRequest.objects.create(title='Invoice export', author=self.ann)
+        self.assertEqual(self.hits('invoice', type='pr'), [('pr', pr.id)])
+        PullRequest.objects.filter(id=pr.id).update(title='Other')
+        self.assertEqual(self.hits('invoice', type='pr'), [])
+
+    def test_query_syntax_is_treated_as_words(self):
+        t1 = self.tickets[0]
+        Ticket.objects.filter(id=t1.id).update(title='Login OR logout NEAR failure')
+        for q in ['login" OR "logout', 'NEAR(login', 'login*', '-login', 'failure:login', 'login OR']:
+            self.assertIn(('ticket', t1.id), self.hits(q), q)
+        self.assertEqual(self.client.get(self.url, {'q': '"*"'}).status_code, 400)
+
+    def test_matches_beyond_the_rank_window_follow_the_ranked_ones(self):
+        for t in self.tickets:
+            Ticket.objects.filter(id=t.id).update(title='Shared word')
+        t1, t2, t3, t4 = self.tickets
+        # the newest two are ranked (equal scores fall back to rowid), then the rest newest first
+        expected = [('ticket', t.id) for t in (t3, t4, t2, t1)]
+        with override_settings(WORKBOARD_SEARCH_RANK_WINDOW=2):
+            self.assertEqual(self.hits('shared', limit=10), expected)
+            first = self.client.get(self.url, {'q': 'shared', 'limit': 3}).json()
+            second = self.client.get(self.url, {'q': 'shared', 'limit': 3, 'cursor': first['next_cursor']}).json()
+        pages = [(h['type'], h['id']) for h in first['results'] + second['results']]
+        self.assertEqual(pages, expected)
+        self.assertIsNone(second['next_cursor'])
+
+
+class DependencyTests(BoardTestCase):
+    url = '/api/workboard/dependencies/'
+
+    def post(self, ticket, depends_on):
+        return self.client.post(self.url, {'ticket': ticket.id, 'depends_on': depends_on.id}, content_type='application/json')
+
+    def test_rejects_a_cycle(self):
+        t1, t2, t3 = self.tickets[:3]
+        self.assertEqual(self.post(t1, t2).status_code, 201)
+        self.assertEqual(self.post(t2, t3).status_code, 201)
+        response = self.post(t3, t1)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('T-3 -> T-1 -> T-2 -> T-3', response.json()['depends_on'][0])
+
+    def test_sees_edges_written_behind_the_cached_graph(self):
+        t1, t2 = self.tickets[:2]
+        get_graph()
+        # bulk_create sends no signals, like a write from another process
+        Dependency.objects.bulk_create([Dependency(ticket=t1, depends_on=t2)])
+        self.assertEqual(self.post(t2, t1).status_code, 400)
+        self.assertEqual(Dependency.objects.count(), 1)
+
+    def test_sees_edges_changed_in_place_behind_the_cached_graph(self):
+        t1, t2, t3 = self.tickets[:3]
+        self.assertEqual(self.post(t1, t2).status_code, 201)
+        get_graph()
+        # another process repoints the edge: same count, same max id
+        Dependency.objects.update(depends_on=t3, updated_at=timezone.now() + timedelta(seconds=1))
+        self.assertEqual(set(get_graph().upstream(t1.id)), {t3.id})
+
+    def test_blockers_walk_stops_at_done_tickets_but_follows_other_paths(self):
+        a, b, c, d = self.tickets
+        e = Ticket.objects.create(key='T-5', title='Ticket 5', status='TODO')
+        for ticket, depends_on in ((a, b), (b, c), (a, d), (d, e), (e, c)):
+            self.assertEqual(self.post(ticket, depends_on).status_code, 201)
+        b.status = 'DONE'
+        b.save()
+        blockers = self.client.get(f'/api/workboard/tickets/{a.id}/blockers/').json()['blockers']
+        self.assertEqual([(r['key'], r['depth']) for r in blockers], [('T-4', 1), ('T-5', 2), ('T-3', 3)])
+        blockers = self.client.get(f'/api/workboard/tickets/{a.id}/blockers/', {'include_done': 1}).json()['blockers']
+        self.assertEqual([(r['key'], r['depth']) for r in blockers], [('T-2', 1), ('T-4', 1), ('T-3', 2), ('T-5', 2)])
+
+
+class KeyAllocationTests(BoardTestCase):
+    def test_skips_numbers_written_without_the_sequence(self):
+        self.assertEqual(keys.allocate(1, 'K'), ['K-1'])
+        # as a seed or import would, straight past the sequence
+        Ticket.objects.create(key='K-2', title='Imported')
+        Ticket.objects.create(key='K-4', title='Imported')
+        self.assertEqual(keys.allocate(3, 'K'), ['K-3', 'K-5', 'K-6'])
+
+    def test_invalid_create_takes_no_key(self):
+        response = self.client.post('/api/workboard/tickets/', {'status': 'TODO'}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(KeySequence.objects.exists())
+        response = self.client.post(
+            '/api/workboard/tickets/', {'title': 'New', 'key': 'X-1', 'assignee': self.ann.id}, content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.json()['key'], response.json()['assignee']['id']), ('PROJ-1', self.ann.id))
+
+    def test_synthetic_board_skips_keys_already_written(self):
+        keys.allocate(1, 'SYN')
+        Ticket.objects.create(key='SYN-3', title='Imported')
+        result = generate_board(tickets=3, teams=1, members_per_team=(1, 1), pr_ratio=0, dep_ratio=0)
+        self.assertEqual((result['first_key'], result['last_key']), ('SYN-2', 'SYN-5'))
+        self.assertEqual(Ticket.objects.filter(key__startswith='SYN-').count(), 4)
+
+
+class SyntheticBoardTests(BoardTestCase):
+    def test_generated_tickets_are_in_the_status_history(self):
+        result = generate_board(tickets=20, teams=2, pr_ratio=0, dep_ratio=0, batch_size=7)
+        synthetic = Ticket.objects.filter(key__startswith='SYN-').values('id')
+        self.assertEqual(StatusTransition.objects.filter(ticket_id__in=synthetic, from_status='').count(), result['tickets'])
+        rollups = set(DailyStatusRollup.objects.values_list('team_id', 'day', 'status', 'count'))
+        history.rebuild_today()
+        self.assertEqual(set(DailyStatusRollup.objects.values_list('team_id', 'day', 'status', 'count')), rollups)
+
+
+class HistoryTests(BoardTestCase):
+    def rollup(self, status, team=None):
+        row = DailyStatusRollup.objects.get(team=team, day=history._today(), status=status)
+        return row.count, row.entered, row.exited
+
+    def completed_this_week(self, team=None):
+        return history.velocity(1, team.id if team else None)['weeks'][0]['completed']
+
+    def test_status_change_is_logged_and_rolled_up(self):
+        t1 = self.tickets[0]
+        self.client.patch(f'/api/workboard/tickets/{t1.id}/', {'status': 'DONE'}, content_type='application/json')
+        transition = StatusTransition.objects.filter(ticket_id=t1.id).latest('id')
+        self.assertEqual((transition.from_status, transition.to_status), ('TODO', 'DONE'))
+        self.assertEqual((transition.from_team_id, transition.to_team_id), (self.alpha.id, self.alpha.id))
+        for team in (None, self.alpha):
+            self.assertEqual(self.rollup('DONE', team), (1, 1, 0))
+            self.assertEqual(self.rollup('TODO', team), (3, 0, 1))
+            self.assertEqual(self.completed_this_week(team), 1)
+
+    def test_created_and_deleted_tickets_are_not_status_changes(self):
+        Ticket.objects.create(key='T-9', title='Already done', status='DONE', assignee=self.ann)
+        self.tickets[0].delete()
+        self.assertEqual(self.rollup('DONE'), (1, 0, 0))
+        self.assertEqual(self.rollup('TODO'), (3, 0, 0))
+        self.assertEqual(self.completed_this_week(), 0)
+
+    def test_team_move_keeps_board_totals(self):
+        t1 = self.tickets[0]
+        self.client.patch(f'/api/workboard/tickets/{t1.id}/', {'assignee': self.bob.id}, content_type='application/json')
+        self.assertEqual(self.rollup('TODO'), (4, 0, 0))
+        self.assertEqual(self.rollup('TODO', self.alpha), (3, 0, 0))
+        self.assertEqual(self.rollup('TODO', self.beta), (1, 0, 0))
+
+    def test_bulk_writes_match_the_rebuilt_totals(self):
+        t1, t2 = self.tickets[:2]
+        self.client.post('/api/workboard/tickets/bulk/', {'operations': [
+            {'op': 'update', 'id': t1.id, 'status': 'DONE'},
+            {'op': 'update', 'id': t2.id, 'status': 'IN_PROGRESS', 'assignee': self.bob.id},
+        ]}, content_type='application/json')
+        self.assertEqual(self.completed_this_week(), 1)
+        rows = lambda: sorted(DailyStatusRollup.objects.values_list('team_id', 'status', 'count'), key=str)
+        before = rows()
+        history.rebuild_today()
+        self.assertEqual(rows(), before)
+
+    def test_one_row_per_scope_day_and_status(self):
+        today = history._today()
+        for team in (None, self.alpha):
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                DailyStatusRollup.objects.create(team=team, day=today, status='TODO', count=0)
+        # a writer that loses the insert race is told to update the winner's row
+        self.assertFalse(history._create(team_id=None, day=today, status='TODO', count=0))
+        self.assertEqual(self.rollup('TODO'), (4, 0, 0))
+
+
+class BenchmarkBudgetTests(TestCase):
+    def test_every_case_stays_within_its_query_budget(self):
+        command = benchmark_workboard.Command(stdout=io.StringIO())
+        results = command._run([300], list(benchmark_workboard.BENCHMARKS), 1, 0)
+        self.assertEqual({r['name'] for r in results}, set(benchmark_workboard.BENCHMARKS))
+        self.assertEqual([r['name'] for r in results if not r['within_budget']], [])
+
+    def test_budgets_scale_per_thousand_tickets(self):
+        self.assertEqual(benchmark_workboard.query_budget('aggregate_project', 2500), 8 + 20)
+        self.assertEqual(benchmark_workboard.query_budget('analyze_risks', 100000), 6)
+        with self.assertRaisesMessage(CommandError, '--sizes'):
+            call_command('benchmark_workboard', sizes='ten', stdout=io.StringIO())
+
+
+class QueryPlanTests(TestCase):
+    def test_report_and_list_reads_use_indexes(self):
+        generate_board(tickets=300, teams=2)
+        out = io.StringIO()
+        self.assertEqual(check_query_plans.Command(stdout=out)._check(False), 0, out.getvalue())
+
+    def test_flags_scans_only_for_filtered_or_limited_reads(self):
+        problems = check_query_plans.problems
+        self.assertEqual(problems('SELECT * FROM t', ['SCAN t']), [])
+        self.assertEqual(problems('SELECT * FROM t WHERE a = 1', ['SCAN t']), ['full scan of t for a filtered read'])
+        self.assertEqual(
+            problems('SELECT * FROM t ORDER BY a LIMIT 5', ['SCAN t', 'USE TEMP B-TREE FOR ORDER BY']),
+            ['sorts all of t to return a LIMIT'],
+        )
+        self.assertEqual(problems('SELECT * FROM t WHERE a = 1', ['SEARCH t USING INDEX t_a (a=?)']), [])
+
+
+class ImportHistoryTests(BoardTestCase):
+    def import_tickets(self, records):
+        with tempfile.TemporaryDirectory() as tmp, override_settings(DATA_SOURCES_DIR=tmp):
+            Path(tmp, 'jira_tickets.json').write_text(json.dumps(records), encoding='utf-8')
+            call_command('import_workboard', stdout=io.StringIO())
+        clear_cache()
+
+    def test_imported_tickets_get_status_transitions(self):
+        self.import_tickets([{'key': 'I-1', 'status': 'To Do', 'assignee': 'Ann'}])
+        self.import_tickets([{'key': 'I-1', 'status': 'Done', 'assignee': 'Ann'}])
+        ticket = Ticket.objects.get(key='I-1')
+        self.assertEqual(
+            list(StatusTransition.objects.filter(ticket_id=ticket.id).order_by('id').values_list('from_status', 'to_status', 'to_team_id')),
+            [('', 'TODO', self.alpha.id), ('TODO', 'DONE', self.alpha.id)],
+        )
+        self.assertEqual(history.entered_between(history._today(), history._today(), team_id=self.alpha.id), 1)
+
+
+class RebuildCountersTests(BoardTestCase):
+    def test_full_rebuild_removes_rows_of_deleted_teams(self):
+        gamma = Team.objects.create(name='Gamma')
+        get_counters(gamma.id)
+        # a raw delete, as another tool would do it: no cascade, no signals
+        Team.objects.filter(id=gamma.id)._raw_delete(connection.alias)
+        rebuild_counters([self.alpha.id])
+        self.assertTrue(DashboardCounters.objects.filter(team_id=gamma.id).exists())
+        rebuild_counters()
+        self.assertEqual(
+            set(DashboardCounters.objects.values_list('team_id', flat=True)), {None, self.alpha.id, self.beta.id},
+        )
+
+    def test_board_wide_row_is_single(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            DashboardCounters.objects.create(team=None)
+
+    def test_reassignment_across_teams_matches_a_rebuild(self):
+        ticket = self.tickets[0]
+        ticket.assignee = self.bob
+        ticket.status = 'DONE'
+        ticket.save()
+        incremental = _counters()
+        rebuild_counters()
+        self.assertEqual(incremental, _counters())
+
+    def test_muted_saves_leave_counters_and_events_alone(self):
+        before, last_event = _counters(), ChangeEvent.objects.order_by('-id').values_list('id', flat=True).first()
+        with signals.muted():
+            self.tickets[0].status = 'DONE'
+            self.tickets[0].save()
+        self.assertEqual(_counters(), before)
+        self.assertFalse(ChangeEvent.objects.filter(id__gt=last_event).exists())
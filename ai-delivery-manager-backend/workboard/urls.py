@@ -5,9 +5,15 @@ urlpatterns = [
     path('teams/', views.teams_list_create),
     path('members/', views.members_list_create),
     path('tickets/', views.tickets_list_create),
+    path('tickets/bulk/', views.tickets_bulk),
     path('tickets/<int:pk>/', views.ticket_partial_update),
+    path('tickets/<int:pk>/blockers/', views.ticket_blockers),
+    path('tickets/<int:pk>/downstream/', views.ticket_downstream),
+    path('tickets/<int:pk>/critical-path/', views.ticket_critical_path),
     path('prs/', views.prs_list_create),
     path('dependencies/', views.dependencies_create),
     path('aggregate/', views.aggregate_project),
+    path('events/', views.events_stream),
+    path('search/', views.search),
     path('debug/ticket_statuses/', views.debug_ticket_statuses),
 ]
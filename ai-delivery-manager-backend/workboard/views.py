@@ -1,33 +1,69 @@
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from .models import Team, Member, Ticket, PullRequest, Dependency
+from .models import Team, Member, Ticket, PullRequest, Dependency, DashboardCounters
 from .serializers import (
     TeamSerializer,
     MemberSerializer,
     TicketSerializer,
+    TicketCreateSerializer,
     PullRequestSerializer,
     DependencySerializer,
 )
+from . import aggregate, bulk, events, fulltext, keys, projections
+from .conditional import conditional_on_generation
+from .counters import STATUS_FIELDS
+from .pagination import decode_cursor, encode_cursor, parse_limit
+from .renderers import dumps
+from .sparse import parse_sparse, sparse_queryset
+from .graph import get_graph
+from django.conf import settings
+from django.db.models import Prefetch, Q
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
 from django.shortcuts import get_object_or_404
 from django.db import transaction
-from django.utils.crypto import get_random_string
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def _generate_key():
-    # simple key generator PROJ-<random>
-    suffix = get_random_string(4).upper()
-    return f"PROJ-{suffix}"
+def _fast(request):
+    """Whether to use the values() + orjson read path (``?fast=``, else the setting)."""
+    flag = request.query_params.get('fast')
+    if flag is None:
+        return settings.WORKBOARD_FAST_LISTS
+    return flag in ('1', 'true')
+
+
+def _sparse(request, serializer_class):
+    """``(sparse kwargs, error response)`` for ``?fields=`` / ``?expand=``."""
+    try:
+        return parse_sparse(request.query_params, serializer_class), None
+    except ValueError as exc:
+        return None, Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _fast_response(request, data):
+    # the browsable API still renders through DRF
+    if request.accepted_renderer.format != 'json':
+        return Response(data)
+    return HttpResponse(dumps(data), content_type='application/json')
 
 
 @api_view(["GET", "POST"])
+@conditional_on_generation
 def teams_list_create(request):
     if request.method == "GET":
+        sparse, error = _sparse(request, TeamSerializer)
+        if error:
+            return error
         teams = Team.objects.all()
-        return Response(TeamSerializer(teams, many=True).data)
+        if sparse:
+            teams = sparse_queryset(teams, sparse, TeamSerializer)
+        return Response(TeamSerializer(teams, many=True, **sparse).data)
     serializer = TeamSerializer(data=request.data)
     if serializer.is_valid():
         serializer.save()
@@ -36,9 +72,18 @@ def teams_list_create(request):
 
 
 @api_view(["GET", "POST"])
+@conditional_on_generation
 def members_list_create(request):
     if request.method == "GET":
+        sparse, error = _sparse(request, MemberSerializer)
+        if error:
+            return error
         members = Member.objects.all()
+        if sparse:
+            members = sparse_queryset(members, sparse, MemberSerializer)
+            return Response(MemberSerializer(members, many=True, **sparse).data)
+        if _fast(request):
+            return _fast_response(request, projections.member_rows(members))
         return Response(MemberSerializer(members, many=True).data)
     serializer = MemberSerializer(data=request.data)
     if serializer.is_valid():
@@ -47,10 +92,74 @@ def members_list_create(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+def _estimate_ticket_count(status_q, assignee_q):
+    """Ticket count from the materialized dashboard counters when filters allow it."""
+    if assignee_q:
+        return None
+    row = DashboardCounters.objects.filter(team__isnull=True).first()
+    if row is None:
+        return None
+    if not status_q:
+        return row.total_tickets
+    field = STATUS_FIELDS.get(status_q)
+    return getattr(row, field) if field else None
+
+
+def _ticket_page(request, qs, status_q, assignee_q, fast=False, sparse=None):
+    """Keyset page over ``(-created_at, -id)``.
+
+    ``?limit=`` sets the page size, ``?cursor=`` continues from a previous
+    page's ``next_cursor``. ``?count=exact`` adds a COUNT(*) total and
+    ``?count=estimate`` a cheap one from the dashboard counters.
+    """
+    params = request.query_params
+    limit = parse_limit(params.get('limit'), settings.WORKBOARD_PAGE_SIZE, settings.WORKBOARD_MAX_PAGE_SIZE)
+    cursor = params.get('cursor')
+    if cursor:
+        position = decode_cursor(cursor)
+        created_at = parse_datetime(position.get('c') or '')
+        last_id = position.get('i')
+        if created_at is None or not isinstance(last_id, int):
+            raise ValueError('invalid cursor')
+        qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id))
+
+    if fast:
+        values = projections.ticket_values(qs.order_by('-created_at', '-id')[:limit + 1])
+        has_more = len(values) > limit
+        values = values[:limit]
+        results = projections.ticket_rows(values)
+        last = (values[-1]['created_at'], values[-1]['id']) if values else None
+    else:
+        rows = list(qs.order_by('-created_at', '-id')[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        results = TicketSerializer(rows, many=True, **(sparse or {})).data
+        last = (rows[-1].created_at, rows[-1].id) if rows else None
+    page = {
+        'results': results,
+        'next_cursor': encode_cursor({'c': last[0].isoformat(), 'i': last[1]}) if has_more else None,
+    }
+    count_mode = params.get('count')
+    if count_mode == 'estimate':
+        page['count'] = _estimate_ticket_count(status_q, assignee_q)
+        page['count_is_estimate'] = True
+    if count_mode == 'exact' or (count_mode == 'estimate' and page['count'] is None):
+        page['count'] = qs.count()
+        page['count_is_estimate'] = False
+    return page
+
+
 @api_view(["GET", "POST"])
+@conditional_on_generation
 def tickets_list_create(request):
     if request.method == "GET":
-        qs = Ticket.objects.all().order_by('-created_at')
+        sparse, error = _sparse(request, TicketSerializer)
+        if error:
+            return error
+        if sparse:
+            qs = sparse_queryset(Ticket.objects.all(), sparse, TicketSerializer, always=('created_at',))
+        else:
+            qs = Ticket.objects.select_related('assignee').prefetch_related('prs')
         # simple filters
         status_q = request.query_params.get('status')
         assignee_q = request.query_params.get('assignee_id') or request.query_params.get('assignee')
@@ -60,37 +169,109 @@ def tickets_list_create(request):
             try:
                 qs = qs.filter(assignee__id=int(assignee_q))
             except ValueError:
-                pass
-        data = TicketSerializer(qs, many=True).data
+                assignee_q = None
+        fast = _fast(request) and not sparse
+        if 'limit' in request.query_params or 'cursor' in request.query_params:
+            try:
+                page = _ticket_page(request, qs, status_q, assignee_q, fast, sparse)
+            except ValueError:
+                return Response({'detail': 'Invalid cursor or limit'}, status=status.HTTP_400_BAD_REQUEST)
+            return _fast_response(request, page) if fast else Response(page)
+        if fast:
+            values = projections.ticket_values(qs.order_by('-created_at'))
+            return _fast_response(request, projections.ticket_rows(values))
+        data = TicketSerializer(qs.order_by('-created_at'), many=True, **sparse).data
         return Response(data)
 
     data = request.data.copy()
-    with transaction.atomic():
-        # generate unique key
-        data['key'] = _generate_key()
-        # allow passing assignee id
-        assignee_id = data.pop('assignee', None)
-        serializer = TicketSerializer(data=data)
-        if serializer.is_valid():
-            ticket = serializer.save()
-            if assignee_id:
-                try:
-                    member = Member.objects.get(id=assignee_id)
-                    ticket.assignee = member
-                    ticket.save()
-                except Member.DoesNotExist:
-                    pass
-            return Response(TicketSerializer(ticket).data, status=status.HTTP_201_CREATED)
+    # allow passing assignee id
+    assignee_id = data.pop('assignee', None)
+    serializer = TicketCreateSerializer(data=data)
+    if not serializer.is_valid():
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    # taken before the transaction so it comes from this process's key block
+    key = keys.allocate()[0]
+    with transaction.atomic():
+        ticket = serializer.save(key=key)
+        if assignee_id:
+            try:
+                member = Member.objects.get(id=assignee_id)
+                ticket.assignee = member
+                ticket.save()
+            except Member.DoesNotExist:
+                pass
+    return Response(TicketSerializer(ticket).data, status=status.HTTP_201_CREATED)
+
+
+@api_view(["POST"])
+def tickets_bulk(request):
+    """Create, update, delete, reassign and PR-link many tickets in one transaction.
+
+    Body: ``{"operations": [{"op": "create" | "update" | "delete", ...}], "atomic": true}``.
+    Updates take ``id`` plus any of title/description/status/priority/due_date,
+    ``assignee`` (member id or null), ``pr_ids`` to link and ``unlink_pr_ids``.
+    Every operation gets a result; with ``"atomic": false`` the valid ones are
+    applied even if others fail (207).
+    """
+    if not isinstance(request.data, dict):
+        return Response({'detail': 'Expected an object with an operations list'}, status=status.HTTP_400_BAD_REQUEST)
+    operations = request.data.get('operations')
+    if not isinstance(operations, list):
+        return Response({'detail': 'operations must be a list'}, status=status.HTTP_400_BAD_REQUEST)
+    if len(operations) > settings.TICKETS_BULK_MAX_ITEMS:
+        return Response(
+            {'detail': f'At most {settings.TICKETS_BULK_MAX_ITEMS} operations per request'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    atomic = request.data.get('atomic', True) not in (False, 'false', '0')
+    results, applied = bulk.apply_operations(
+        operations, keys.allocate, atomic=atomic,
+    )
+    errors = sum(1 for r in results if not r['ok'])
+    body = {'applied': applied, 'errors': errors, 'results': results}
+    if not applied:
+        return Response(body, status=status.HTTP_400_BAD_REQUEST)
+    return Response(body, status=status.HTTP_207_MULTI_STATUS if errors else status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+def search(request):
+    """Ranked full-text search over tickets and PRs.
+
+    ``?q=`` is required; ``type=ticket|pr`` narrows it and ``limit`` /
+    ``cursor`` page through the hits (``next_cursor`` is None on the last page).
+    """
+    if not fulltext.available():
+        return Response({'detail': 'Search needs the SQLite FTS5 index'}, status=status.HTTP_501_NOT_IMPLEMENTED)
+    kind = request.query_params.get('type') or None
+    if kind not in (None, *fulltext.KINDS):
+        return Response({'detail': f"type must be one of: {', '.join(fulltext.KINDS)}"}, status=status.HTTP_400_BAD_REQUEST)
+    query = request.query_params.get('q', '')
+    cursor = request.query_params.get('cursor')
+    try:
+        limit = parse_limit(request.query_params.get('limit'), fulltext.DEFAULT_LIMIT, fulltext.MAX_LIMIT)
+        offset = max(0, int(decode_cursor(cursor)['o'])) if cursor else 0
+        results, has_more = fulltext.search(query, kind, offset, limit)
+    except (KeyError, TypeError, ValueError):
+        return Response({'detail': 'Invalid query, cursor or limit'}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({
+        'results': results,
+        'next_cursor': encode_cursor({'o': offset + limit}) if has_more else None,
+    })
 
 
 @api_view(["GET", "PUT", "PATCH", "DELETE"])
 def ticket_partial_update(request, pk):
-    ticket = get_object_or_404(Ticket, pk=pk)
     logger.info("ticket_partial_update called for id=%s method=%s data=%s", pk, request.method, request.data)
 
     if request.method == "GET":
-        return Response(TicketSerializer(ticket).data)
+        sparse, error = _sparse(request, TicketSerializer)
+        if error:
+            return error
+        qs = sparse_queryset(Ticket.objects.all(), sparse, TicketSerializer) if sparse else Ticket.objects.all()
+        return Response(TicketSerializer(get_object_or_404(qs, pk=pk), **sparse).data)
+
+    ticket = get_object_or_404(Ticket, pk=pk)
 
     if request.method == "DELETE":
         logger.info("Deleting ticket id=%s key=%s", ticket.id, ticket.key)
@@ -137,9 +318,13 @@ def ticket_partial_update(request, pk):
 @api_view(["GET"])
 def debug_ticket_statuses(request):
     """Return ticket keys, statuses, and their dependencies with depended-on status for debugging."""
-    tickets = Ticket.objects.all().order_by('key')
+    tickets = (
+        Ticket.objects.all().order_by('key')
+        .select_related('assignee')
+        .prefetch_related(Prefetch('dependencies', queryset=Dependency.objects.select_related('depends_on')))
+    )
     out = []
-    for t in tickets:
+    for t in tickets.iterator(chunk_size=500):
         deps = []
         for d in t.dependencies.all():
             deps.append({
@@ -160,9 +345,18 @@ def debug_ticket_statuses(request):
 
 
 @api_view(["GET", "POST"])
+@conditional_on_generation
 def prs_list_create(request):
     if request.method == "GET":
+        sparse, error = _sparse(request, PullRequestSerializer)
+        if error:
+            return error
         prs = PullRequest.objects.all()
+        if sparse:
+            prs = sparse_queryset(prs, sparse, PullRequestSerializer)
+            return Response(PullRequestSerializer(prs, many=True, **sparse).data)
+        if _fast(request):
+            return _fast_response(request, projections.pr_rows(prs))
         return Response(PullRequestSerializer(prs, many=True).data)
     serializer = PullRequestSerializer(data=request.data)
     if serializer.is_valid():
@@ -181,24 +375,143 @@ def prs_list_create(request):
 
 @api_view(["POST"])
 def dependencies_create(request):
-    serializer = DependencySerializer(data=request.data)
-    if serializer.is_valid():
-        serializer.save()
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+    # Validate and save in one IMMEDIATE transaction: no other writer can add
+    # an edge in between, and the cycle check's get_graph() compares its
+    # fingerprint inside the transaction, so edges committed elsewhere count.
+    with transaction.atomic():
+        serializer = DependencySerializer(data=request.data)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-@api_view(["GET"])
-def aggregate_project(request):
-    # return simple aggregate for reports: tickets, prs, blockers
-    tickets = Ticket.objects.all()
-    prs = PullRequest.objects.all()
-    blockers = [
-        {"key": t.key, "title": t.title, "reason": ", ".join([d.depends_on.key for d in t.dependencies.all()])}
-        for t in tickets if t.dependencies.exists()
+def _graph_ticket_info(ids):
+    return {
+        row['id']: row
+        for row in Ticket.objects.filter(id__in=ids).values('id', 'key', 'title', 'status', 'due_date')
+    }
+
+
+def _graph_walk(ticket, direction, include_done):
+    """Run an upstream/downstream walk and return serialisable rows ordered by depth."""
+    graph = get_graph()
+    walk = graph.upstream if direction == 'upstream' else graph.downstream
+    if include_done:
+        reach = walk(ticket.id)
+        info = _graph_ticket_info(reach)
+    else:
+        info = {}
+
+        # DONE tickets neither block nor get blocked, so stop the walk at
+        # them; each depth is looked up as the walk reaches it
+        def done(ids):
+            info.update(_graph_ticket_info(ids))
+            return {i for i in ids if info.get(i, {}).get('status') == 'DONE'}
+
+        reach = walk(ticket.id, skip_level=done)
+    return [
+        {**info[i], 'depth': depth}
+        for i, depth in sorted(reach.items(), key=lambda kv: (kv[1], kv[0]))
+        if i in info
     ]
+
+
+@api_view(["GET"])
+def ticket_blockers(request, pk):
+    """Tickets ``pk`` is waiting on, directly (depth 1) or transitively."""
+    ticket = get_object_or_404(Ticket, pk=pk)
+    include_done = request.query_params.get('include_done') in ('1', 'true')
+    return Response({'key': ticket.key, 'blockers': _graph_walk(ticket, 'upstream', include_done)})
+
+
+@api_view(["GET"])
+def ticket_downstream(request, pk):
+    """Tickets that slip if ``pk`` slips."""
+    ticket = get_object_or_404(Ticket, pk=pk)
+    include_done = request.query_params.get('include_done') in ('1', 'true')
+    return Response({'key': ticket.key, 'impacted': _graph_walk(ticket, 'downstream', include_done)})
+
+
+@api_view(["GET"])
+def ticket_critical_path(request, pk):
+    """Longest chain of unfinished tickets that must complete before ``pk``."""
+    ticket = get_object_or_404(Ticket, pk=pk)
+    graph = get_graph()
+    info = _graph_ticket_info(set(graph.upstream(ticket.id)) | {ticket.id})
+    path = graph.critical_path(ticket.id, skip=lambda i: info.get(i, {}).get('status') == 'DONE')
     return Response({
-        'tickets': TicketSerializer(tickets, many=True).data,
-        'prs': PullRequestSerializer(prs, many=True).data,
-        'blockers': blockers,
+        'key': ticket.key,
+        'length': len(path),
+        'path': [info[i] for i in path if i in info],
     })
+
+
+@api_view(["GET"])
+def aggregate_project(request):
+    """Tickets, PRs and blockers for reports.
+
+    ``?stream=1`` streams the same JSON document chunk by chunk; ``?cursor=``
+    / ``?limit=`` return it page by page (start with ``?limit=N``).
+    """
+    params = request.query_params
+    try:
+        chunk_size = parse_limit(params.get('limit'), aggregate.DEFAULT_CHUNK_SIZE, settings.WORKBOARD_MAX_PAGE_SIZE)
+    except ValueError:
+        return Response({'detail': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+    fast = _fast(request)
+
+    if params.get('stream') in ('1', 'true'):
+        chunks = aggregate.stream_aggregate(chunk_size, fast)
+        if isinstance(request._request, ASGIRequest):
+            chunks = _async_chunks(chunks)
+        return StreamingHttpResponse(chunks, content_type='application/json')
+
+    if 'cursor' in params or 'limit' in params:
+        try:
+            page = aggregate.aggregate_page(params.get('cursor') or None, chunk_size, fast)
+        except ValueError:
+            return Response({'detail': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+        return _fast_response(request, page) if fast else Response(page)
+
+    data = aggregate.build_aggregate(fast=fast)
+    return _fast_response(request, data) if fast else Response(data)
+
+
+def _async_chunks(chunks):
+    """Async iterator over a sync byte generator, advanced one chunk per thread hop.
+
+    Under ASGI Django reads a sync iterator into a list before sending it,
+    which would hold the whole response in memory.
+    """
+    iterator = iter(chunks)
+    step = sync_to_async(lambda: next(iterator, None))
+
+    async def stream():
+        try:
+            while (chunk := await step()) is not None:
+                yield chunk
+        finally:
+            await sync_to_async(iterator.close)()
+    return stream()
+
+
+async def events_stream(request):
+    """Server-sent events of workboard changes (``Last-Event-ID`` or ``?since=`` to resume)."""
+    if request.method != 'GET':
+        return HttpResponse(status=405, headers={'Allow': 'GET'})
+    if not events.config()['ENABLED']:
+        return HttpResponse(status=404)
+    since = request.headers.get('Last-Event-ID') or request.GET.get('since')
+    try:
+        after = int(since) if since else None
+    except ValueError:
+        return HttpResponse('Invalid event id', status=400)
+    if isinstance(request, ASGIRequest):
+        stream = events.stream_async(after)
+    else:
+        stream = events.stream_sync(after)
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
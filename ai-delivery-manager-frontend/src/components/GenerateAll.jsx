@@ -10,10 +10,8 @@ export default function GenerateAll(){
     setLoading(true)
     setError(null)
     try{
-      const daily = await api.dailyStandup()
-      const weekly = await api.weeklyClient()
-      const risks = await api.riskAnalysis()
-      setReport({ daily, weekly, risks })
+      const all = await api.allReports()
+      setReport({ daily: all.daily_standup, weekly: all.weekly_client, risks: all.risk_analysis })
     }catch(e){
       setError(e.message)
     }finally{
@@ -1,4 +1,5 @@
-import { useState, useEffect } from "react"
+import { useState, useEffect, useRef } from "react"
+import { subscribeEvents } from "../services/workboard"
 import api from "../services/api"
 
 const HEALTH_CONFIG = {
@@ -62,20 +63,77 @@ function StatusBar({ data }) {
   )
 }
 
+// counter column -> dashboard field, where the names differ
+const DELTA_FIELDS = { overdue: 'overdue_tickets' }
+
+// same progress and health rules as reports.summary_builder.get_dashboard_stats
+function withDelta(data, delta) {
+  const next = { ...data }
+  for (const [field, n] of Object.entries(delta)) {
+    const key = DELTA_FIELDS[field] || field
+    if (typeof next[key] === 'number') next[key] += n
+  }
+  next.progress_percent = next.total_tickets > 0 ? Math.floor(next.done / next.total_tickets * 100) : 0
+  if (next.overdue_tickets > 3 || next.blocked > 2) next.health = 'at_risk'
+  else if (next.overdue_tickets > 1 || next.blocked > 0) next.health = 'needs_attention'
+  else next.health = 'on_track'
+  return next
+}
+
 export default function DashboardPage() {
   const [data, setData] = useState(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(null)
+  // base: last change event the shown totals include; held: counter deltas
+  // that arrive while a new base loads, replayed on top of it
+  const live = useRef({ base: null, held: null })
+
+  // a newer fetch supersedes one still in flight
+  async function fetchLive() {
+    const s = live.current
+    const held = s.held = []
+    try {
+      const d = await api.dashboardStats({ live: true })
+      if (s.held !== held) return true
+      s.base = d.as_of_event ?? null
+      setData(s.base === null ? d : held.filter(([id]) => id > s.base).reduce((acc, [, delta]) => withDelta(acc, delta), d))
+      return s.base !== null
+    } finally {
+      if (s.held === held) s.held = null
+    }
+  }
 
   async function load() {
     setLoading(true); setError(null)
-    try { setData(await api.dashboardStats()) }
+    try { await fetchLive() }
     catch (e) { setError(e.message) }
     finally { setLoading(false) }
   }
 
   useEffect(() => { load() }, [])
 
+  // apply counter deltas newer than the base; take a new base once the
+  // stream is (re)connected, after a rebuild or resync, and when the server
+  // could not pin the last one to an event id
+  useEffect(() => {
+    let timer = null
+    const rebase = () => {
+      clearTimeout(timer)
+      timer = setTimeout(() => { fetchLive().then(pinned => pinned || rebase()).catch(() => {}) }, 500)
+    }
+    // every delta also applies to the board-wide row this page shows
+    const applyDelta = (ev, id) => {
+      const s = live.current
+      if (s.held) s.held.push([id, ev.delta])
+      if (s.base !== null && id > s.base) {
+        s.base = id
+        setData(d => d && withDelta(d, ev.delta))
+      }
+    }
+    const close = subscribeEvents({ open: rebase, counters: applyDelta, counters_rebuilt: rebase, resync: rebase })
+    return () => { clearTimeout(timer); close() }
+  }, [])
+
   if (loading) return (
     <div style={{ textAlign: "center", padding: 80, color: "var(--gray-500)" }}>
       <div style={{ fontSize: 32, marginBottom: 12 }}>⏳</div>
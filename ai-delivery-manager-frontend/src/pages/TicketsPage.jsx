@@ -11,6 +11,8 @@ export default function TicketsPage(){
   const [editingId, setEditingId] = useState(null)
   const [editingData, setEditingData] = useState({})
   const [loading, setLoading] = useState(false)
+  const [query, setQuery] = useState('')
+  const [hits, setHits] = useState(null)
 
   async function load(){
     const [m] = await Promise.all([workboard.listMembers()])
@@ -23,6 +25,37 @@ export default function TicketsPage(){
 
   useEffect(()=>{ load() }, [filterAssignee])
 
+  // server-side search, debounced while typing; null = show the normal list
+  useEffect(()=>{
+    if (!query.trim()) { setHits(null); return }
+    let cancelled = false
+    const timer = setTimeout(async ()=>{
+      try{
+        const res = await workboard.search(query, { type: 'ticket' })
+        if (!cancelled) setHits(res.results)
+      }catch(e){ if (!cancelled) setHits([]) }
+    }, 250)
+    return () => { cancelled = true; clearTimeout(timer) }
+  }, [query])
+
+  // apply status changes in place; anything else reloads the list once
+  useEffect(()=>{
+    let timer = null
+    const reload = () => { clearTimeout(timer); timer = setTimeout(load, 500) }
+    const close = workboard.subscribeEvents({
+      ticket: ev => {
+        if (ev.action === 'updated' && ev.changed.length === 1 && ev.changed[0] === 'status') {
+          setTickets(ts => ts.map(t => t.id === ev.id ? { ...t, status: ev.status } : t))
+        } else {
+          reload()
+        }
+      },
+      pr_link: reload,
+      resync: reload,
+    })
+    return () => { clearTimeout(timer); close() }
+  }, [filterAssignee])
+
   async function create(){
     setLoading(true)
     try{
@@ -100,8 +133,29 @@ export default function TicketsPage(){
           <option value="">All members</option>
           {members.map(m=> <option key={m.id} value={m.id}>{m.name}</option>)}
         </select>
+        <strong>Search</strong>
+        <input placeholder="Key, title or description" value={query} onChange={e=>setQuery(e.target.value)} />
       </div>
       
+      {hits !== null ? (
+        <div>
+          {hits.length === 0 ? (
+            <div className="card" style={{ textAlign: 'center', padding: 32 }}>
+              <p style={{ color: 'var(--gray-500)', margin: 0 }}>No matching tickets</p>
+            </div>
+          ) : hits.map(h => (
+            <div key={h.id} className="compact-row" style={{display:'flex', alignItems:'center', gap:12, marginBottom:8}}>
+              <div className="ticket-key" style={{minWidth:72}}>{h.key}</div>
+              <div style={{flex:1}}>
+                {/* the server escapes these and only adds <mark> tags */}
+                <div style={{fontWeight:600}} dangerouslySetInnerHTML={{ __html: h.title_html }} />
+                <div className="small-meta" dangerouslySetInnerHTML={{ __html: h.snippet_html }} />
+              </div>
+              <div className="small-meta">{h.status}</div>
+            </div>
+          ))}
+        </div>
+      ) : (
       <div>
         {tickets.length === 0 ? (
           <div className="card" style={{ textAlign: 'center', padding: 32 }}>
@@ -167,6 +221,7 @@ export default function TicketsPage(){
           ))
         )}
       </div>
+      )}
     </div>
   )
 }
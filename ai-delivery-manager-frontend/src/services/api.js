@@ -15,8 +15,9 @@ async function post(path, body = {}) {
   try { return JSON.parse(text) } catch (e) { return text }
 }
 
-async function get(path) {
-  const res = await fetch(`${API_BASE}/${path}/`, {
+async function get(path, params = {}) {
+  const qs = new URLSearchParams(Object.entries(params).filter(([, v]) => v !== undefined && v !== null && v !== ''))
+  const res = await fetch(`${API_BASE}/${path}/${qs.toString() ? '?' + qs.toString() : ''}`, {
     method: 'GET',
     headers: { 'Content-Type': 'application/json' },
   });
@@ -41,8 +42,27 @@ export function riskAnalysis() {
   return post('risk-analysis');
 }
 
-export function dashboardStats() {
-  return get('dashboard');
+// live: skip precomputed copies and report as_of_event, the last change
+// event the totals include
+export function dashboardStats({ live = false } = {}) {
+  return get('dashboard', live ? { live: 1 } : {});
+}
+
+// history reads take { team, start, end } (ISO dates; the last 30 days by default)
+export function burndown(params = {}) {
+  return get('burndown', params);
+}
+
+export function cumulativeFlow(params = {}) {
+  return get('cumulative-flow', params);
+}
+
+export function velocity(params = {}) {
+  return get('velocity', params);
+}
+
+export function allReports(tone = null, text = '') {
+  return post('all', tone ? { tone, text } : {});
 }
 
-export default { dailyStandup, weeklyClient, rewriteSummary, riskAnalysis, dashboardStats };
+export default { dailyStandup, weeklyClient, rewriteSummary, riskAnalysis, dashboardStats, burndown, cumulativeFlow, velocity, allReports };
@@ -24,17 +24,45 @@ export function listTickets(params = {}){
   const qs = new URLSearchParams()
   if (params.assignee) qs.set('assignee_id', params.assignee)
   if (params.status) qs.set('status', params.status)
+  // sparse payloads, e.g. { fields: 'key,title,status,assignee.name' }
+  if (params.fields) qs.set('fields', params.fields)
+  if (params.expand !== undefined) qs.set('expand', params.expand)
   const path = `tickets${qs.toString() ? '?'+qs.toString() : ''}`
   return get(path)
 }
 export function createTicket(body){ return post('tickets', body) }
 export function patchTicket(id, body){ return fetch(`${API_BASE}/tickets/${id}/`, { method: 'PATCH', headers: {'Content-Type':'application/json'}, body: JSON.stringify(body) }).then(async r=>{ if(!r.ok) throw new Error(await r.text()); return r.json() }) }
+// [{ op: 'create' | 'update' | 'delete', ... }] in one transaction; resolves
+// to { applied, errors, results } (one result per operation)
+export function bulkTickets(operations, { atomic = true } = {}){ return post('tickets/bulk', { operations, atomic }) }
 export function deleteTicket(id){ return fetch(`${API_BASE}/tickets/${id}/`, { method: 'DELETE' }).then(r=>{ if(!r.ok) throw new Error('Delete failed'); return true }) }
 
+// ranked full-text search; title_html / snippet_html are escaped with <mark> around matches
+export function search(q, params = {}){
+  const qs = new URLSearchParams({ q })
+  if (params.type) qs.set('type', params.type)
+  if (params.limit) qs.set('limit', params.limit)
+  if (params.cursor) qs.set('cursor', params.cursor)
+  return get(`search?${qs.toString()}`)
+}
+
 export function listMembers(){ return get('members') }
 export function createMember(body){ return post('members', body) }
 
 export function listPRs(){ return get('prs') }
 export function createPR(body){ return post('prs', body) }
 
-export default { listTickets, createTicket, patchTicket, listMembers, createMember, listPRs, createPR }
+// Server-sent change events ({ ticket: fn, counters: fn, open: fn, ... }); returns a
+// function that closes the stream. EventSource reconnects on its own and
+// resumes from the last event it saw.
+export function subscribeEvents(handlers){
+  const source = new EventSource(`${API_BASE}/events/`)
+  for (const [kind, fn] of Object.entries(handlers)) {
+    // handlers get the payload and the event id; 'open' fires on every (re)connect
+    if (kind === 'open') source.addEventListener('open', () => fn())
+    else source.addEventListener(kind, e => fn(JSON.parse(e.data), Number(e.lastEventId)))
+  }
+  return () => source.close()
+}
+
+export default { listTickets, createTicket, patchTicket, bulkTickets, search, listMembers, createMember, listPRs, createPR, subscribeEvents }